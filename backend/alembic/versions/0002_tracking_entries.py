@@ -0,0 +1,140 @@
+"""move tracking_history into an append-only tracking_entries table
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHUNK_SIZE = 1000
+
+cocoa_batches = sa.table(
+    "cocoa_batches",
+    sa.column("id", sa.Uuid()),
+    sa.column("tracking_history", sa.JSON()),
+)
+
+tracking_entries = sa.table(
+    "tracking_entries",
+    sa.column("batch_id", sa.Uuid()),
+    sa.column("sequence", sa.Integer()),
+    sa.column("timestamp", sa.DateTime()),
+    sa.column("action", sa.String()),
+    sa.column("latitude", sa.Float()),
+    sa.column("longitude", sa.Float()),
+    sa.column("region", sa.String()),
+    sa.column("country", sa.String()),
+    sa.column("transport_mode", sa.String()),
+    sa.column("distance", sa.Float()),
+)
+
+
+def _batch_chunks(bind, columns):
+    last_id = None
+    while True:
+        query = sa.select(*columns).order_by(cocoa_batches.c.id).limit(CHUNK_SIZE)
+        if last_id is not None:
+            query = query.where(cocoa_batches.c.id > last_id)
+        rows = bind.execute(query).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+
+    if not sa.inspect(bind).has_table("tracking_entries"):
+        op.create_table(
+            "tracking_entries",
+            sa.Column("batch_id", sa.Uuid(), nullable=False),
+            sa.Column("sequence", sa.Integer(), autoincrement=False, nullable=False),
+            sa.Column("timestamp", sa.DateTime(), nullable=False),
+            sa.Column("action", sa.String(), nullable=False),
+            sa.Column("latitude", sa.Float(), nullable=False),
+            sa.Column("longitude", sa.Float(), nullable=False),
+            sa.Column("region", sa.String(), nullable=False),
+            sa.Column("country", sa.String(), nullable=False),
+            sa.Column("transport_mode", sa.String(), nullable=True),
+            sa.Column("distance", sa.Float(), nullable=True),
+            sa.ForeignKeyConstraint(["batch_id"], ["cocoa_batches.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("batch_id", "sequence"),
+        )
+
+    for rows in _batch_chunks(bind, [cocoa_batches.c.id, cocoa_batches.c.tracking_history]):
+        entries = [
+            {
+                "batch_id": batch_id,
+                "sequence": sequence,
+                "timestamp": datetime.fromisoformat(entry["timestamp"]),
+                "action": entry["action"],
+                "latitude": entry["location"]["latitude"],
+                "longitude": entry["location"]["longitude"],
+                "region": entry["location"]["region"],
+                "country": entry["location"]["country"],
+                "transport_mode": entry["transport_mode"],
+                "distance": entry["distance"],
+            }
+            for batch_id, history in rows
+            for sequence, entry in enumerate(history or [], start=1)
+        ]
+        if entries:
+            bind.execute(sa.insert(tracking_entries), entries)
+
+    with op.batch_alter_table("cocoa_batches") as batch_op:
+        batch_op.drop_column("tracking_history")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+
+    with op.batch_alter_table("cocoa_batches") as batch_op:
+        batch_op.add_column(sa.Column("tracking_history", sa.JSON(), nullable=True))
+
+    for rows in _batch_chunks(bind, [cocoa_batches.c.id]):
+        batch_ids = [batch_id for (batch_id,) in rows]
+        histories = {batch_id: [] for batch_id in batch_ids}
+        entries = bind.execute(
+            sa.select(tracking_entries)
+            .where(tracking_entries.c.batch_id.in_(batch_ids))
+            .order_by(tracking_entries.c.batch_id, tracking_entries.c.sequence)
+        )
+        for entry in entries.mappings():
+            histories[entry["batch_id"]].append({
+                "timestamp": entry["timestamp"].isoformat(),
+                "action": entry["action"],
+                "location": {
+                    "latitude": entry["latitude"],
+                    "longitude": entry["longitude"],
+                    "region": entry["region"],
+                    "country": entry["country"],
+                },
+                "transport_mode": entry["transport_mode"],
+                "distance": entry["distance"],
+            })
+        for batch_id, history in histories.items():
+            bind.execute(
+                sa.update(cocoa_batches)
+                .where(cocoa_batches.c.id == batch_id)
+                .values(tracking_history=history)
+            )
+
+    with op.batch_alter_table("cocoa_batches") as batch_op:
+        batch_op.alter_column("tracking_history", existing_type=sa.JSON(), nullable=False)
+
+    op.drop_table("tracking_entries")
@@ -0,0 +1,84 @@
+"""add country column and keyset pagination indexes on cocoa_batches
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHUNK_SIZE = 1000
+
+cocoa_batches = sa.table(
+    "cocoa_batches",
+    sa.column("id", sa.Uuid()),
+    sa.column("current_location", sa.JSON()),
+    sa.column("country", sa.String()),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+
+    with op.batch_alter_table("cocoa_batches") as batch_op:
+        batch_op.add_column(sa.Column("country", sa.String(), nullable=True))
+
+    last_id = None
+    while True:
+        query = (
+            sa.select(cocoa_batches.c.id, cocoa_batches.c.current_location)
+            .order_by(cocoa_batches.c.id)
+            .limit(CHUNK_SIZE)
+        )
+        if last_id is not None:
+            query = query.where(cocoa_batches.c.id > last_id)
+        rows = bind.execute(query).all()
+        if not rows:
+            break
+        for batch_id, location in rows:
+            bind.execute(
+                sa.update(cocoa_batches)
+                .where(cocoa_batches.c.id == batch_id)
+                .values(country=location["country"])
+            )
+        last_id = rows[-1][0]
+
+    with op.batch_alter_table("cocoa_batches") as batch_op:
+        batch_op.alter_column("country", existing_type=sa.String(), nullable=False)
+        batch_op.create_index(
+            "ix_cocoa_batches_producer_status_harvest",
+            ["producer_id", "status", "harvest_date", "id"],
+        )
+        batch_op.create_index(
+            "ix_cocoa_batches_producer_harvest",
+            ["producer_id", "harvest_date", "id"],
+        )
+        batch_op.create_index(
+            "ix_cocoa_batches_country_harvest",
+            ["country", "harvest_date", "id"],
+        )
+        batch_op.create_index(
+            "ix_cocoa_batches_harvest",
+            ["harvest_date", "id"],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("cocoa_batches") as batch_op:
+        batch_op.drop_index("ix_cocoa_batches_harvest")
+        batch_op.drop_index("ix_cocoa_batches_country_harvest")
+        batch_op.drop_index("ix_cocoa_batches_producer_harvest")
+        batch_op.drop_index("ix_cocoa_batches_producer_status_harvest")
+        batch_op.drop_column("country")
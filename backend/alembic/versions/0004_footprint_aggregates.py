@@ -0,0 +1,111 @@
+"""add incrementally maintained batch and producer footprint aggregates
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EMISSION_FACTORS = {"TRUCK": 0.105, "TRAIN": 0.028, "SHIP": 0.016, "AIR": 0.602}
+DISTANCE_COLUMNS = {mode: f"distance_{mode.lower()}_km" for mode in ("TRUCK", "SHIP", "TRAIN", "AIR")}
+AGGREGATE_COLUMNS = ["hops", *DISTANCE_COLUMNS.values(), "tonne_km", "emissions_kg_co2e"]
+
+cocoa_batches = sa.table(
+    "cocoa_batches",
+    sa.column("id", sa.Uuid()),
+    sa.column("producer_id", sa.Uuid()),
+    sa.column("quantity", sa.Float()),
+)
+
+tracking_entries = sa.table(
+    "tracking_entries",
+    sa.column("batch_id", sa.Uuid()),
+    sa.column("transport_mode", sa.String()),
+    sa.column("distance", sa.Float()),
+)
+
+
+def aggregate_columns() -> list:
+    return [
+        sa.Column("hops", sa.Integer(), nullable=False),
+        *[sa.Column(column, sa.Float(), nullable=False) for column in DISTANCE_COLUMNS.values()],
+        sa.Column("tonne_km", sa.Float(), nullable=False),
+        sa.Column("emissions_kg_co2e", sa.Float(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    batch_footprints = op.create_table(
+        "batch_footprints",
+        sa.Column("batch_id", sa.Uuid(), nullable=False),
+        sa.Column("producer_id", sa.Uuid(), nullable=False),
+        *aggregate_columns(),
+        sa.ForeignKeyConstraint(["batch_id"], ["cocoa_batches.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("batch_id"),
+    )
+    op.create_index("ix_batch_footprints_producer_id", "batch_footprints", ["producer_id"])
+    producer_footprints = op.create_table(
+        "producer_footprints",
+        sa.Column("producer_id", sa.Uuid(), nullable=False),
+        *aggregate_columns(),
+        sa.PrimaryKeyConstraint("producer_id"),
+    )
+
+    tonne_km = tracking_entries.c.distance * cocoa_batches.c.quantity / 1000
+    legs = (
+        sa.select(
+            tracking_entries.c.batch_id,
+            cocoa_batches.c.producer_id,
+            sa.func.count().label("hops"),
+            *[
+                sa.func.sum(
+                    sa.case((tracking_entries.c.transport_mode == mode, tracking_entries.c.distance), else_=0.0)
+                ).label(column)
+                for mode, column in DISTANCE_COLUMNS.items()
+            ],
+            sa.func.sum(tonne_km).label("tonne_km"),
+            sa.func.sum(
+                tonne_km * sa.case(
+                    *[
+                        (tracking_entries.c.transport_mode == mode, sa.literal(factor))
+                        for mode, factor in EMISSION_FACTORS.items()
+                    ],
+                    else_=0.0,
+                )
+            ).label("emissions_kg_co2e"),
+        )
+        .join(cocoa_batches, cocoa_batches.c.id == tracking_entries.c.batch_id)
+        .where(tracking_entries.c.transport_mode.is_not(None), tracking_entries.c.distance.is_not(None))
+        .group_by(tracking_entries.c.batch_id, cocoa_batches.c.producer_id)
+    )
+    op.execute(
+        sa.insert(batch_footprints).from_select(["batch_id", "producer_id", *AGGREGATE_COLUMNS], legs)
+    )
+    op.execute(
+        sa.insert(producer_footprints).from_select(
+            ["producer_id", *AGGREGATE_COLUMNS],
+            sa.select(
+                batch_footprints.c.producer_id,
+                *[sa.func.sum(batch_footprints.c[column]).label(column) for column in AGGREGATE_COLUMNS],
+            ).group_by(batch_footprints.c.producer_id),
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("producer_footprints")
+    op.drop_index("ix_batch_footprints_producer_id", table_name="batch_footprints")
+    op.drop_table("batch_footprints")
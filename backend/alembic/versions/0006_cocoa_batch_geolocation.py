@@ -0,0 +1,82 @@
+"""add latitude, longitude and geohash columns on cocoa_batches
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.shared_kernel.geo import encode_geohash
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHUNK_SIZE = 1000
+
+cocoa_batches = sa.table(
+    "cocoa_batches",
+    sa.column("id", sa.Uuid()),
+    sa.column("current_location", sa.JSON()),
+    sa.column("latitude", sa.Float()),
+    sa.column("longitude", sa.Float()),
+    sa.column("geohash", sa.String()),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+
+    with op.batch_alter_table("cocoa_batches") as batch_op:
+        batch_op.add_column(sa.Column("latitude", sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column("longitude", sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column("geohash", sa.String(), nullable=True))
+
+    last_id = None
+    while True:
+        query = (
+            sa.select(cocoa_batches.c.id, cocoa_batches.c.current_location)
+            .order_by(cocoa_batches.c.id)
+            .limit(CHUNK_SIZE)
+        )
+        if last_id is not None:
+            query = query.where(cocoa_batches.c.id > last_id)
+        rows = bind.execute(query).all()
+        if not rows:
+            break
+        for batch_id, location in rows:
+            latitude = location["latitude"]
+            longitude = location["longitude"]
+            bind.execute(
+                sa.update(cocoa_batches)
+                .where(cocoa_batches.c.id == batch_id)
+                .values(
+                    latitude=latitude,
+                    longitude=longitude,
+                    geohash=encode_geohash(latitude, longitude),
+                )
+            )
+        last_id = rows[-1][0]
+
+    with op.batch_alter_table("cocoa_batches") as batch_op:
+        batch_op.alter_column("latitude", existing_type=sa.Float(), nullable=False)
+        batch_op.alter_column("longitude", existing_type=sa.Float(), nullable=False)
+        batch_op.alter_column("geohash", existing_type=sa.String(), nullable=False)
+        batch_op.create_index("ix_cocoa_batches_geohash", ["geohash"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("cocoa_batches") as batch_op:
+        batch_op.drop_index("ix_cocoa_batches_geohash")
+        batch_op.drop_column("geohash")
+        batch_op.drop_column("longitude")
+        batch_op.drop_column("latitude")
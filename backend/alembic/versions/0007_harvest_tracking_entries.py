@@ -0,0 +1,99 @@
+"""record the harvest location as the first tracking entry of unshipped batches
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHUNK_SIZE = 1000
+
+cocoa_batches = sa.table(
+    "cocoa_batches",
+    sa.column("id", sa.Uuid()),
+    sa.column("harvest_date", sa.DateTime()),
+    sa.column("status", sa.String()),
+    sa.column("current_location", sa.JSON()),
+)
+
+tracking_entries = sa.table(
+    "tracking_entries",
+    sa.column("batch_id", sa.Uuid()),
+    sa.column("sequence", sa.Integer()),
+    sa.column("timestamp", sa.DateTime()),
+    sa.column("action", sa.String()),
+    sa.column("latitude", sa.Float()),
+    sa.column("longitude", sa.Float()),
+    sa.column("region", sa.String()),
+    sa.column("country", sa.String()),
+    sa.column("transport_mode", sa.String()),
+    sa.column("distance", sa.Float()),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Le lieu de récolte des lots déjà expédiés a été écrasé : seuls les lots encore
+    # récoltés (sans historique) peuvent être complétés
+    bind = op.get_bind()
+
+    last_id = None
+    while True:
+        query = (
+            sa.select(cocoa_batches.c.id, cocoa_batches.c.harvest_date, cocoa_batches.c.current_location)
+            .where(
+                cocoa_batches.c.status == "HARVESTED",
+                ~sa.exists().where(tracking_entries.c.batch_id == cocoa_batches.c.id),
+            )
+            .order_by(cocoa_batches.c.id)
+            .limit(CHUNK_SIZE)
+        )
+        if last_id is not None:
+            query = query.where(cocoa_batches.c.id > last_id)
+        rows = bind.execute(query).all()
+        if not rows:
+            break
+        bind.execute(
+            sa.insert(tracking_entries),
+            [
+                {
+                    "batch_id": batch_id,
+                    "sequence": 1,
+                    "timestamp": harvest_date,
+                    "action": "HARVESTED",
+                    "latitude": location["latitude"],
+                    "longitude": location["longitude"],
+                    "region": location["region"],
+                    "country": location["country"],
+                    "transport_mode": None,
+                    "distance": None,
+                }
+                for batch_id, harvest_date, location in rows
+            ],
+        )
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Les entrées HARVESTED des lots expédiés depuis portent la séquence 1 : on ne supprime
+    # que celles des lots qui n'ont pas d'autre entrée, les autres restent cohérentes
+    bind = op.get_bind()
+    other_entries = sa.select(tracking_entries.c.batch_id).where(tracking_entries.c.action != "HARVESTED")
+    bind.execute(
+        sa.delete(tracking_entries).where(
+            tracking_entries.c.action == "HARVESTED",
+            tracking_entries.c.batch_id.not_in(other_entries),
+        )
+    )
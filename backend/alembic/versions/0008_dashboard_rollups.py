@@ -0,0 +1,187 @@
+"""add origin_country on cocoa_batches and incrementally maintained dashboard rollups
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from collections import defaultdict
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, Sequence[str], None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+cocoa_batches = sa.table(
+    "cocoa_batches",
+    sa.column("id", sa.Uuid()),
+    sa.column("producer_id", sa.Uuid()),
+    sa.column("quantity", sa.Float()),
+    sa.column("harvest_date", sa.DateTime()),
+    sa.column("status", sa.String()),
+    sa.column("country", sa.String()),
+    sa.column("origin_country", sa.String()),
+)
+
+tracking_entries = sa.table(
+    "tracking_entries",
+    sa.column("batch_id", sa.Uuid()),
+    sa.column("sequence", sa.Integer()),
+    sa.column("timestamp", sa.DateTime()),
+    sa.column("action", sa.String()),
+    sa.column("country", sa.String()),
+)
+
+
+def scope_columns() -> list:
+    return [
+        sa.Column("scope", sa.String(), nullable=False),
+        sa.Column("scope_key", sa.String(), nullable=False),
+    ]
+
+
+def scoped_keys(producer_id, country) -> list:
+    return [("producer", str(producer_id)), ("country", country)]
+
+
+def last_entry(action: str):
+    return (
+        sa.select(tracking_entries.c.batch_id, sa.func.max(tracking_entries.c.timestamp).label("at"))
+        .where(tracking_entries.c.action == action)
+        .group_by(tracking_entries.c.batch_id)
+        .subquery()
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+
+    with op.batch_alter_table("cocoa_batches") as batch_op:
+        batch_op.add_column(sa.Column("origin_country", sa.String(), nullable=True))
+
+    # Pays de récolte : entrée HARVESTED quand elle existe (0007), sinon pays courant
+    # pour les lots expédiés avant que le lieu de récolte ne soit historisé
+    harvest_country = (
+        sa.select(tracking_entries.c.country)
+        .where(tracking_entries.c.batch_id == cocoa_batches.c.id, tracking_entries.c.action == "HARVESTED")
+        .order_by(tracking_entries.c.sequence)
+        .limit(1)
+        .scalar_subquery()
+    )
+    bind.execute(
+        sa.update(cocoa_batches).values(origin_country=sa.func.coalesce(harvest_country, cocoa_batches.c.country))
+    )
+
+    with op.batch_alter_table("cocoa_batches") as batch_op:
+        batch_op.alter_column("origin_country", existing_type=sa.String(), nullable=False)
+
+    status_rollups = op.create_table(
+        "status_rollups",
+        *scope_columns(),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("batch_count", sa.Integer(), nullable=False),
+        sa.Column("quantity_kg", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "scope_key", "status"),
+    )
+    harvest_rollups = op.create_table(
+        "harvest_rollups",
+        *scope_columns(),
+        sa.Column("month", sa.String(length=7), nullable=False),
+        sa.Column("batch_count", sa.Integer(), nullable=False),
+        sa.Column("quantity_kg", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "scope_key", "month"),
+    )
+    transit_rollups = op.create_table(
+        "transit_rollups",
+        *scope_columns(),
+        sa.Column("timed_deliveries", sa.Integer(), nullable=False),
+        sa.Column("transit_seconds", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "scope_key"),
+    )
+
+    # Les clés producteur sont des UUID en texte : agrégation SQL, regroupement par portée en Python
+    statuses = defaultdict(lambda: [0, 0.0])
+    for producer_id, country, status, batch_count, quantity_kg in bind.execute(
+        sa.select(
+            cocoa_batches.c.producer_id,
+            cocoa_batches.c.origin_country,
+            cocoa_batches.c.status,
+            sa.func.count(),
+            sa.func.sum(cocoa_batches.c.quantity),
+        ).group_by(cocoa_batches.c.producer_id, cocoa_batches.c.origin_country, cocoa_batches.c.status)
+    ):
+        for scope, key in scoped_keys(producer_id, country):
+            statuses[(scope, key, status)][0] += batch_count
+            statuses[(scope, key, status)][1] += quantity_kg
+
+    year = sa.extract("year", cocoa_batches.c.harvest_date)
+    month = sa.extract("month", cocoa_batches.c.harvest_date)
+    harvests = defaultdict(lambda: [0, 0.0])
+    for producer_id, country, harvest_year, harvest_month, batch_count, quantity_kg in bind.execute(
+        sa.select(
+            cocoa_batches.c.producer_id,
+            cocoa_batches.c.origin_country,
+            year,
+            month,
+            sa.func.count(),
+            sa.func.sum(cocoa_batches.c.quantity),
+        ).group_by(cocoa_batches.c.producer_id, cocoa_batches.c.origin_country, year, month)
+    ):
+        for scope, key in scoped_keys(producer_id, country):
+            totals = harvests[(scope, key, f"{int(harvest_year):04d}-{int(harvest_month):02d}")]
+            totals[0] += batch_count
+            totals[1] += quantity_kg
+
+    shipped = last_entry("SHIPPED")
+    delivered = last_entry("DELIVERED")
+    transits = defaultdict(lambda: [0, 0.0])
+    for producer_id, country, shipped_at, delivered_at in bind.execute(
+        sa.select(cocoa_batches.c.producer_id, cocoa_batches.c.origin_country, shipped.c.at, delivered.c.at)
+        .join(shipped, shipped.c.batch_id == cocoa_batches.c.id)
+        .join(delivered, delivered.c.batch_id == cocoa_batches.c.id)
+        .where(cocoa_batches.c.status == "DELIVERED")
+    ):
+        for scope, key in scoped_keys(producer_id, country):
+            transits[(scope, key)][0] += 1
+            transits[(scope, key)][1] += (delivered_at - shipped_at).total_seconds()
+
+    if statuses:
+        bind.execute(
+            sa.insert(status_rollups),
+            [
+                {"scope": scope, "scope_key": key, "status": status, "batch_count": count, "quantity_kg": quantity}
+                for (scope, key, status), (count, quantity) in statuses.items()
+            ],
+        )
+    if harvests:
+        bind.execute(
+            sa.insert(harvest_rollups),
+            [
+                {"scope": scope, "scope_key": key, "month": month, "batch_count": count, "quantity_kg": quantity}
+                for (scope, key, month), (count, quantity) in harvests.items()
+            ],
+        )
+    if transits:
+        bind.execute(
+            sa.insert(transit_rollups),
+            [
+                {"scope": scope, "scope_key": key, "timed_deliveries": count, "transit_seconds": seconds}
+                for (scope, key), (count, seconds) in transits.items()
+            ],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("transit_rollups")
+    op.drop_table("harvest_rollups")
+    op.drop_table("status_rollups")
+    with op.batch_alter_table("cocoa_batches") as batch_op:
+        batch_op.drop_column("origin_country")
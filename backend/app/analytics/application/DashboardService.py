@@ -0,0 +1,18 @@
+from uuid import UUID
+
+from app.analytics.domain import DashboardRollup, RollupScope
+from app.analytics.domain.DashboardRepositoryInterface import DashboardRepositoryInterface
+
+
+class DashboardService:
+    def __init__(self, repository: DashboardRepositoryInterface):
+        self._repository = repository
+    
+    async def for_producer(self, producer_id: UUID, months: int = 12) -> DashboardRollup:
+        return await self._repository.find(RollupScope.PRODUCER, str(producer_id), months) or DashboardRollup()
+    
+    async def for_country(self, country: str, months: int = 12) -> DashboardRollup:
+        return await self._repository.find(RollupScope.COUNTRY, country, months) or DashboardRollup()
+    
+    async def rebuild(self) -> int:
+        return await self._repository.rebuild()
\ No newline at end of file
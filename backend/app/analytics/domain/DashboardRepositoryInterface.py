@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.analytics.domain.DashboardRollup import DashboardRollup
+from app.analytics.domain.RollupScope import RollupScope
+
+
+class DashboardRepositoryInterface(ABC):
+    @abstractmethod
+    async def find(self, scope: RollupScope, key: str, months: int) -> Optional[DashboardRollup]:
+        pass
+    
+    @abstractmethod
+    async def rebuild(self) -> int:
+        pass
\ No newline at end of file
@@ -0,0 +1,56 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Optional
+
+from app.traceability.domain import BatchStatus
+
+
+def harvest_month(harvest_date: datetime) -> str:
+    return f"{harvest_date.year:04d}-{harvest_date.month:02d}"
+
+
+@dataclass
+class RollupTotals:
+    batch_count: int = 0
+    quantity_kg: float = 0.0
+    
+    def add(self, batch_count: int, quantity_kg: float) -> None:
+        self.batch_count += batch_count
+        self.quantity_kg += quantity_kg
+
+
+@dataclass
+class DashboardRollup:
+    by_status: Dict[BatchStatus, RollupTotals] = field(
+        default_factory=lambda: {status: RollupTotals() for status in BatchStatus}
+    )
+    harvest_by_month: Dict[str, RollupTotals] = field(default_factory=dict)
+    timed_deliveries: int = 0
+    transit_seconds: float = 0.0
+    
+    @property
+    def batch_count(self) -> int:
+        return sum(totals.batch_count for totals in self.by_status.values())
+    
+    @property
+    def quantity_kg(self) -> float:
+        return sum(totals.quantity_kg for totals in self.by_status.values())
+    
+    @property
+    def average_transit_hours(self) -> Optional[float]:
+        if not self.timed_deliveries:
+            return None
+        return self.transit_seconds / self.timed_deliveries / 3600
+    
+    def add_harvest(self, month: str, quantity_kg: float) -> None:
+        self.harvest_by_month.setdefault(month, RollupTotals()).add(1, quantity_kg)
+    
+    def move(self, from_status: Optional[BatchStatus], to_status: BatchStatus, quantity_kg: float) -> None:
+        # from_status None : lot nouvellement enregistré
+        if from_status is not None:
+            self.by_status[from_status].add(-1, -quantity_kg)
+        self.by_status[to_status].add(1, quantity_kg)
+    
+    def add_delivery(self, transit_seconds: float) -> None:
+        self.timed_deliveries += 1
+        self.transit_seconds += transit_seconds
\ No newline at end of file
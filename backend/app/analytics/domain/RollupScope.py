@@ -0,0 +1,5 @@
+from enum import Enum
+
+class RollupScope(Enum):
+    PRODUCER = "producer"
+    COUNTRY = "country"
\ No newline at end of file
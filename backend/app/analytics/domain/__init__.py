@@ -0,0 +1,9 @@
+from .RollupScope import RollupScope
+from .DashboardRollup import DashboardRollup, RollupTotals, harvest_month
+
+__all__ = [
+    "RollupScope",
+    "DashboardRollup",
+    "RollupTotals",
+    "harvest_month",
+]
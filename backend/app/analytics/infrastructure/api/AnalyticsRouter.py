@@ -0,0 +1,54 @@
+from fastapi import APIRouter, Depends, Query
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.analytics.application.DashboardService import DashboardService
+from app.analytics.domain import DashboardRollup
+from app.analytics.infrastructure.database.PostgresDashboardRepository import PostgresDashboardRepository
+from app.shared_kernel import get_async_db
+
+router = APIRouter(
+    prefix="/analytics",
+    tags=["analytics"],
+)
+
+
+def get_dashboard_service(db: AsyncSession = Depends(get_async_db)) -> DashboardService:
+    return DashboardService(PostgresDashboardRepository(db))
+
+
+def serialize_dashboard(rollup: DashboardRollup) -> dict:
+    return {
+        "batch_count": rollup.batch_count,
+        "quantity_kg": rollup.quantity_kg,
+        "by_status": {
+            status.value: {"batch_count": totals.batch_count, "quantity_kg": totals.quantity_kg}
+            for status, totals in rollup.by_status.items()
+        },
+        "harvest_by_month": [
+            {"month": month, "batch_count": totals.batch_count, "quantity_kg": totals.quantity_kg}
+            for month, totals in rollup.harvest_by_month.items()
+        ],
+        "timed_deliveries": rollup.timed_deliveries,
+        "average_transit_hours": rollup.average_transit_hours
+    }
+
+
+@router.get("/producers/{producer_id}")
+async def get_producer_dashboard(
+    producer_id: UUID,
+    months: int = Query(12, ge=1, le=120),
+    service: DashboardService = Depends(get_dashboard_service)
+):
+    rollup = await service.for_producer(producer_id, months)
+    return {"producer_id": str(producer_id), **serialize_dashboard(rollup)}
+
+
+@router.get("/countries/{country}")
+async def get_country_dashboard(
+    country: str,
+    months: int = Query(12, ge=1, le=120),
+    service: DashboardService = Depends(get_dashboard_service)
+):
+    rollup = await service.for_country(country, months)
+    return {"country": country, **serialize_dashboard(rollup)}
\ No newline at end of file
@@ -0,0 +1,154 @@
+from sqlalchemy import Column, Float, Integer, String
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from app.shared_kernel.database import Base, upsert
+
+from app.analytics.domain import DashboardRollup, RollupScope, harvest_month
+from app.traceability.domain import (
+    BatchStatus,
+    BatchTransition,
+    BatchWriteListener,
+    BatchesWritten,
+    CocoaBatch,
+    TransitionApplied,
+)
+
+
+class StatusRollupModel(Base):
+    __tablename__ = "status_rollups"
+    
+    scope = Column(String, primary_key=True)
+    scope_key = Column(String, primary_key=True)
+    status = Column(String, primary_key=True)
+    batch_count = Column(Integer, nullable=False, default=0)
+    quantity_kg = Column(Float, nullable=False, default=0.0)
+
+
+class HarvestRollupModel(Base):
+    __tablename__ = "harvest_rollups"
+    
+    scope = Column(String, primary_key=True)
+    scope_key = Column(String, primary_key=True)
+    month = Column(String(7), primary_key=True)
+    batch_count = Column(Integer, nullable=False, default=0)
+    quantity_kg = Column(Float, nullable=False, default=0.0)
+
+
+class TransitRollupModel(Base):
+    __tablename__ = "transit_rollups"
+    
+    scope = Column(String, primary_key=True)
+    scope_key = Column(String, primary_key=True)
+    timed_deliveries = Column(Integer, nullable=False, default=0)
+    transit_seconds = Column(Float, nullable=False, default=0.0)
+
+
+RollupKey = Tuple[RollupScope, str]
+
+
+class DashboardRollupWriter(BatchWriteListener):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+    
+    async def batches_written(self, event: BatchesWritten) -> None:
+        await self.record_batches(event.batches, event.origins, event.shipped_at)
+    
+    async def transition_applied(self, event: TransitionApplied) -> None:
+        await self.record_transition(event.rows, event.transition, event.timestamp, event.shipped_at)
+    
+    async def record_batches(
+        self,
+        batches: List[CocoaBatch],
+        origins: Dict[UUID, str],
+        shipped_at: Dict[UUID, datetime]
+    ) -> None:
+        rollups: Dict[RollupKey, DashboardRollup] = {}
+        
+        for batch in batches:
+            if batch.persisted_status is batch.status:
+                continue
+            quantity = batch.quantity.value
+            transit_seconds = self._transit_seconds(shipped_at.get(batch.id), self._delivered_at(batch))
+            for rollup in self._scoped(rollups, batch.producer_id, origins[batch.id]):
+                if batch.persisted_status is None:
+                    rollup.add_harvest(harvest_month(batch.harvest_date), quantity)
+                rollup.move(batch.persisted_status, batch.status, quantity)
+                if transit_seconds is not None:
+                    rollup.add_delivery(transit_seconds)
+        
+        await self.increment(rollups)
+    
+    async def record_transition(
+        self,
+        rows: Iterable[Tuple[UUID, UUID, str, float]],
+        transition: BatchTransition,
+        timestamp: datetime,
+        shipped_at: Dict[UUID, datetime]
+    ) -> None:
+        rollups: Dict[RollupKey, DashboardRollup] = {}
+        
+        for batch_id, producer_id, origin_country, quantity in rows:
+            transit_seconds = self._transit_seconds(shipped_at.get(batch_id), timestamp)
+            for rollup in self._scoped(rollups, producer_id, origin_country):
+                rollup.move(transition.from_status, transition.to_status, quantity)
+                if transit_seconds is not None:
+                    rollup.add_delivery(transit_seconds)
+        
+        await self.increment(rollups)
+    
+    async def increment(self, rollups: Dict[RollupKey, DashboardRollup]) -> None:
+        # Lignes triées par clé : deux transactions concurrentes verrouillent les agrégats dans le même ordre
+        status_rows, harvest_rows, transit_rows = [], [], []
+        for (scope, key), rollup in sorted(rollups.items(), key=lambda item: (item[0][0].value, item[0][1])):
+            scope_columns = {"scope": scope.value, "scope_key": key}
+            status_rows += [
+                {**scope_columns, "status": status.value, "batch_count": totals.batch_count, "quantity_kg": totals.quantity_kg}
+                for status, totals in rollup.by_status.items()
+                if totals.batch_count or totals.quantity_kg
+            ]
+            harvest_rows += [
+                {**scope_columns, "month": month, "batch_count": totals.batch_count, "quantity_kg": totals.quantity_kg}
+                for month, totals in sorted(rollup.harvest_by_month.items())
+            ]
+            if rollup.timed_deliveries:
+                transit_rows.append({
+                    **scope_columns,
+                    "timed_deliveries": rollup.timed_deliveries,
+                    "transit_seconds": rollup.transit_seconds
+                })
+        
+        await self._increment(StatusRollupModel, ["scope", "scope_key", "status"], ["batch_count", "quantity_kg"], status_rows)
+        await self._increment(HarvestRollupModel, ["scope", "scope_key", "month"], ["batch_count", "quantity_kg"], harvest_rows)
+        await self._increment(TransitRollupModel, ["scope", "scope_key"], ["timed_deliveries", "transit_seconds"], transit_rows)
+    
+    async def _increment(self, model, keys: List[str], columns: List[str], rows: List[dict]) -> None:
+        if not rows:
+            return
+        statement = upsert(self._session, model)
+        statement = statement.on_conflict_do_update(
+            index_elements=keys,
+            set_={column: getattr(model, column) + getattr(statement.excluded, column) for column in columns}
+        )
+        await self._session.execute(statement, rows)
+    
+    def _scoped(self, rollups: Dict[RollupKey, DashboardRollup], producer_id: UUID, country: str) -> Tuple[DashboardRollup, ...]:
+        return (
+            rollups.setdefault((RollupScope.PRODUCER, str(producer_id)), DashboardRollup()),
+            rollups.setdefault((RollupScope.COUNTRY, country), DashboardRollup()),
+        )
+    
+    def _delivered_at(self, batch: CocoaBatch) -> Optional[datetime]:
+        if batch.status is not BatchStatus.DELIVERED:
+            return None
+        for entry in reversed(batch.pending_tracking_entries):
+            if entry.action == "DELIVERED":
+                return entry.timestamp
+        return None
+    
+    def _transit_seconds(self, shipped_at: Optional[datetime], delivered_at: Optional[datetime]) -> Optional[float]:
+        if shipped_at is None or delivered_at is None:
+            return None
+        return (delivered_at - shipped_at).total_seconds()
\ No newline at end of file
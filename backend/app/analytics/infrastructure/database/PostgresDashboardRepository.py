@@ -0,0 +1,123 @@
+from sqlalchemy import delete, extract, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Optional
+
+from app.analytics.domain import DashboardRollup, RollupScope, RollupTotals
+from app.analytics.domain.DashboardRepositoryInterface import DashboardRepositoryInterface
+from app.analytics.infrastructure.database.DashboardRollupWriter import (
+    DashboardRollupWriter,
+    HarvestRollupModel,
+    RollupKey,
+    StatusRollupModel,
+    TransitRollupModel,
+)
+from app.traceability.domain import BatchStatus
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import (
+    CocoaBatchModel,
+    TrackingEntryModel,
+)
+
+
+class PostgresDashboardRepository(DashboardRepositoryInterface):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+    
+    async def find(self, scope: RollupScope, key: str, months: int) -> Optional[DashboardRollup]:
+        # Lectures par clé primaire uniquement : le coût ne dépend pas du nombre de lots
+        statuses = await self._session.execute(
+            select(StatusRollupModel.status, StatusRollupModel.batch_count, StatusRollupModel.quantity_kg)
+            .where(StatusRollupModel.scope == scope.value, StatusRollupModel.scope_key == key)
+        )
+        status_rows = statuses.tuples().all()
+        if not status_rows:
+            return None
+        
+        harvests = await self._session.execute(
+            select(HarvestRollupModel.month, HarvestRollupModel.batch_count, HarvestRollupModel.quantity_kg)
+            .where(HarvestRollupModel.scope == scope.value, HarvestRollupModel.scope_key == key)
+            .order_by(HarvestRollupModel.month.desc())
+            .limit(months)
+        )
+        transit = await self._session.get(TransitRollupModel, (scope.value, key))
+        
+        rollup = DashboardRollup()
+        for status, batch_count, quantity_kg in status_rows:
+            rollup.by_status[BatchStatus(status)].add(batch_count, quantity_kg)
+        rollup.harvest_by_month = {
+            month: RollupTotals(batch_count, quantity_kg)
+            for month, batch_count, quantity_kg in reversed(harvests.tuples().all())
+        }
+        if transit is not None:
+            rollup.timed_deliveries = transit.timed_deliveries
+            rollup.transit_seconds = transit.transit_seconds
+        return rollup
+    
+    async def rebuild(self) -> int:
+        rollups: Dict[RollupKey, DashboardRollup] = {}
+        
+        def scoped(producer_id, country):
+            return (
+                rollups.setdefault((RollupScope.PRODUCER, str(producer_id)), DashboardRollup()),
+                rollups.setdefault((RollupScope.COUNTRY, country), DashboardRollup()),
+            )
+        
+        statuses = await self._session.execute(
+            select(
+                CocoaBatchModel.producer_id,
+                CocoaBatchModel.origin_country,
+                CocoaBatchModel.status,
+                func.count(),
+                func.sum(CocoaBatchModel.quantity),
+            )
+            .group_by(CocoaBatchModel.producer_id, CocoaBatchModel.origin_country, CocoaBatchModel.status)
+        )
+        for producer_id, country, status, batch_count, quantity_kg in statuses.tuples():
+            for rollup in scoped(producer_id, country):
+                rollup.by_status[BatchStatus(status)].add(batch_count, quantity_kg)
+        
+        year = extract("year", CocoaBatchModel.harvest_date)
+        month = extract("month", CocoaBatchModel.harvest_date)
+        harvests = await self._session.execute(
+            select(
+                CocoaBatchModel.producer_id,
+                CocoaBatchModel.origin_country,
+                year,
+                month,
+                func.count(),
+                func.sum(CocoaBatchModel.quantity),
+            )
+            .group_by(CocoaBatchModel.producer_id, CocoaBatchModel.origin_country, year, month)
+        )
+        for producer_id, country, harvest_year, harvest_month, batch_count, quantity_kg in harvests.tuples():
+            for rollup in scoped(producer_id, country):
+                rollup.harvest_by_month.setdefault(
+                    f"{int(harvest_year):04d}-{int(harvest_month):02d}", RollupTotals()
+                ).add(batch_count, quantity_kg)
+        
+        shipped = self._last_entry("SHIPPED")
+        delivered = self._last_entry("DELIVERED")
+        transits = await self._session.stream(
+            select(CocoaBatchModel.producer_id, CocoaBatchModel.origin_country, shipped.c.at, delivered.c.at)
+            .join(shipped, shipped.c.batch_id == CocoaBatchModel.id)
+            .join(delivered, delivered.c.batch_id == CocoaBatchModel.id)
+            .where(CocoaBatchModel.status == BatchStatus.DELIVERED.value)
+            .execution_options(yield_per=1000)
+        )
+        async for producer_id, country, shipped_at, delivered_at in transits.tuples():
+            for rollup in scoped(producer_id, country):
+                rollup.add_delivery((delivered_at - shipped_at).total_seconds())
+        
+        await self._session.execute(delete(StatusRollupModel))
+        await self._session.execute(delete(HarvestRollupModel))
+        await self._session.execute(delete(TransitRollupModel))
+        await DashboardRollupWriter(self._session).increment(rollups)
+        await self._session.commit()
+        return sum(rollup.batch_count for (scope, _), rollup in rollups.items() if scope is RollupScope.PRODUCER)
+    
+    def _last_entry(self, action: str):
+        return (
+            select(TrackingEntryModel.batch_id, func.max(TrackingEntryModel.timestamp).label("at"))
+            .where(TrackingEntryModel.action == action)
+            .group_by(TrackingEntryModel.batch_id)
+            .subquery()
+        )
\ No newline at end of file
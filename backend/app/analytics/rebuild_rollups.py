@@ -0,0 +1,19 @@
+import asyncio
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.shared_kernel import AsyncSessionLocal
+from app.analytics.application.DashboardService import DashboardService
+from app.analytics.infrastructure.database.PostgresDashboardRepository import PostgresDashboardRepository
+
+
+async def main() -> None:
+    async with AsyncSessionLocal() as db:
+        rebuilt = await DashboardService(PostgresDashboardRepository(db)).rebuild()
+    print(f"✅ Agrégats des tableaux de bord reconstruits pour {rebuilt} lots")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
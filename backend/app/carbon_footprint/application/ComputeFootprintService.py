@@ -0,0 +1,24 @@
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from app.carbon_footprint.application.FootprintCalculator import FootprintCalculator
+from app.carbon_footprint.domain import BatchFootprint
+from app.carbon_footprint.domain.TransportLegRepositoryInterface import TransportLegRepositoryInterface
+
+
+class ComputeFootprintService:
+    def __init__(self, repository: TransportLegRepositoryInterface, calculator: FootprintCalculator):
+        self._repository = repository
+        self._calculator = calculator
+    
+    async def for_batch(self, batch_id: UUID) -> Optional[BatchFootprint]:
+        footprints = await self.for_batches([batch_id])
+        return footprints[0] if footprints else None
+    
+    async def for_batches(self, batch_ids: List[UUID]) -> List[BatchFootprint]:
+        legs = await self._repository.load_for_batches(batch_ids)
+        return self._calculator.compute(legs)
+    
+    async def for_producer(self, producer_id: UUID) -> Dict[str, object]:
+        legs = await self._repository.load_for_producer(producer_id)
+        return self._calculator.summarize(legs)
@@ -0,0 +1,76 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.carbon_footprint.domain import (
+    BatchFootprint,
+    EMISSION_FACTORS_KG_CO2E_PER_TONNE_KM,
+    TRANSPORT_MODES,
+    TransportLegs,
+)
+from app.traceability.domain import TransportMode
+
+
+class FootprintCalculator:
+    def __init__(self, emission_factors: Optional[Dict[TransportMode, float]] = None):
+        factors = emission_factors or EMISSION_FACTORS_KG_CO2E_PER_TONNE_KM
+        self._factors = np.array([factors[mode] for mode in TRANSPORT_MODES], dtype=np.float64)
+    
+    def compute(self, legs: TransportLegs) -> List[BatchFootprint]:
+        batch_count = len(legs.batch_ids)
+        mode_count = len(TRANSPORT_MODES)
+        
+        tonne_km = legs.distances_km * legs.masses_t
+        emissions = self._factors[legs.modes] * tonne_km
+        
+        emissions_by_mode = np.bincount(
+            legs.batch_index * mode_count + legs.modes,
+            weights=emissions,
+            minlength=batch_count * mode_count
+        ).astype(np.float64, copy=False).reshape(batch_count, mode_count)
+        total_tonne_km = np.bincount(
+            legs.batch_index, weights=tonne_km, minlength=batch_count
+        ).astype(np.float64, copy=False)
+        total_distance = np.bincount(
+            legs.batch_index, weights=legs.distances_km, minlength=batch_count
+        ).astype(np.float64, copy=False)
+        leg_counts = np.bincount(legs.batch_index, minlength=batch_count)
+        total_emissions = emissions_by_mode.sum(axis=1)
+        
+        by_mode_rows = emissions_by_mode.tolist()
+        total_emissions = total_emissions.tolist()
+        total_tonne_km = total_tonne_km.tolist()
+        total_distance = total_distance.tolist()
+        leg_counts = leg_counts.tolist()
+        
+        return [
+            BatchFootprint(
+                batch_id=batch_id,
+                producer_id=legs.producer_ids[index],
+                emissions_kg_co2e=total_emissions[index],
+                tonne_km=total_tonne_km[index],
+                distance_km=total_distance[index],
+                legs=leg_counts[index],
+                emissions_by_mode=dict(zip(TRANSPORT_MODES, by_mode_rows[index]))
+            )
+            for index, batch_id in enumerate(legs.batch_ids)
+        ]
+    
+    def summarize(self, legs: TransportLegs) -> Dict[str, object]:
+        tonne_km = legs.distances_km * legs.masses_t
+        emissions_by_mode = np.bincount(
+            legs.modes,
+            weights=self._factors[legs.modes] * tonne_km,
+            minlength=len(TRANSPORT_MODES)
+        ).astype(np.float64, copy=False)
+        
+        return {
+            "batch_count": len(legs.batch_ids),
+            "emissions_kg_co2e": float(emissions_by_mode.sum()),
+            "tonne_km": float(tonne_km.sum()),
+            "distance_km": float(legs.distances_km.sum()),
+            "legs": len(legs),
+            "emissions_by_mode": {
+                mode: float(emissions_by_mode[code]) for code, mode in enumerate(TRANSPORT_MODES)
+            },
+        }
@@ -0,0 +1,23 @@
+from typing import Optional
+from uuid import UUID
+
+from app.carbon_footprint.domain import FootprintAggregate
+from app.carbon_footprint.domain.FootprintAggregateRepositoryInterface import FootprintAggregateRepositoryInterface
+
+
+class FootprintReportService:
+    def __init__(self, repository: FootprintAggregateRepositoryInterface):
+        self._repository = repository
+    
+    async def for_batch(self, batch_id: UUID) -> Optional[FootprintAggregate]:
+        aggregate = await self._repository.find_for_batch(batch_id)
+        if aggregate is not None:
+            return aggregate
+        # Pas d'agrégat : lot jamais expédié (empreinte nulle) ou lot inconnu
+        return FootprintAggregate() if await self._repository.batch_exists(batch_id) else None
+    
+    async def for_producer(self, producer_id: UUID) -> FootprintAggregate:
+        return await self._repository.find_for_producer(producer_id) or FootprintAggregate()
+    
+    async def rebuild(self) -> int:
+        return await self._repository.rebuild()
\ No newline at end of file
@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+from typing import Dict
+from uuid import UUID
+
+from app.traceability.domain import TransportMode
+
+
+@dataclass(frozen=True)
+class BatchFootprint:
+    batch_id: UUID
+    producer_id: UUID
+    emissions_kg_co2e: float
+    tonne_km: float
+    distance_km: float
+    legs: int
+    emissions_by_mode: Dict[TransportMode, float] = field(default_factory=dict)
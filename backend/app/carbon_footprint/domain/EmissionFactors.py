@@ -0,0 +1,11 @@
+from typing import Dict
+
+from app.traceability.domain import TransportMode
+
+# kg CO2e par tonne-km, ordres de grandeur GLEC / DEFRA pour le fret
+EMISSION_FACTORS_KG_CO2E_PER_TONNE_KM: Dict[TransportMode, float] = {
+    TransportMode.TRUCK: 0.105,
+    TransportMode.TRAIN: 0.028,
+    TransportMode.SHIP: 0.016,
+    TransportMode.AIR: 0.602,
+}
@@ -0,0 +1,33 @@
+from dataclasses import dataclass, field
+from typing import Dict
+
+from app.carbon_footprint.domain.EmissionFactors import EMISSION_FACTORS_KG_CO2E_PER_TONNE_KM
+from app.traceability.domain import TransportMode
+
+
+@dataclass
+class FootprintAggregate:
+    hops: int = 0
+    distance_by_mode: Dict[TransportMode, float] = field(
+        default_factory=lambda: {mode: 0.0 for mode in TransportMode}
+    )
+    tonne_km: float = 0.0
+    emissions_kg_co2e: float = 0.0
+    
+    @property
+    def distance_km(self) -> float:
+        return sum(self.distance_by_mode.values())
+    
+    def add_leg(self, transport_mode: TransportMode, distance_km: float, mass_t: float) -> None:
+        tonne_km = distance_km * mass_t
+        self.hops += 1
+        self.distance_by_mode[transport_mode] += distance_km
+        self.tonne_km += tonne_km
+        self.emissions_kg_co2e += EMISSION_FACTORS_KG_CO2E_PER_TONNE_KM[transport_mode] * tonne_km
+    
+    def add(self, other: "FootprintAggregate") -> None:
+        self.hops += other.hops
+        for mode, distance in other.distance_by_mode.items():
+            self.distance_by_mode[mode] += distance
+        self.tonne_km += other.tonne_km
+        self.emissions_kg_co2e += other.emissions_kg_co2e
\ No newline at end of file
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from app.carbon_footprint.domain.FootprintAggregate import FootprintAggregate
+
+
+class FootprintAggregateRepositoryInterface(ABC):
+    @abstractmethod
+    async def find_for_batch(self, batch_id: UUID) -> Optional[FootprintAggregate]:
+        pass
+    
+    @abstractmethod
+    async def batch_exists(self, batch_id: UUID) -> bool:
+        pass
+    
+    @abstractmethod
+    async def find_for_producer(self, producer_id: UUID) -> Optional[FootprintAggregate]:
+        pass
+    
+    @abstractmethod
+    async def rebuild(self) -> int:
+        pass
\ No newline at end of file
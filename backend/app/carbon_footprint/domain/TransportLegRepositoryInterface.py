@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import List
+from uuid import UUID
+
+from app.carbon_footprint.domain.TransportLegs import TransportLegs
+
+
+class TransportLegRepositoryInterface(ABC):
+    @abstractmethod
+    async def load_for_batches(self, batch_ids: List[UUID]) -> TransportLegs:
+        pass
+    
+    @abstractmethod
+    async def load_for_producer(self, producer_id: UUID) -> TransportLegs:
+        pass
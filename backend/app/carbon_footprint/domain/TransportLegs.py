@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Dict, List
+from uuid import UUID
+
+import numpy as np
+
+from app.traceability.domain import TransportMode
+
+TRANSPORT_MODES: List[TransportMode] = list(TransportMode)
+MODE_CODES: Dict[TransportMode, int] = {mode: code for code, mode in enumerate(TRANSPORT_MODES)}
+
+
+@dataclass(frozen=True)
+class TransportLegs:
+    batch_ids: List[UUID]
+    producer_ids: List[UUID]
+    batch_index: np.ndarray
+    modes: np.ndarray
+    distances_km: np.ndarray
+    masses_t: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.modes)
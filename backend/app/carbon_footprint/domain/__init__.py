@@ -0,0 +1,13 @@
+from .EmissionFactors import EMISSION_FACTORS_KG_CO2E_PER_TONNE_KM
+from .TransportLegs import MODE_CODES, TRANSPORT_MODES, TransportLegs
+from .BatchFootprint import BatchFootprint
+from .FootprintAggregate import FootprintAggregate
+
+__all__ = [
+    "EMISSION_FACTORS_KG_CO2E_PER_TONNE_KM",
+    "MODE_CODES",
+    "TRANSPORT_MODES",
+    "TransportLegs",
+    "BatchFootprint",
+    "FootprintAggregate",
+]
@@ -0,0 +1,102 @@
+from fastapi import APIRouter, Depends, HTTPException
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.carbon_footprint.application.ComputeFootprintService import ComputeFootprintService
+from app.carbon_footprint.application.FootprintCalculator import FootprintCalculator
+from app.carbon_footprint.application.FootprintReportService import FootprintReportService
+from app.carbon_footprint.domain import FootprintAggregate
+from app.carbon_footprint.infrastructure.database.PostgresFootprintAggregateRepository import (
+    PostgresFootprintAggregateRepository,
+)
+from app.carbon_footprint.infrastructure.database.PostgresTransportLegRepository import PostgresTransportLegRepository
+from app.shared_kernel import get_async_db
+
+router = APIRouter(
+    prefix="/carbon-footprint",
+    tags=["carbon-footprint"],
+    responses={404: {"description": "Not found"}},
+)
+
+footprint_calculator = FootprintCalculator()
+
+
+def get_transport_leg_repository(db: AsyncSession = Depends(get_async_db)) -> PostgresTransportLegRepository:
+    return PostgresTransportLegRepository(db)
+
+
+def get_compute_footprint_service(
+    repository: PostgresTransportLegRepository = Depends(get_transport_leg_repository)
+) -> ComputeFootprintService:
+    return ComputeFootprintService(repository, footprint_calculator)
+
+
+def get_footprint_report_service(db: AsyncSession = Depends(get_async_db)) -> FootprintReportService:
+    return FootprintReportService(PostgresFootprintAggregateRepository(db))
+
+
+def serialize_aggregate(aggregate: FootprintAggregate) -> dict:
+    return {
+        "hops": aggregate.hops,
+        "distance_km": aggregate.distance_km,
+        "distance_by_mode": {mode.value: value for mode, value in aggregate.distance_by_mode.items()},
+        "tonne_km": aggregate.tonne_km,
+        "emissions_kg_co2e": aggregate.emissions_kg_co2e
+    }
+
+
+@router.get("/batches/{batch_id}")
+async def get_batch_footprint(
+    batch_id: UUID,
+    service: ComputeFootprintService = Depends(get_compute_footprint_service)
+):
+    footprint = await service.for_batch(batch_id)
+    
+    if footprint is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    
+    return {
+        "batch_id": str(footprint.batch_id),
+        "producer_id": str(footprint.producer_id),
+        "emissions_kg_co2e": footprint.emissions_kg_co2e,
+        "tonne_km": footprint.tonne_km,
+        "distance_km": footprint.distance_km,
+        "legs": footprint.legs,
+        "emissions_by_mode": {mode.value: value for mode, value in footprint.emissions_by_mode.items()}
+    }
+
+
+@router.get("/producers/{producer_id}")
+async def get_producer_footprint(
+    producer_id: UUID,
+    service: ComputeFootprintService = Depends(get_compute_footprint_service)
+):
+    summary = await service.for_producer(producer_id)
+    
+    return {
+        "producer_id": str(producer_id),
+        **summary,
+        "emissions_by_mode": {mode.value: value for mode, value in summary["emissions_by_mode"].items()}
+    }
+
+
+@router.get("/reports/batches/{batch_id}")
+async def get_batch_footprint_report(
+    batch_id: UUID,
+    service: FootprintReportService = Depends(get_footprint_report_service)
+):
+    aggregate = await service.for_batch(batch_id)
+    
+    if aggregate is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    
+    return {"batch_id": str(batch_id), **serialize_aggregate(aggregate)}
+
+
+@router.get("/reports/producers/{producer_id}")
+async def get_producer_footprint_report(
+    producer_id: UUID,
+    service: FootprintReportService = Depends(get_footprint_report_service)
+):
+    aggregate = await service.for_producer(producer_id)
+    return {"producer_id": str(producer_id), **serialize_aggregate(aggregate)}
\ No newline at end of file
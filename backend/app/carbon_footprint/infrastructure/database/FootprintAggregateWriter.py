@@ -0,0 +1,107 @@
+from sqlalchemy import Column, Float, ForeignKey, Integer, Uuid
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List
+from uuid import UUID
+
+from app.shared_kernel.database import Base, upsert
+
+from app.carbon_footprint.domain import FootprintAggregate
+from app.traceability.domain import BatchWriteListener, BatchesWritten, CocoaBatch, TransportMode
+
+
+class BatchFootprintModel(Base):
+    __tablename__ = "batch_footprints"
+    
+    batch_id = Column(Uuid, ForeignKey("cocoa_batches.id", ondelete="CASCADE"), primary_key=True)
+    producer_id = Column(Uuid, nullable=False, index=True)
+    hops = Column(Integer, nullable=False, default=0)
+    distance_truck_km = Column(Float, nullable=False, default=0.0)
+    distance_ship_km = Column(Float, nullable=False, default=0.0)
+    distance_train_km = Column(Float, nullable=False, default=0.0)
+    distance_air_km = Column(Float, nullable=False, default=0.0)
+    tonne_km = Column(Float, nullable=False, default=0.0)
+    emissions_kg_co2e = Column(Float, nullable=False, default=0.0)
+
+
+class ProducerFootprintModel(Base):
+    __tablename__ = "producer_footprints"
+    
+    producer_id = Column(Uuid, primary_key=True)
+    hops = Column(Integer, nullable=False, default=0)
+    distance_truck_km = Column(Float, nullable=False, default=0.0)
+    distance_ship_km = Column(Float, nullable=False, default=0.0)
+    distance_train_km = Column(Float, nullable=False, default=0.0)
+    distance_air_km = Column(Float, nullable=False, default=0.0)
+    tonne_km = Column(Float, nullable=False, default=0.0)
+    emissions_kg_co2e = Column(Float, nullable=False, default=0.0)
+
+
+DISTANCE_COLUMNS: Dict[TransportMode, str] = {
+    mode: f"distance_{mode.value.lower()}_km" for mode in TransportMode
+}
+AGGREGATE_COLUMNS: List[str] = ["hops", *DISTANCE_COLUMNS.values(), "tonne_km", "emissions_kg_co2e"]
+
+
+class FootprintAggregateWriter(BatchWriteListener):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+    
+    async def batches_written(self, event: BatchesWritten) -> None:
+        await self.record_pending_legs(event.batches)
+    
+    async def record_pending_legs(self, batches: List[CocoaBatch]) -> None:
+        batch_deltas: Dict[UUID, FootprintAggregate] = {}
+        producer_deltas: Dict[UUID, FootprintAggregate] = {}
+        producers: Dict[UUID, UUID] = {}
+        
+        for batch in batches:
+            mass_t = batch.quantity.value / 1000
+            for entry in batch.pending_tracking_entries:
+                if entry.transport_mode is None or entry.distance is None:
+                    continue
+                batch_deltas.setdefault(batch.id, FootprintAggregate()).add_leg(
+                    entry.transport_mode, entry.distance, mass_t
+                )
+                producers[batch.id] = batch.producer_id
+        
+        if not batch_deltas:
+            return
+        
+        for batch_id, delta in batch_deltas.items():
+            producer_deltas.setdefault(producers[batch_id], FootprintAggregate()).add(delta)
+        
+        await self._increment(
+            BatchFootprintModel,
+            "batch_id",
+            [
+                {"batch_id": batch_id, "producer_id": producers[batch_id], **self._to_row(delta)}
+                for batch_id, delta in batch_deltas.items()
+            ]
+        )
+        await self._increment(
+            ProducerFootprintModel,
+            "producer_id",
+            [
+                {"producer_id": producer_id, **self._to_row(delta)}
+                for producer_id, delta in producer_deltas.items()
+            ]
+        )
+    
+    async def _increment(self, model, key: str, rows: List[dict]) -> None:
+        statement = upsert(self._session, model)
+        statement = statement.on_conflict_do_update(
+            index_elements=[key],
+            set_={
+                column: getattr(model, column) + getattr(statement.excluded, column)
+                for column in AGGREGATE_COLUMNS
+            }
+        )
+        await self._session.execute(statement, rows)
+    
+    def _to_row(self, aggregate: FootprintAggregate) -> dict:
+        return {
+            "hops": aggregate.hops,
+            **{column: aggregate.distance_by_mode[mode] for mode, column in DISTANCE_COLUMNS.items()},
+            "tonne_km": aggregate.tonne_km,
+            "emissions_kg_co2e": aggregate.emissions_kg_co2e
+        }
\ No newline at end of file
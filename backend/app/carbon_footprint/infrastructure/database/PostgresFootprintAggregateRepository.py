@@ -0,0 +1,89 @@
+from sqlalchemy import case, delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from uuid import UUID
+
+from app.carbon_footprint.domain import EMISSION_FACTORS_KG_CO2E_PER_TONNE_KM, FootprintAggregate
+from app.carbon_footprint.domain.FootprintAggregateRepositoryInterface import FootprintAggregateRepositoryInterface
+from app.carbon_footprint.infrastructure.database.FootprintAggregateWriter import (
+    AGGREGATE_COLUMNS,
+    DISTANCE_COLUMNS,
+    BatchFootprintModel,
+    ProducerFootprintModel,
+)
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import (
+    CocoaBatchModel,
+    TrackingEntryModel,
+)
+
+
+class PostgresFootprintAggregateRepository(FootprintAggregateRepositoryInterface):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+    
+    async def find_for_batch(self, batch_id: UUID) -> Optional[FootprintAggregate]:
+        model = await self._session.get(BatchFootprintModel, batch_id)
+        return self._to_domain(model) if model is not None else None
+    
+    async def batch_exists(self, batch_id: UUID) -> bool:
+        result = await self._session.execute(select(CocoaBatchModel.id).where(CocoaBatchModel.id == batch_id))
+        return result.first() is not None
+    
+    async def find_for_producer(self, producer_id: UUID) -> Optional[FootprintAggregate]:
+        model = await self._session.get(ProducerFootprintModel, producer_id)
+        return self._to_domain(model) if model is not None else None
+    
+    async def rebuild(self) -> int:
+        tonne_km = TrackingEntryModel.distance * CocoaBatchModel.quantity / 1000
+        legs = (
+            select(
+                TrackingEntryModel.batch_id,
+                CocoaBatchModel.producer_id,
+                func.count().label("hops"),
+                *[
+                    func.sum(
+                        case((TrackingEntryModel.transport_mode == mode.value, TrackingEntryModel.distance), else_=0.0)
+                    ).label(column)
+                    for mode, column in DISTANCE_COLUMNS.items()
+                ],
+                func.sum(tonne_km).label("tonne_km"),
+                func.sum(
+                    tonne_km * case(
+                        *[
+                            (TrackingEntryModel.transport_mode == mode.value, literal(factor))
+                            for mode, factor in EMISSION_FACTORS_KG_CO2E_PER_TONNE_KM.items()
+                        ],
+                        else_=0.0
+                    )
+                ).label("emissions_kg_co2e"),
+            )
+            .join(CocoaBatchModel, CocoaBatchModel.id == TrackingEntryModel.batch_id)
+            .where(TrackingEntryModel.transport_mode.is_not(None), TrackingEntryModel.distance.is_not(None))
+            .group_by(TrackingEntryModel.batch_id, CocoaBatchModel.producer_id)
+        )
+        producers = (
+            select(
+                BatchFootprintModel.producer_id,
+                *[func.sum(getattr(BatchFootprintModel, column)).label(column) for column in AGGREGATE_COLUMNS],
+            )
+            .group_by(BatchFootprintModel.producer_id)
+        )
+        
+        await self._session.execute(delete(ProducerFootprintModel))
+        await self._session.execute(delete(BatchFootprintModel))
+        result = await self._session.execute(
+            insert(BatchFootprintModel).from_select(["batch_id", "producer_id", *AGGREGATE_COLUMNS], legs)
+        )
+        await self._session.execute(
+            insert(ProducerFootprintModel).from_select(["producer_id", *AGGREGATE_COLUMNS], producers)
+        )
+        await self._session.commit()
+        return result.rowcount
+    
+    def _to_domain(self, model) -> FootprintAggregate:
+        return FootprintAggregate(
+            hops=model.hops,
+            distance_by_mode={mode: getattr(model, column) for mode, column in DISTANCE_COLUMNS.items()},
+            tonne_km=model.tonne_km,
+            emissions_kg_co2e=model.emissions_kg_co2e
+        )
\ No newline at end of file
@@ -0,0 +1,53 @@
+from typing import List
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.carbon_footprint.domain import MODE_CODES, TransportLegs
+from app.carbon_footprint.domain.TransportLegRepositoryInterface import TransportLegRepositoryInterface
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import (
+    CocoaBatchModel,
+    TrackingEntryModel,
+)
+
+MODE_CODES_BY_VALUE = {mode.value: code for mode, code in MODE_CODES.items()}
+
+
+class PostgresTransportLegRepository(TransportLegRepositoryInterface):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+    
+    async def load_for_batches(self, batch_ids: List[UUID]) -> TransportLegs:
+        return await self._load(CocoaBatchModel.id.in_(batch_ids))
+    
+    async def load_for_producer(self, producer_id: UUID) -> TransportLegs:
+        return await self._load(CocoaBatchModel.producer_id == producer_id)
+    
+    async def _load(self, condition) -> TransportLegs:
+        batches = (await self._session.execute(
+            select(CocoaBatchModel.id, CocoaBatchModel.producer_id, CocoaBatchModel.quantity).where(condition)
+        )).all()
+        legs = (await self._session.execute(
+            select(TrackingEntryModel.batch_id, TrackingEntryModel.transport_mode, TrackingEntryModel.distance)
+            .join(CocoaBatchModel, CocoaBatchModel.id == TrackingEntryModel.batch_id)
+            .where(
+                condition,
+                TrackingEntryModel.transport_mode.is_not(None),
+                TrackingEntryModel.distance.is_not(None)
+            )
+        )).all()
+        
+        positions = {batch_id: position for position, (batch_id, _, _) in enumerate(batches)}
+        batch_masses_t = np.fromiter((quantity for _, _, quantity in batches), dtype=np.float64, count=len(batches)) / 1000
+        batch_index = np.fromiter((positions[batch_id] for batch_id, _, _ in legs), dtype=np.int64, count=len(legs))
+        
+        return TransportLegs(
+            batch_ids=[batch_id for batch_id, _, _ in batches],
+            producer_ids=[producer_id for _, producer_id, _ in batches],
+            batch_index=batch_index,
+            modes=np.fromiter((MODE_CODES_BY_VALUE[mode] for _, mode, _ in legs), dtype=np.int64, count=len(legs)),
+            distances_km=np.fromiter((distance for _, _, distance in legs), dtype=np.float64, count=len(legs)),
+            masses_t=batch_masses_t[batch_index]
+        )
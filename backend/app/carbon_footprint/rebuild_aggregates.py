@@ -0,0 +1,21 @@
+import asyncio
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.shared_kernel import AsyncSessionLocal
+from app.carbon_footprint.application.FootprintReportService import FootprintReportService
+from app.carbon_footprint.infrastructure.database.PostgresFootprintAggregateRepository import (
+    PostgresFootprintAggregateRepository,
+)
+
+
+async def main() -> None:
+    async with AsyncSessionLocal() as db:
+        rebuilt = await FootprintReportService(PostgresFootprintAggregateRepository(db)).rebuild()
+    print(f"✅ Agrégats d'empreinte carbone reconstruits pour {rebuilt} lots")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
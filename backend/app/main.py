@@ -1,29 +1,104 @@
+import time
 from contextlib import asynccontextmanager
+from typing import List
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from .shared_kernel import config, init_db
-from .traceability.infrastructure.api.TraceabilityRouter import router as traceability_router
+from .shared_kernel import (
+    IdempotencyMiddleware,
+    RequestMetricsMiddleware,
+    async_engine,
+    config,
+    create_idempotency_store,
+    engine,
+    init_db,
+    pool_statistics,
+    render_prometheus,
+    request_metrics,
+    warm_up,
+)
+from .traceability.infrastructure.api.TraceabilityRouter import (
+    batch_write_listeners,
+    router as traceability_router,
+    tracking_events,
+)
+from .carbon_footprint.infrastructure.database.FootprintAggregateWriter import FootprintAggregateWriter
+from .analytics.infrastructure.database.DashboardRollupWriter import DashboardRollupWriter
+from .carbon_footprint.infrastructure.api.CarbonFootprintRouter import router as carbon_footprint_router
+from .analytics.infrastructure.api.AnalyticsRouter import router as analytics_router
+
+
+NIL_ID = "00000000-0000-0000-0000-000000000000"
+
+# Lectures sans effet de bord couvrant chaque routeur : validation, dépendances, requêtes SQL et sérialisation
+# sont compilées avant la première vraie requête. Les 404/422 attendus passent aussi par les gestionnaires d'erreurs
+WARMUP_REQUESTS = [
+    ("GET", "/api/traceability/batches", "page_size=1", None),
+    ("GET", f"/api/traceability/batches/{NIL_ID}", "", None),
+    ("POST", "/api/traceability/batches:batchGet", "", {"ids": [NIL_ID]}),
+    ("GET", "/api/traceability/batches:nearby", "latitude=5.35&longitude=-4.01&radius_km=1&limit=1", None),
+    ("POST", "/api/traceability/batches", "", {}),
+    ("GET", f"/api/carbon-footprint/producers/{NIL_ID}", "", None),
+    ("GET", f"/api/carbon-footprint/reports/producers/{NIL_ID}", "", None),
+    ("GET", f"/api/analytics/producers/{NIL_ID}", "", None),
+    ("GET", "/health", "", None),
+]
+
+startup_report = {}
+
+
+def per_worker_state() -> List[str]:
+    # Un cache LRU en mémoire n'est invalidé que dans le worker qui a écrit, et une clé d'idempotence
+    # réservée dans un worker est inconnue des autres : ces backends exigent un seul worker
+    state = []
+    if config.cache_backend == "memory":
+        state.append("CACHE_BACKEND=memory")
+    if config.idempotency_backend == "memory":
+        state.append("IDEMPOTENCY_BACKEND=memory")
+    return state
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    started = time.perf_counter()
     print("🚀 Démarrage de l'application Sustaain...")
     print(f"📊 Database URL: {config.database_url}")
     print(f"🐛 Debug mode: {config.debug}")
     
+    if config.web_concurrency > 1 and per_worker_state():
+        raise RuntimeError(
+            f"WEB_CONCURRENCY={config.web_concurrency} requires shared backends, "
+            f"got {', '.join(per_worker_state())} (use CACHE_BACKEND=none and IDEMPOTENCY_BACKEND=database)"
+        )
+    
     try:
         init_db()
         print("✅ Base de données initialisée")
     except Exception as e:
         print(f"⚠️  Erreur lors de l'initialisation de la DB: {e}")
     
+    await tracking_events.start()
+    print("📥 File d'ingestion des événements de traçabilité démarrée")
+    
+    if config.warmup_enabled:
+        warmup = await warm_up(app, async_engine, config.warmup_pool_connections, WARMUP_REQUESTS)
+        startup_report["warmup"] = warmup.as_dict()
+        print(
+            f"🔥 Préchauffage : {warmup.pool_connections} connexions en {warmup.pool_ms:.0f} ms, "
+            f"{len(warmup.responses)} requêtes en {warmup.requests_ms:.0f} ms"
+        )
+    startup_report["startup_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    print(f"⏱️  Démarrage en {startup_report['startup_ms']:.0f} ms")
+    
     yield
     
     print("👋 Arrêt de l'application Sustaain...")
+    await tracking_events.stop()
+    print(f"📥 File d'ingestion vidée ({tracking_events.stats.flushed} événements écrits)")
 
 
 app = FastAPI(
@@ -35,6 +110,10 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Ajouté en premier, donc le plus interne : les réponses rejouées passent encore par CORS et les métriques
+idempotency_store = create_idempotency_store()
+app.add_middleware(IdempotencyMiddleware, store=idempotency_store, openapi=app.openapi)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -43,7 +122,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(RequestMetricsMiddleware, slow_request_ms=config.slow_request_threshold_ms)
+
 app.include_router(traceability_router, prefix="/api")
+app.include_router(carbon_footprint_router, prefix="/api")
+app.include_router(analytics_router, prefix="/api")
+
+# Les projections des autres contextes suivent chaque écriture de lots, dans la même transaction
+batch_write_listeners.extend([FootprintAggregateWriter, DashboardRollupWriter])
 
 
 @app.get("/")
@@ -63,3 +149,32 @@ async def health_check():
         "database": config.database_url.split("@")[-1] if "@" in config.database_url else "configured"
     }
 
+
+@app.get("/health/pool")
+async def pool_health():
+    return {
+        "async": pool_statistics(async_engine.sync_engine),
+        "sync": pool_statistics(engine),
+    }
+
+
+@app.get("/health/startup")
+async def startup_health():
+    return startup_report
+
+
+@app.get("/health/idempotency")
+async def idempotency_health():
+    return idempotency_store.describe()
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    pools = {
+        "async": pool_statistics(async_engine.sync_engine),
+        "sync": pool_statistics(engine),
+    }
+    return PlainTextResponse(
+        render_prometheus(request_metrics, pools, idempotency_store.describe()),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
\ No newline at end of file
@@ -3,19 +3,75 @@ from .database import (
     Base,
     engine,
     SessionLocal,
+    async_engine,
+    AsyncSessionLocal,
     get_db,
     get_db_context,
+    get_async_db,
+    get_async_db_context,
+    upsert,
     init_db,
     drop_db
 )
 from .repositories import Repository, ReadOnlyRepository
+from .exceptions import (
+    DomainException,
+    ValidationError,
+    NotFoundError,
+    AlreadyExistsError,
+    BusinessRuleViolation,
+    ConcurrencyConflictError,
+    InfrastructureError,
+    DatabaseError,
+    ExternalServiceError
+)
+from .responses import SchemaResponse
+from .metrics import LatencyHistogram
+from .instrumentation import (
+    RequestSpan,
+    RequestMetrics,
+    RequestMetricsMiddleware,
+    current_span,
+    measure_serialization,
+    render_prometheus,
+    request_metrics
+)
+from .pool import PoolMetrics, pool_statistics
+from .idempotency import (
+    IDEMPOTENT_ROUTE,
+    IdempotencyMiddleware,
+    IdempotencyStats,
+    IdempotencyStore,
+    InMemoryIdempotencyStore,
+    DatabaseIdempotencyStore,
+    NullIdempotencyStore,
+    create_idempotency_store
+)
+from .write_behind import WriteBehindQueue, WriteBehindStats
+from .warmup import WarmupReport, call_app, warm_pool, warm_up
+from .geo import BoundingBox, encode_geohash, haversine_km, haversine_km_array
+from .identifiers import IdGenerator, RandomIdGenerator, TimeOrderedIdGenerator, id_generator
+from .cache import (
+    CacheBackend,
+    CacheStats,
+    LRUCache,
+    KeyValueStore,
+    InMemoryKeyValueStore,
+    ExternalCache,
+    NullCache,
+    create_cache_backend
+)
 from .base_models import (
+    NaiveUtcDatetime,
+    to_naive_utc,
     TimestampMixin,
     BaseEntity,
     BaseSchema,
     EntitySchema,
     PaginationParams,
-    PaginatedResponse
+    PaginatedResponse,
+    CursorPaginationParams,
+    CursorPaginatedResponse
 )
 
 __all__ = [
@@ -24,16 +80,75 @@ __all__ = [
     "Base",
     "engine",
     "SessionLocal",
+    "async_engine",
+    "AsyncSessionLocal",
     "get_db",
     "get_db_context",
+    "get_async_db",
+    "get_async_db_context",
+    "upsert",
     "init_db",
     "drop_db",
     "Repository",
     "ReadOnlyRepository",
+    "DomainException",
+    "ValidationError",
+    "NotFoundError",
+    "AlreadyExistsError",
+    "BusinessRuleViolation",
+    "ConcurrencyConflictError",
+    "InfrastructureError",
+    "DatabaseError",
+    "ExternalServiceError",
+    "SchemaResponse",
+    "LatencyHistogram",
+    "RequestSpan",
+    "RequestMetrics",
+    "RequestMetricsMiddleware",
+    "current_span",
+    "measure_serialization",
+    "render_prometheus",
+    "request_metrics",
+    "PoolMetrics",
+    "pool_statistics",
+    "IDEMPOTENT_ROUTE",
+    "IdempotencyMiddleware",
+    "IdempotencyStats",
+    "IdempotencyStore",
+    "InMemoryIdempotencyStore",
+    "DatabaseIdempotencyStore",
+    "NullIdempotencyStore",
+    "create_idempotency_store",
+    "WriteBehindQueue",
+    "WriteBehindStats",
+    "WarmupReport",
+    "call_app",
+    "warm_pool",
+    "warm_up",
+    "BoundingBox",
+    "encode_geohash",
+    "haversine_km",
+    "haversine_km_array",
+    "IdGenerator",
+    "RandomIdGenerator",
+    "TimeOrderedIdGenerator",
+    "id_generator",
+    "CacheBackend",
+    "CacheStats",
+    "LRUCache",
+    "KeyValueStore",
+    "InMemoryKeyValueStore",
+    "ExternalCache",
+    "NullCache",
+    "create_cache_backend",
+    "NaiveUtcDatetime",
+    "to_naive_utc",
     "TimestampMixin",
     "BaseEntity",
     "BaseSchema",
     "EntitySchema",
     "PaginationParams",
     "PaginatedResponse",
+    "CursorPaginationParams",
+    "CursorPaginatedResponse",
 ]
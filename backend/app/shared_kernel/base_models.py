@@ -1,10 +1,25 @@
-from datetime import datetime
+import base64
+import json
+from datetime import datetime, timezone
+from typing import Annotated, Any, List, Optional
 from sqlalchemy import Column, Integer, DateTime
 from sqlalchemy.sql import func
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import AfterValidator, BaseModel, Field, ConfigDict
 from .database import Base
 
 
+def to_naive_utc(value: datetime) -> datetime:
+    # Les colonnes métier sont des "timestamp without time zone" : asyncpg refuse une date avec fuseau,
+    # on la ramène donc en UTC sans fuseau. Une date déjà naïve est conservée telle quelle
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+# Date reçue d'un client (corps JSON, query string) et destinée à une colonne DateTime sans fuseau
+NaiveUtcDatetime = Annotated[datetime, AfterValidator(to_naive_utc)]
+
+
 class TimestampMixin:
     created_at = Column(
         DateTime(timezone=True),
@@ -86,3 +101,35 @@ class PaginatedResponse(BaseSchema):
             page_size=pagination.page_size,
             total_pages=total_pages
         )
+
+
+class CursorPaginationParams(BaseModel):
+    cursor: Optional[str] = Field(default=None, description="Curseur opaque renvoyé par la page précédente")
+    page_size: int = Field(default=20, ge=1, le=100, description="Nombre d'éléments par page")
+    
+    @property
+    def limit(self) -> int:
+        return self.page_size
+    
+    def decode_cursor(self) -> Optional[List[Any]]:
+        if self.cursor is None:
+            return None
+        try:
+            padded = self.cursor + "=" * (-len(self.cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded))
+        except (ValueError, TypeError):
+            raise ValueError("Invalid pagination cursor")
+        if not isinstance(values, list):
+            raise ValueError("Invalid pagination cursor")
+        return values
+    
+    @staticmethod
+    def encode_cursor(values: List[Any]) -> str:
+        payload = json.dumps(values, separators=(",", ":"), default=str).encode()
+        return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+class CursorPaginatedResponse(BaseSchema):
+    items: list
+    page_size: int
+    next_cursor: Optional[str] = None
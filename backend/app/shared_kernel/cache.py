@@ -0,0 +1,253 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional, Tuple
+
+from .config import config
+
+GENERATION_TTL_SECONDS = 3600.0
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    stale_fills: int = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def as_dict(self) -> Dict[str, float]:
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+class CacheBackend(ABC):
+    def __init__(self):
+        self.stats = CacheStats()
+    
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        pass
+    
+    @abstractmethod
+    async def set(self, key: str, value: bytes) -> None:
+        pass
+    
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        # Invalidation : incrémente la génération de la clé avant de retirer la valeur
+        pass
+    
+    @abstractmethod
+    async def generation(self, key: str) -> int:
+        pass
+    
+    async def fill(self, key: str, value: bytes, generation: int) -> bool:
+        # Remplissage après lecture en base : refusé si la clé a été invalidée depuis `generation`,
+        # relu après écriture pour retirer une valeur posée pendant une invalidation concurrente
+        if await self.generation(key) != generation:
+            self.stats.stale_fills += 1
+            return False
+        await self.set(key, value)
+        if await self.generation(key) != generation:
+            await self.delete(key)
+            self.stats.stale_fills += 1
+            return False
+        return True
+    
+    def describe(self) -> Dict[str, object]:
+        return {"backend": type(self).__name__, **self.stats.as_dict()}
+
+
+class Generations:
+    # Générations par clé bornées à max_entries : une clé oubliée prend la plus haute génération
+    # évincée, jamais une valeur qu'un lecteur aurait pu observer avant son invalidation
+    def __init__(self, max_entries: int):
+        self._values: "OrderedDict[str, int]" = OrderedDict()
+        self._max_entries = max_entries
+        self._clock = 0
+        self._floor = 0
+    
+    def get(self, key: str) -> int:
+        return self._values.get(key, self._floor)
+    
+    def bump(self, key: str) -> int:
+        self._clock += 1
+        self._values.pop(key, None)
+        self._values[key] = self._clock
+        while len(self._values) > self._max_entries:
+            _, evicted = self._values.popitem(last=False)
+            self._floor = max(self._floor, evicted)
+        return self._clock
+
+
+class LRUCache(CacheBackend):
+    def __init__(self, max_entries: int = 10_000, max_bytes: int = 64 * 2**20, ttl_seconds: float = 30.0):
+        super().__init__()
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._size_bytes = 0
+        self._generations = Generations(max_entries)
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+    
+    async def set(self, key: str, value: bytes) -> None:
+        if len(value) > self._max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+        self._size_bytes += len(value)
+        
+        while len(self._entries) > self._max_entries or self._size_bytes > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+    
+    async def delete(self, key: str) -> None:
+        self._generations.bump(key)
+        if key in self._entries:
+            self._remove(key)
+    
+    async def generation(self, key: str) -> int:
+        return self._generations.get(key)
+    
+    def describe(self) -> Dict[str, object]:
+        return {
+            **super().describe(),
+            "entries": len(self._entries),
+            "size_bytes": self._size_bytes,
+            "max_entries": self._max_entries,
+            "max_bytes": self._max_bytes,
+            "ttl_seconds": self._ttl_seconds,
+        }
+    
+    def _remove(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self._size_bytes -= len(value)
+
+
+class KeyValueStore(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        pass
+    
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        pass
+    
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        pass
+    
+    @abstractmethod
+    async def incr(self, key: str, ttl_seconds: float) -> int:
+        pass
+
+
+class InMemoryKeyValueStore(KeyValueStore):
+    # Doublure locale d'un client Redis (tests, benchmarks), bornée comme LRUCache
+    def __init__(self, max_entries: int = 10_000):
+        self._values: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._max_entries = max_entries
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._values[key]
+            return None
+        self._values.move_to_end(key)
+        return value
+    
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._values.pop(key, None)
+        self._values[key] = (time.monotonic() + ttl_seconds, value)
+        while len(self._values) > self._max_entries:
+            self._values.popitem(last=False)
+    
+    async def delete(self, key: str) -> None:
+        self._values.pop(key, None)
+    
+    async def incr(self, key: str, ttl_seconds: float) -> int:
+        value = int(await self.get(key) or 0) + 1
+        await self.set(key, str(value).encode(), ttl_seconds)
+        return value
+
+
+class ExternalCache(CacheBackend):
+    def __init__(self, store: KeyValueStore, ttl_seconds: float = 30.0, namespace: str = "sustaain"):
+        super().__init__()
+        self._store = store
+        self._ttl_seconds = ttl_seconds
+        self._namespace = namespace
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        value = await self._store.get(f"{self._namespace}:{key}")
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+    
+    async def set(self, key: str, value: bytes) -> None:
+        await self._store.set(f"{self._namespace}:{key}", value, self._ttl_seconds)
+    
+    async def delete(self, key: str) -> None:
+        await self._store.incr(f"{self._namespace}:generation:{key}", GENERATION_TTL_SECONDS)
+        await self._store.delete(f"{self._namespace}:{key}")
+    
+    async def generation(self, key: str) -> int:
+        return int(await self._store.get(f"{self._namespace}:generation:{key}") or 0)
+
+
+class NullCache(CacheBackend):
+    async def get(self, key: str) -> Optional[bytes]:
+        self.stats.misses += 1
+        return None
+    
+    async def set(self, key: str, value: bytes) -> None:
+        pass
+    
+    async def delete(self, key: str) -> None:
+        pass
+    
+    async def generation(self, key: str) -> int:
+        return 0
+
+
+def create_cache_backend() -> CacheBackend:
+    # ExternalCache n'est pas proposé ici tant qu'aucun client externe (Redis) n'est branché :
+    # avec InMemoryKeyValueStore, il ne serait qu'un cache local de plus
+    if config.cache_backend == "none":
+        return NullCache()
+    return LRUCache(
+        max_entries=config.cache_max_entries,
+        max_bytes=config.cache_max_bytes,
+        ttl_seconds=config.cache_ttl_seconds,
+    )
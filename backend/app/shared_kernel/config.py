@@ -8,7 +8,35 @@ class Config:
         self.host = self._get_env("HOST", "localhost")
         self.port = self._get_int_env("PORT", 8000)
         self.database_url = self._get_env("DATABASE_URL", "sqlite:///app.db")
+        self.async_database_url = self._get_env(
+            "ASYNC_DATABASE_URL",
+            self._to_async_url(self.database_url)
+        )
         self.secret_key = self._get_env("SECRET_KEY", "dev-secret-key")
+        self.cache_backend = self._get_choice_env("CACHE_BACKEND", ("memory", "none"), "memory")
+        self.cache_max_entries = self._get_int_env("CACHE_MAX_ENTRIES", 10_000)
+        self.cache_max_bytes = self._get_int_env("CACHE_MAX_BYTES", 64 * 1024 * 1024)
+        self.cache_ttl_seconds = self._get_float_env("CACHE_TTL_SECONDS", 30.0)
+        self.db_pool_size = self._get_int_env("DB_POOL_SIZE", 5)
+        self.db_max_overflow = self._get_int_env("DB_MAX_OVERFLOW", 10)
+        self.db_pool_recycle_seconds = self._get_int_env("DB_POOL_RECYCLE_SECONDS", 1800)
+        self.db_pool_timeout_seconds = self._get_float_env("DB_POOL_TIMEOUT_SECONDS", 30.0)
+        self.db_pool_pre_ping = self._get_choice_env("DB_POOL_PRE_PING", ("always", "idle", "never"), "idle")
+        self.db_pool_pre_ping_idle_seconds = self._get_float_env("DB_POOL_PRE_PING_IDLE_SECONDS", 30.0)
+        self.slow_request_threshold_ms = self._get_float_env("SLOW_REQUEST_THRESHOLD_MS", 0.0)
+        self.truck_detour_factor = self._get_float_env("TRUCK_DETOUR_FACTOR", 1.0)
+        self.train_detour_factor = self._get_float_env("TRAIN_DETOUR_FACTOR", 1.0)
+        self.idempotency_backend = self._get_choice_env("IDEMPOTENCY_BACKEND", ("memory", "database", "none"), "memory")
+        self.idempotency_max_entries = self._get_int_env("IDEMPOTENCY_MAX_ENTRIES", 100_000)
+        self.idempotency_ttl_seconds = self._get_float_env("IDEMPOTENCY_TTL_SECONDS", 86_400.0)
+        self.idempotency_lease_seconds = self._get_float_env("IDEMPOTENCY_LEASE_SECONDS", 30.0)
+        self.ingestion_queue_size = self._get_int_env("INGESTION_QUEUE_SIZE", 10_000)
+        self.ingestion_batch_size = self._get_int_env("INGESTION_BATCH_SIZE", 500)
+        self.ingestion_flush_interval_ms = self._get_float_env("INGESTION_FLUSH_INTERVAL_MS", 50.0)
+        self.ingestion_enqueue_timeout_ms = self._get_float_env("INGESTION_ENQUEUE_TIMEOUT_MS", 100.0)
+        self.web_concurrency = self._get_int_env("WEB_CONCURRENCY", 1)
+        self.warmup_enabled = self._get_bool_env("WARMUP_ENABLED", True)
+        self.warmup_pool_connections = self._get_int_env("WARMUP_POOL_CONNECTIONS", self.db_pool_size)
         
     def _get_env(self, key: str, default: Optional[str] = None) -> str:
         return os.getenv(key, default)
@@ -22,6 +50,30 @@ class Config:
         except ValueError:
             return default
     
+    def _get_float_env(self, key: str, default: float) -> float:
+        value = os.getenv(key)
+        if value is None:
+            return default
+        try:
+            return float(value)
+        except ValueError:
+            return default
+    
+    def _get_choice_env(self, key: str, choices: tuple, default: str) -> str:
+        value = os.getenv(key)
+        if value is None or value.lower() not in choices:
+            return default
+        return value.lower()
+    
+    def _to_async_url(self, url: str) -> str:
+        drivers = {
+            "postgresql": "postgresql+asyncpg",
+            "postgresql+psycopg2": "postgresql+asyncpg",
+            "sqlite": "sqlite+aiosqlite",
+        }
+        scheme, separator, rest = url.partition("://")
+        return f"{drivers.get(scheme, scheme)}{separator}{rest}"
+    
     def _get_bool_env(self, key: str, default: bool) -> bool:
         value = os.getenv(key)
         if value is None:
@@ -1,17 +1,33 @@
 from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Generator
 from .config import config
+from .instrumentation import instrument_sql
+from .pool import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool, instrument_engine
+
+
+def _pool_options(pool_class) -> dict:
+    return {
+        "poolclass": pool_class,
+        "pool_size": config.db_pool_size,
+        "max_overflow": config.db_max_overflow,
+        "pool_recycle": config.db_pool_recycle_seconds,
+        "pool_timeout": config.db_pool_timeout_seconds,
+        "pool_pre_ping": config.db_pool_pre_ping == "always",
+    }
+
 
 engine = create_engine(
     config.database_url,
     echo=config.debug,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    **_pool_options(InstrumentedQueuePool),
 )
+instrument_engine(engine, config.db_pool_pre_ping, config.db_pool_pre_ping_idle_seconds)
+instrument_sql(engine)
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -19,6 +35,21 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+async_engine = create_async_engine(
+    config.async_database_url,
+    echo=config.debug,
+    **_pool_options(InstrumentedAsyncAdaptedQueuePool),
+)
+instrument_engine(async_engine.sync_engine, config.db_pool_pre_ping, config.db_pool_pre_ping_idle_seconds)
+instrument_sql(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 Base = declarative_base()
 
 
@@ -43,6 +74,28 @@ def get_db_context():
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+@asynccontextmanager
+async def get_async_db_context():
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+
+def upsert(session: AsyncSession, model):
+    if session.bind.dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
 def init_db():
     Base.metadata.create_all(bind=engine)
 
@@ -0,0 +1,41 @@
+from typing import Any, Dict, Optional
+
+
+class DomainException(Exception):
+    def __init__(self, message: str, code: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+        self.details = details or {}
+
+
+class ValidationError(DomainException):
+    pass
+
+
+class NotFoundError(DomainException):
+    pass
+
+
+class AlreadyExistsError(DomainException):
+    pass
+
+
+class BusinessRuleViolation(DomainException):
+    pass
+
+
+class ConcurrencyConflictError(DomainException):
+    pass
+
+
+class InfrastructureError(DomainException):
+    pass
+
+
+class DatabaseError(InfrastructureError):
+    pass
+
+
+class ExternalServiceError(InfrastructureError):
+    pass
\ No newline at end of file
@@ -0,0 +1,114 @@
+import math
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LATITUDE = 111.32
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 9
+
+
+def haversine_km(latitude_a: float, longitude_a: float, latitude_b: float, longitude_b: float) -> float:
+    phi_a = math.radians(latitude_a)
+    phi_b = math.radians(latitude_b)
+    d_phi = phi_b - phi_a
+    d_lambda = math.radians(longitude_b - longitude_a)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi_a) * math.cos(phi_b) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def haversine_km_array(
+    latitudes_a: np.ndarray,
+    longitudes_a: np.ndarray,
+    latitudes_b: np.ndarray,
+    longitudes_b: np.ndarray
+) -> np.ndarray:
+    phi_a = np.radians(latitudes_a)
+    phi_b = np.radians(latitudes_b)
+    d_phi = phi_b - phi_a
+    d_lambda = np.radians(np.asarray(longitudes_b) - np.asarray(longitudes_a))
+    a = np.sin(d_phi / 2) ** 2 + np.cos(phi_a) * np.cos(phi_b) * np.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    latitude_range = [-90.0, 90.0]
+    longitude_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        interval, value = (longitude_range, longitude) if even else (latitude_range, latitude)
+        middle = (interval[0] + interval[1]) / 2
+        bits <<= 1
+        if value >= middle:
+            bits |= 1
+            interval[0] = middle
+        else:
+            interval[1] = middle
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+def geohash_cell_size(precision: int) -> tuple:
+    longitude_bits = (5 * precision + 1) // 2
+    latitude_bits = 5 * precision // 2
+    return 180.0 / 2 ** latitude_bits, 360.0 / 2 ** longitude_bits
+
+
+@dataclass(frozen=True, slots=True)
+class BoundingBox:
+    min_latitude: float
+    min_longitude: float
+    max_latitude: float
+    max_longitude: float
+    
+    def __post_init__(self):
+        if self.min_latitude > self.max_latitude or self.min_longitude > self.max_longitude:
+            raise ValueError("Bounding box minimums must not exceed maximums")
+    
+    @classmethod
+    def around(cls, latitude: float, longitude: float, radius_km: float) -> "BoundingBox":
+        # Pas de gestion de l'antiméridien : la boîte est tronquée aux bornes [-180, 180]
+        latitude_delta = radius_km / KM_PER_DEGREE_LATITUDE
+        cos_latitude = math.cos(math.radians(latitude))
+        longitude_delta = 180.0 if cos_latitude < 1e-9 else radius_km / (KM_PER_DEGREE_LATITUDE * cos_latitude)
+        return cls(
+            min_latitude=max(-90.0, latitude - latitude_delta),
+            min_longitude=max(-180.0, longitude - longitude_delta),
+            max_latitude=min(90.0, latitude + latitude_delta),
+            max_longitude=min(180.0, longitude + longitude_delta),
+        )
+    
+    @property
+    def center(self) -> tuple:
+        return (self.min_latitude + self.max_latitude) / 2, (self.min_longitude + self.max_longitude) / 2
+    
+    def geohash_prefixes(self, max_cells: int = 16) -> List[str]:
+        # Plus grande précision dont les cellules couvrant la boîte restent en nombre borné :
+        # chaque préfixe devient une plage [prefixe, prefixe + "{") sur l'index de la colonne geohash
+        for precision in range(GEOHASH_PRECISION, 0, -1):
+            cell_height, cell_width = geohash_cell_size(precision)
+            rows = math.floor(self.max_latitude / cell_height) - math.floor(self.min_latitude / cell_height) + 1
+            columns = math.floor(self.max_longitude / cell_width) - math.floor(self.min_longitude / cell_width) + 1
+            if rows * columns <= max_cells:
+                break
+        
+        prefixes = set()
+        for row in range(rows):
+            latitude = min(self.max_latitude, (math.floor(self.min_latitude / cell_height) + row + 0.5) * cell_height)
+            for column in range(columns):
+                longitude = min(
+                    self.max_longitude,
+                    (math.floor(self.min_longitude / cell_width) + column + 0.5) * cell_width
+                )
+                prefixes.add(encode_geohash(max(-90.0, latitude), max(-180.0, longitude), precision))
+        return sorted(prefixes)
\ No newline at end of file
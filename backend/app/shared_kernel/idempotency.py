@@ -0,0 +1,390 @@
+import hashlib
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+from sqlalchemy import Column, DateTime, Index, Integer, LargeBinary, String, delete, update
+from starlette.routing import compile_path
+
+from .config import config
+from .database import AsyncSessionLocal, Base, upsert
+from .instrumentation import current_span
+
+# À passer en openapi_extra des routes qui modifient l'état : seules celles-ci honorent Idempotency-Key,
+# les POST de lecture (batchGet...) ne réservent ni ne stockent de réponse. Le drapeau apparaît dans l'OpenAPI
+IDEMPOTENT_ROUTE = {"x-idempotent": True}
+
+
+class ClaimOutcome(Enum):
+    NEW = "new"
+    REPLAY = "replay"
+    IN_PROGRESS = "in_progress"
+    MISMATCH = "mismatch"
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    status_code: int
+    content_type: Optional[str]
+    body: bytes
+
+
+@dataclass
+class IdempotencyStats:
+    hits: int = 0
+    misses: int = 0
+    in_progress: int = 0
+    mismatches: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses + self.in_progress + self.mismatches
+        return self.hits / lookups if lookups else 0.0
+    
+    def record(self, outcome: ClaimOutcome) -> None:
+        if outcome is ClaimOutcome.NEW:
+            self.misses += 1
+        elif outcome is ClaimOutcome.REPLAY:
+            self.hits += 1
+        elif outcome is ClaimOutcome.IN_PROGRESS:
+            self.in_progress += 1
+        else:
+            self.mismatches += 1
+    
+    def as_dict(self) -> Dict[str, float]:
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+class IdempotencyStore(ABC):
+    def __init__(self, ttl_seconds: float, lease_seconds: float):
+        self.stats = IdempotencyStats()
+        self._ttl_seconds = ttl_seconds
+        self._lease_seconds = lease_seconds
+    
+    async def claim(self, key: str, fingerprint: bytes) -> Tuple[ClaimOutcome, Optional[StoredResponse]]:
+        outcome, response = await self._claim(key, fingerprint)
+        self.stats.record(outcome)
+        return outcome, response
+    
+    @abstractmethod
+    async def _claim(self, key: str, fingerprint: bytes) -> Tuple[ClaimOutcome, Optional[StoredResponse]]:
+        pass
+    
+    @abstractmethod
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        pass
+    
+    @abstractmethod
+    async def release(self, key: str) -> None:
+        pass
+    
+    def describe(self) -> Dict[str, object]:
+        return {
+            "backend": type(self).__name__,
+            **self.stats.as_dict(),
+            "ttl_seconds": self._ttl_seconds,
+            "lease_seconds": self._lease_seconds,
+        }
+    
+    def _decide(self, fingerprint: bytes, stored_fingerprint: bytes, response: Optional[StoredResponse]):
+        if stored_fingerprint != fingerprint:
+            return ClaimOutcome.MISMATCH, None
+        if response is None:
+            return ClaimOutcome.IN_PROGRESS, None
+        return ClaimOutcome.REPLAY, response
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    # Une entrée = (échéance, empreinte du corps, réponse) ; sans réponse, la clé est réservée
+    # par une requête en cours et l'échéance est celle du bail, pas du TTL
+    def __init__(self, max_entries: int = 100_000, ttl_seconds: float = 86_400.0, lease_seconds: float = 30.0):
+        super().__init__(ttl_seconds, lease_seconds)
+        self._entries: "OrderedDict[str, Tuple[float, bytes, Optional[StoredResponse]]]" = OrderedDict()
+        self._max_entries = max_entries
+    
+    async def _claim(self, key: str, fingerprint: bytes) -> Tuple[ClaimOutcome, Optional[StoredResponse]]:
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= now:
+            del self._entries[key]
+            self.stats.expirations += 1
+            entry = None
+        
+        if entry is not None:
+            return self._decide(fingerprint, entry[1], entry[2])
+        
+        self._entries[key] = (now + self._lease_seconds, fingerprint, None)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+        return ClaimOutcome.NEW, None
+    
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, entry[1], response)
+    
+    async def release(self, key: str) -> None:
+        self._entries.pop(key, None)
+    
+    def describe(self) -> Dict[str, object]:
+        return {**super().describe(), "entries": len(self._entries), "max_entries": self._max_entries}
+
+
+class IdempotencyKeyModel(Base):
+    __tablename__ = "idempotency_keys"
+    
+    key = Column(String(32), primary_key=True)
+    fingerprint = Column(LargeBinary(16), nullable=False)
+    status_code = Column(Integer, nullable=True)
+    content_type = Column(String, nullable=True)
+    body = Column(LargeBinary, nullable=True)
+    expires_at = Column(DateTime, nullable=False)
+    
+    __table_args__ = (
+        Index("ix_idempotency_keys_expires_at", "expires_at"),
+    )
+
+
+class DatabaseIdempotencyStore(IdempotencyStore):
+    # Partagé entre workers et instances ; les clés expirées sont purgées par lots toutes
+    # les purge_every réservations plutôt qu'à chaque requête
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        ttl_seconds: float = 86_400.0,
+        lease_seconds: float = 30.0,
+        purge_every: int = 1000
+    ):
+        super().__init__(ttl_seconds, lease_seconds)
+        self._session_factory = session_factory
+        self._purge_every = purge_every
+        self._claims = 0
+    
+    async def _claim(self, key: str, fingerprint: bytes) -> Tuple[ClaimOutcome, Optional[StoredResponse]]:
+        # Une seule instruction pour le cas courant : la réservation est insérée, ou reprend
+        # une clé expirée ; sinon la clé existe encore et on relit son état
+        now = datetime.now()
+        async with self._session_factory() as db:
+            statement = upsert(db, IdempotencyKeyModel).values(
+                key=key,
+                fingerprint=fingerprint,
+                expires_at=now + timedelta(seconds=self._lease_seconds)
+            )
+            statement = statement.on_conflict_do_update(
+                index_elements=[IdempotencyKeyModel.key],
+                set_={
+                    "fingerprint": statement.excluded.fingerprint,
+                    "status_code": None,
+                    "content_type": None,
+                    "body": None,
+                    "expires_at": statement.excluded.expires_at,
+                },
+                where=IdempotencyKeyModel.expires_at <= now
+            )
+            result = await db.execute(statement)
+            await db.commit()
+            
+            if result.rowcount == 0:
+                row = await db.get(IdempotencyKeyModel, key)
+                if row is None:
+                    return ClaimOutcome.IN_PROGRESS, None
+                return self._decide(fingerprint, row.fingerprint, self._to_response(row))
+        
+        self._claims += 1
+        if self._claims % self._purge_every == 0:
+            await self.purge_expired()
+        return ClaimOutcome.NEW, None
+    
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        async with self._session_factory() as db:
+            await db.execute(
+                update(IdempotencyKeyModel)
+                .where(IdempotencyKeyModel.key == key)
+                .values(
+                    status_code=response.status_code,
+                    content_type=response.content_type,
+                    body=response.body,
+                    expires_at=datetime.now() + timedelta(seconds=self._ttl_seconds)
+                )
+            )
+            await db.commit()
+    
+    async def release(self, key: str) -> None:
+        async with self._session_factory() as db:
+            await db.execute(
+                delete(IdempotencyKeyModel).where(
+                    IdempotencyKeyModel.key == key,
+                    IdempotencyKeyModel.status_code.is_(None)
+                )
+            )
+            await db.commit()
+    
+    async def purge_expired(self) -> int:
+        async with self._session_factory() as db:
+            result = await db.execute(
+                delete(IdempotencyKeyModel).where(IdempotencyKeyModel.expires_at <= datetime.now())
+            )
+            await db.commit()
+        self.stats.evictions += result.rowcount
+        return result.rowcount
+    
+    def _to_response(self, row: IdempotencyKeyModel) -> Optional[StoredResponse]:
+        if row.status_code is None:
+            return None
+        return StoredResponse(status_code=row.status_code, content_type=row.content_type, body=row.body)
+
+
+class NullIdempotencyStore(IdempotencyStore):
+    def __init__(self):
+        super().__init__(0.0, 0.0)
+    
+    async def _claim(self, key: str, fingerprint: bytes) -> Tuple[ClaimOutcome, Optional[StoredResponse]]:
+        return ClaimOutcome.NEW, None
+    
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        pass
+    
+    async def release(self, key: str) -> None:
+        pass
+
+
+def create_idempotency_store() -> IdempotencyStore:
+    if config.idempotency_backend == "none":
+        return NullIdempotencyStore()
+    if config.idempotency_backend == "database":
+        return DatabaseIdempotencyStore(
+            ttl_seconds=config.idempotency_ttl_seconds,
+            lease_seconds=config.idempotency_lease_seconds,
+        )
+    return InMemoryIdempotencyStore(
+        max_entries=config.idempotency_max_entries,
+        ttl_seconds=config.idempotency_ttl_seconds,
+        lease_seconds=config.idempotency_lease_seconds,
+    )
+
+
+class IdempotencyMiddleware:
+    # Les requêtes rejouées (même clé, même méthode, même chemin, même corps) reçoivent la
+    # réponse enregistrée sans atteindre la route : ni service applicatif ni accès à la base métier.
+    # Seules les réponses 2xx sont conservées ; un échec libère la clé pour que le client réessaie.
+    # Les routes concernées sont lues dans le schéma OpenAPI (drapeau IDEMPOTENT_ROUTE) au premier appel
+    def __init__(self, app, store: IdempotencyStore, openapi: Callable[[], Dict[str, Any]], max_key_length: int = 255):
+        self.app = app
+        self._store = store
+        self._openapi = openapi
+        self._operations: Optional[List[Tuple[str, Pattern[str]]]] = None
+        self._max_key_length = max_key_length
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in ("GET", "HEAD", "OPTIONS"):
+            await self.app(scope, receive, send)
+            return
+        
+        client_key = next((value for name, value in scope["headers"] if name == b"idempotency-key"), None)
+        if client_key is None or not self._is_idempotent_route(scope):
+            await self.app(scope, receive, send)
+            return
+        if not client_key or len(client_key) > self._max_key_length:
+            await self._send_error(send, 400, "Idempotency-Key must be between 1 and 255 characters")
+            return
+        
+        body = await self._read_body(receive)
+        key = _digest(scope["method"].encode(), scope["path"].encode(), scope["query_string"], client_key).hex()
+        outcome, stored = await self._store.claim(key, _digest(body))
+        
+        if outcome is ClaimOutcome.REPLAY:
+            span = current_span.get()
+            if span is not None:
+                span.route = "idempotent_replay"
+            await self._send(send, stored, [(b"idempotent-replayed", b"true")])
+            return
+        if outcome is ClaimOutcome.IN_PROGRESS:
+            await self._send_error(send, 409, "A request with this Idempotency-Key is still being processed", retry_after=True)
+            return
+        if outcome is ClaimOutcome.MISMATCH:
+            await self._send_error(send, 422, "Idempotency-Key was already used with a different request body")
+            return
+        
+        await self._forward(scope, body, receive, send, key)
+    
+    def _is_idempotent_route(self, scope) -> bool:
+        # Résolu uniquement pour les requêtes portant une clé ; le schéma est généré une fois, après l'inclusion des routeurs
+        if self._operations is None:
+            self._operations = [
+                (method.upper(), compile_path(path)[0])
+                for path, operations in self._openapi().get("paths", {}).items()
+                for method, operation in operations.items()
+                if operation.get("x-idempotent")
+            ]
+        return any(method == scope["method"] and pattern.match(scope["path"]) for method, pattern in self._operations)
+    
+    async def _forward(self, scope, body: bytes, receive, send, key: str) -> None:
+        body_sent = False
+        status_code = 500
+        content_type = None
+        chunks = []
+        
+        async def replay_body():
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        
+        async def capture(message):
+            nonlocal status_code, content_type
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                content_type = next(
+                    (value.decode("latin-1") for name, value in message.get("headers", []) if name == b"content-type"),
+                    None
+                )
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+        
+        try:
+            await self.app(scope, replay_body, capture)
+        except BaseException:
+            await self._store.release(key)
+            raise
+        
+        if 200 <= status_code < 300:
+            await self._store.complete(key, StoredResponse(status_code, content_type, b"".join(chunks)))
+        else:
+            await self._store.release(key)
+    
+    async def _read_body(self, receive) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                return b"".join(chunks)
+    
+    async def _send(self, send, response: StoredResponse, extra_headers: list) -> None:
+        headers = [(b"content-length", str(len(response.body)).encode())]
+        if response.content_type is not None:
+            headers.append((b"content-type", response.content_type.encode("latin-1")))
+        await send({"type": "http.response.start", "status": response.status_code, "headers": headers + extra_headers})
+        await send({"type": "http.response.body", "body": response.body})
+    
+    async def _send_error(self, send, status_code: int, detail: str, retry_after: bool = False) -> None:
+        extra_headers = [(b"retry-after", b"1")] if retry_after else []
+        await self._send(send, StoredResponse(status_code, "application/json", json.dumps({"detail": detail}).encode()), extra_headers)
+
+
+def _digest(*parts: bytes) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(len(part).to_bytes(4, "big"))
+        digest.update(part)
+    return digest.digest()
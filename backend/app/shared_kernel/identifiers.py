@@ -0,0 +1,46 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from uuid import UUID, uuid4
+
+
+class IdGenerator(ABC):
+    @abstractmethod
+    def new_id(self) -> UUID:
+        pass
+
+
+class RandomIdGenerator(IdGenerator):
+    def new_id(self) -> UUID:
+        return uuid4()
+
+
+class TimeOrderedIdGenerator(IdGenerator):
+    # UUIDv7 (RFC 9562) : 48 bits de timestamp Unix en ms, puis un compteur de 12 bits
+    # (rand_a) qui garantit l'ordre croissant des IDs générés dans la même milliseconde
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._counter = 0
+    
+    def new_id(self) -> UUID:
+        with self._lock:
+            timestamp_ms = time.time_ns() // 1_000_000
+            if timestamp_ms > self._last_ms:
+                self._last_ms = timestamp_ms
+                self._counter = int.from_bytes(os.urandom(2)) & 0x3FF
+            else:
+                self._counter += 1
+                if self._counter > 0xFFF:
+                    self._last_ms += 1
+                    self._counter = 0
+            timestamp_ms = self._last_ms
+            counter = self._counter
+        
+        rand_b = int.from_bytes(os.urandom(8)) & 0x3FFF_FFFF_FFFF_FFFF
+        value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | 0x7 << 76 | counter << 64 | 0b10 << 62 | rand_b
+        return UUID(int=value)
+
+
+id_generator: IdGenerator = TimeOrderedIdGenerator()
\ No newline at end of file
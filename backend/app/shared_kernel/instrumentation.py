@@ -0,0 +1,222 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .metrics import LatencyHistogram
+
+slow_request_logger = logging.getLogger("sustaain.slow_requests")
+
+
+@dataclass(slots=True)
+class RequestSpan:
+    method: str
+    path: str
+    route: str = "unmatched"
+    status: int = 500
+    total_s: float = 0.0
+    sql_statements: int = 0
+    db_s: float = 0.0
+    rows: int = 0
+    serialization_s: float = 0.0
+    
+    @property
+    def application_s(self) -> float:
+        # Hydratation du domaine, logique métier et framework : tout ce qui n'est ni SQL ni encodage
+        return max(0.0, self.total_s - self.db_s - self.serialization_s)
+
+
+current_span: ContextVar[Optional[RequestSpan]] = ContextVar("current_span", default=None)
+
+
+class RouteMetrics:
+    __slots__ = ("duration", "db_duration", "responses", "sql_statements", "db_seconds", "rows", "serialization_seconds")
+    
+    def __init__(self):
+        self.duration = LatencyHistogram()
+        self.db_duration = LatencyHistogram()
+        self.responses: Dict[int, int] = {}
+        self.sql_statements = 0
+        self.db_seconds = 0.0
+        self.rows = 0
+        self.serialization_seconds = 0.0
+
+
+class RequestMetrics:
+    def __init__(self):
+        self._routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, span: RequestSpan) -> None:
+        key = (span.method, span.route)
+        metrics = self._routes.get(key)
+        if metrics is None:
+            with self._lock:
+                metrics = self._routes.setdefault(key, RouteMetrics())
+        
+        metrics.duration.observe(span.total_s)
+        metrics.db_duration.observe(span.db_s)
+        with self._lock:
+            metrics.responses[span.status] = metrics.responses.get(span.status, 0) + 1
+            metrics.sql_statements += span.sql_statements
+            metrics.db_seconds += span.db_s
+            metrics.rows += span.rows
+            metrics.serialization_seconds += span.serialization_s
+    
+    def routes(self) -> List[Tuple[Tuple[str, str], RouteMetrics]]:
+        with self._lock:
+            return sorted(self._routes.items())
+
+
+request_metrics = RequestMetrics()
+
+
+@contextmanager
+def measure_serialization() -> Iterator[None]:
+    span = current_span.get()
+    if span is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        span.serialization_s += time.perf_counter() - start
+
+
+def instrument_sql(engine: Engine) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if current_span.get() is not None:
+            conn.info.setdefault("query_start", []).append(time.perf_counter())
+    
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        span = current_span.get()
+        starts = conn.info.get("query_start")
+        if span is None or not starts:
+            return
+        span.db_s += time.perf_counter() - starts.pop()
+        span.sql_statements += 1
+        # rowcount DB-API uniquement : renseigné pour les SELECT par asyncpg et psycopg2, -1 (non compté)
+        # pour les SELECT SQLite, qui ne connaît le nombre de lignes qu'après les avoir toutes lues
+        if cursor.rowcount >= 0:
+            span.rows += cursor.rowcount
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, app, metrics: RequestMetrics = request_metrics, slow_request_ms: float = 0.0):
+        self.app = app
+        self._metrics = metrics
+        self._slow_request_s = slow_request_ms / 1000
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("warmup"):
+            await self.app(scope, receive, send)
+            return
+        
+        span = RequestSpan(method=scope["method"], path=scope["path"])
+        token = current_span.set(span)
+        
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                span.status = message["status"]
+            await send(message)
+        
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            span.total_s = time.perf_counter() - start
+            current_span.reset(token)
+            route = scope.get("route")
+            if route is not None:
+                span.route = _route_template(scope["path"], route.path_format)
+            self._metrics.record(span)
+            if self._slow_request_s and span.total_s >= self._slow_request_s:
+                slow_request_logger.warning(
+                    "slow request %s %s status=%d total_ms=%.1f db_ms=%.1f sql=%d rows=%d "
+                    "serialization_ms=%.1f application_ms=%.1f",
+                    span.method, span.path, span.status, span.total_s * 1000, span.db_s * 1000,
+                    span.sql_statements, span.rows, span.serialization_s * 1000, span.application_s * 1000
+                )
+
+
+def render_prometheus(
+    metrics: RequestMetrics,
+    pools: Dict[str, Dict[str, object]],
+    idempotency: Optional[Dict[str, object]] = None
+) -> str:
+    lines = []
+    routes = metrics.routes()
+    
+    def histogram(name: str, help_text: str, select) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for (method, route), route_metrics in routes:
+            labels = f'method="{method}",route="{_escape(route)}"'
+            buckets, count, sum_ms = select(route_metrics).cumulative()
+            for bound, total in buckets:
+                le = "+Inf" if bound == float("inf") else f"{bound / 1000:g}"
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {total}')
+            lines.append(f"{name}_sum{{{labels}}} {sum_ms / 1000}")
+            lines.append(f"{name}_count{{{labels}}} {count}")
+    
+    def counter(name: str, help_text: str, select) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for (method, route), route_metrics in routes:
+            lines.append(f'{name}{{method="{method}",route="{_escape(route)}"}} {select(route_metrics)}')
+    
+    histogram("http_request_duration_seconds", "Durée totale des requêtes HTTP", lambda m: m.duration)
+    histogram("http_request_db_duration_seconds", "Temps passé en base par requête HTTP", lambda m: m.db_duration)
+    
+    lines.append("# HELP http_requests_total Requêtes HTTP par code de statut")
+    lines.append("# TYPE http_requests_total counter")
+    for (method, route), route_metrics in routes:
+        for status, total in sorted(route_metrics.responses.items()):
+            lines.append(f'http_requests_total{{method="{method}",route="{_escape(route)}",status="{status}"}} {total}')
+    
+    counter("http_request_sql_statements_total", "Instructions SQL exécutées", lambda m: m.sql_statements)
+    counter("http_request_db_seconds_total", "Temps SQL cumulé", lambda m: m.db_seconds)
+    counter("http_request_rows_total", "Lignes renvoyées ou modifiées selon le rowcount du pilote", lambda m: m.rows)
+    counter("http_request_serialization_seconds_total", "Temps d'encodage JSON cumulé", lambda m: m.serialization_seconds)
+    
+    for name, key, help_text in (
+        ("db_pool_checked_out", "checked_out", "Connexions empruntées au pool"),
+        ("db_pool_overflow", "overflow", "Connexions ouvertes au-delà de la taille du pool"),
+        ("db_pool_size", "size", "Taille configurée du pool"),
+    ):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        for engine_name, statistics in pools.items():
+            lines.append(f'{name}{{engine="{engine_name}"}} {statistics[key]}')
+    
+    if idempotency is not None:
+        lines.append("# HELP idempotency_requests_total Requêtes portant un Idempotency-Key, par issue")
+        lines.append("# TYPE idempotency_requests_total counter")
+        for outcome in ("hits", "misses", "in_progress", "mismatches"):
+            lines.append(f'idempotency_requests_total{{outcome="{outcome}"}} {idempotency[outcome]}')
+        lines.append("# HELP idempotency_hit_rate Part des requêtes dédupliquées par rejeu de la réponse enregistrée")
+        lines.append("# TYPE idempotency_hit_rate gauge")
+        lines.append(f"idempotency_hit_rate {idempotency['hit_rate']}")
+    
+    return "\n".join(lines) + "\n"
+
+
+def _route_template(path: str, path_format: str) -> str:
+    # Gabarit de la route (et non le chemin brut) pour borner la cardinalité des séries ;
+    # selon la version de FastAPI, le préfixe d'include_router n'y figure pas : on le reprend du chemin
+    static_head = path_format.split("{", 1)[0]
+    prefix_end = path.find(static_head)
+    return path[:prefix_end] + path_format if prefix_end > 0 else path_format
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
\ No newline at end of file
@@ -0,0 +1,54 @@
+import math
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+DEFAULT_LATENCY_BUCKETS_MS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0)
+
+
+class LatencyHistogram:
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS):
+        self._bounds = tuple(sorted(buckets_ms))
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+        # Alimenté depuis le thread de l'application et depuis les threads du moteur synchrone
+        self._lock = threading.Lock()
+    
+    @property
+    def bounds_ms(self) -> tuple:
+        return self._bounds
+    
+    def observe(self, seconds: float) -> None:
+        elapsed_ms = seconds * 1000
+        index = bisect_left(self._bounds, elapsed_ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum_ms += elapsed_ms
+            if elapsed_ms > self._max_ms:
+                self._max_ms = elapsed_ms
+    
+    def cumulative(self) -> Tuple[List[Tuple[float, int]], int, float]:
+        with self._lock:
+            counts = list(self._counts)
+            count = self._count
+            sum_ms = self._sum_ms
+        
+        buckets = []
+        running = 0
+        for bound, bucket_count in zip(self._bounds + (math.inf,), counts):
+            running += bucket_count
+            buckets.append((bound, running))
+        return buckets, count, sum_ms
+    
+    def snapshot(self) -> Dict[str, object]:
+        buckets, count, sum_ms = self.cumulative()
+        return {
+            "count": count,
+            "sum_ms": round(sum_ms, 3),
+            "mean_ms": round(sum_ms / count, 3) if count else 0.0,
+            "max_ms": round(self._max_ms, 3),
+            "buckets_ms": {"+Inf" if math.isinf(bound) else f"{bound:g}": total for bound, total in buckets},
+        }
\ No newline at end of file
@@ -0,0 +1,111 @@
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from .metrics import LatencyHistogram
+
+class PoolMetrics:
+    def __init__(self):
+        self.wait_time = LatencyHistogram()
+        self.checkout_latency = LatencyHistogram()
+        self.connections_opened = 0
+        self.pings = 0
+        self.ping_failures = 0
+        self._lock = threading.Lock()
+    
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+class InstrumentedPoolMixin:
+    # wait_time : attente d'une connexion libre dans la file (ou ouverture d'une nouvelle)
+    # checkout_latency : wait_time + événements de checkout, dont le ping éventuel
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+    
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            self.metrics.checkout_latency.observe(time.perf_counter() - start)
+    
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.metrics.wait_time.observe(time.perf_counter() - start)
+    
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_engine(engine: Engine, pre_ping: str, idle_seconds: float) -> None:
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+        _metrics(engine).increment("connections_opened")
+    
+    if pre_ping != "idle":
+        return
+    
+    # Ping uniquement des connexions restées inactives plus de idle_seconds : les connexions
+    # chaudes d'un pool chargé sont rendues sans aller-retour supplémentaire
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+    
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at", 0.0)
+        if time.monotonic() - checked_in_at < idle_seconds:
+            return
+        
+        metrics = _metrics(engine)
+        metrics.increment("pings")
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            metrics.increment("ping_failures")
+            # Le pool invalide la connexion et retente le checkout avec une nouvelle
+            raise DisconnectionError() from e
+
+
+def pool_statistics(engine: Engine) -> Dict[str, object]:
+    pool = engine.pool
+    metrics = _metrics(engine)
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(0, pool.overflow()),
+        "timeout_s": pool.timeout(),
+        "connections_opened": metrics.connections_opened,
+        "pings": metrics.pings,
+        "ping_failures": metrics.ping_failures,
+        "wait_time": metrics.wait_time.snapshot(),
+        "checkout_latency": metrics.checkout_latency.snapshot(),
+    }
+
+
+def _metrics(engine: Engine) -> PoolMetrics:
+    return engine.pool.metrics
\ No newline at end of file
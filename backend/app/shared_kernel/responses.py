@@ -0,0 +1,16 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+from .instrumentation import measure_serialization
+
+
+class SchemaResponse(JSONResponse):
+    # Encodage JSON en une seule passe (pydantic-core, en Rust) : les schémas Pydantic et les
+    # objets déjà encodés (bytes) sont émis tels quels, sans repasser par jsonable_encoder
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        with measure_serialization():
+            return to_json(content)
\ No newline at end of file
@@ -0,0 +1,101 @@
+import asyncio
+import json
+import logging
+import time
+from contextlib import AsyncExitStack
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import configure_mappers
+
+startup_logger = logging.getLogger("sustaain.startup")
+
+# (méthode, chemin, query string, corps JSON)
+WarmupRequest = Tuple[str, str, str, Optional[Dict[str, Any]]]
+
+
+@dataclass
+class WarmupReport:
+    pool_connections: int = 0
+    pool_ms: float = 0.0
+    mappers_ms: float = 0.0
+    requests_ms: float = 0.0
+    responses: Dict[str, int] = field(default_factory=dict)
+    
+    def as_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+
+async def warm_pool(engine: AsyncEngine, connections: int) -> int:
+    # Les connexions sont ouvertes simultanément puis rendues : le pool garde ensuite `connections` connexions prêtes
+    async with AsyncExitStack() as stack:
+        opened = await asyncio.gather(*(stack.enter_async_context(engine.connect()) for _ in range(connections)))
+        for connection in opened:
+            await connection.execute(text("SELECT 1"))
+    return len(opened)
+
+
+async def call_app(app, method: str, path: str, query: str = "", body: Optional[Dict[str, Any]] = None) -> int:
+    # Requête interne sans passer par le serveur : toute la pile ASGI (middlewares, routage, dépendances,
+    # validation, sérialisation, SQL) est exercée. "warmup" exclut la requête des métriques
+    payload = json.dumps(body).encode() if body is not None else b""
+    headers = [(b"host", b"warmup")]
+    if body is not None:
+        headers += [(b"content-type", b"application/json"), (b"content-length", str(len(payload)).encode())]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": headers,
+        "client": None,
+        "server": None,
+        "warmup": True,
+    }
+    status = 500
+    sent = False
+    
+    async def receive():
+        nonlocal sent
+        if sent:
+            return {"type": "http.disconnect"}
+        sent = True
+        return {"type": "http.request", "body": payload, "more_body": False}
+    
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+    
+    await app(scope, receive, send)
+    return status
+
+
+async def warm_up(app, engine: AsyncEngine, pool_connections: int, requests: List[WarmupRequest]) -> WarmupReport:
+    report = WarmupReport()
+    
+    start = time.perf_counter()
+    report.pool_connections = await warm_pool(engine, pool_connections)
+    report.pool_ms = round((time.perf_counter() - start) * 1000, 3)
+    
+    start = time.perf_counter()
+    configure_mappers()
+    report.mappers_ms = round((time.perf_counter() - start) * 1000, 3)
+    
+    start = time.perf_counter()
+    for method, path, query, body in requests:
+        try:
+            report.responses[f"{method} {path}"] = await call_app(app, method, path, query, body)
+        except Exception:
+            # Un échec de préchauffage ne doit pas empêcher le worker de démarrer
+            startup_logger.exception("warm-up request %s %s failed", method, path)
+            report.responses[f"{method} {path}"] = 500
+    report.requests_ms = round((time.perf_counter() - start) * 1000, 3)
+    return report
\ No newline at end of file
@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Awaitable, Callable, Deque, Dict, Generic, List, Optional, Sequence, TypeVar
+
+from .metrics import LatencyHistogram
+
+ingestion_logger = logging.getLogger("sustaain.ingestion")
+
+T = TypeVar("T")
+
+
+@dataclass
+class WriteBehindStats:
+    enqueued: int = 0
+    rejected: int = 0
+    flushes: int = 0
+    flushed: int = 0
+    failed: int = 0
+    max_depth: int = 0
+    outcomes: Dict[str, int] = field(default_factory=dict)
+    
+    def as_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+
+class WriteBehindQueue(Generic[T]):
+    # File bornée en mémoire vidée par un seul worker en micro-lots : un lot part dès qu'il atteint
+    # batch_size ou après flush_interval_s. Quand la file est pleine, put_many attend une place
+    # au plus enqueue_timeout_s puis refuse (pression arrière vers le client)
+    def __init__(
+        self,
+        flush: Callable[[List[T]], Awaitable[Optional[Dict[str, int]]]],
+        max_size: int = 10_000,
+        batch_size: int = 500,
+        flush_interval_s: float = 0.05,
+        enqueue_timeout_s: float = 0.1
+    ):
+        self.stats = WriteBehindStats()
+        self.flush_latency = LatencyHistogram()
+        self._flush = flush
+        self._max_size = max_size
+        self._batch_size = batch_size
+        self._flush_interval_s = flush_interval_s
+        self._enqueue_timeout_s = enqueue_timeout_s
+        self._items: Deque[T] = deque()
+        self._changed: Optional[asyncio.Condition] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._stopping = False
+    
+    @property
+    def depth(self) -> int:
+        return len(self._items)
+    
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+    
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._changed = asyncio.Condition()
+        self._stopping = False
+        self._worker = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        # Arrêt propre : plus de nouvelles entrées, le worker vide la file avant de rendre la main
+        if not self.running:
+            return
+        async with self._changed:
+            self._stopping = True
+            self._changed.notify_all()
+        await self._worker
+        self._worker = None
+    
+    async def put_many(self, items: Sequence[T]) -> bool:
+        # Tout ou rien : une requête n'est jamais acceptée à moitié
+        if not self.running or self._stopping or len(items) > self._max_size:
+            self.stats.rejected += len(items)
+            return False
+        
+        async with self._changed:
+            try:
+                await asyncio.wait_for(
+                    self._changed.wait_for(lambda: len(self._items) + len(items) <= self._max_size),
+                    self._enqueue_timeout_s
+                )
+            except asyncio.TimeoutError:
+                self.stats.rejected += len(items)
+                return False
+            
+            self._items.extend(items)
+            self.stats.enqueued += len(items)
+            self.stats.max_depth = max(self.stats.max_depth, len(self._items))
+            self._changed.notify_all()
+        return True
+    
+    def describe(self) -> Dict[str, object]:
+        return {
+            "running": self.running,
+            "depth": self.depth,
+            "max_size": self._max_size,
+            "batch_size": self._batch_size,
+            "flush_interval_s": self._flush_interval_s,
+            **self.stats.as_dict(),
+            "flush_latency": self.flush_latency.snapshot(),
+        }
+    
+    async def _run(self) -> None:
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: self._items or self._stopping)
+                if not self._items:
+                    return
+                if len(self._items) < self._batch_size and not self._stopping:
+                    try:
+                        await asyncio.wait_for(
+                            self._changed.wait_for(lambda: len(self._items) >= self._batch_size or self._stopping),
+                            self._flush_interval_s
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+                batch = [self._items.popleft() for _ in range(min(self._batch_size, len(self._items)))]
+                self._changed.notify_all()
+            
+            await self._flush_batch(batch)
+    
+    async def _flush_batch(self, batch: List[T]) -> None:
+        start = time.perf_counter()
+        try:
+            outcomes = await self._flush(batch)
+        except Exception:
+            # Le worker ne doit pas mourir : le lot est perdu, journalisé et compté
+            self.stats.failed += len(batch)
+            ingestion_logger.exception("write-behind flush of %d items failed", len(batch))
+            return
+        finally:
+            self.flush_latency.observe(time.perf_counter() - start)
+        
+        self.stats.flushes += 1
+        self.stats.flushed += len(batch)
+        for outcome, total in (outcomes or {}).items():
+            self.stats.outcomes[outcome] = self.stats.outcomes.get(outcome, 0) + total
\ No newline at end of file
@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from app.shared_kernel import BusinessRuleViolation, CacheBackend, NotFoundError
+from app.traceability.application.RetrieveBatchService import batch_cache_key
+from app.traceability.domain import BatchStatus, BatchTransition
+from app.traceability.domain.CocoaBatchRepositoryInterface import CocoaBatchRepositoryInterface
+
+
+@dataclass(frozen=True)
+class BatchTransitionResult:
+    batch_id: UUID
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TransitionedBatch:
+    id: UUID
+    status: BatchStatus
+    action: str
+    timestamp: datetime
+
+
+class BatchTransitionService:
+    def __init__(self, repository: CocoaBatchRepositoryInterface, cache: Optional[CacheBackend] = None):
+        self._repository = repository
+        self._cache = cache
+    
+    async def _transition_one(self, batch_id: UUID, transition: BatchTransition) -> TransitionedBatch:
+        timestamp = datetime.now()
+        if not await self._repository.apply_transition([batch_id], transition, timestamp):
+            if not await self._repository.find_statuses([batch_id]):
+                raise NotFoundError(
+                    f"Batch {batch_id} not found", code="BATCH_NOT_FOUND", details={"batch_id": str(batch_id)}
+                )
+            raise BusinessRuleViolation(
+                transition.rejection, code="ILLEGAL_TRANSITION", details={"batch_id": str(batch_id)}
+            )
+        
+        if self._cache is not None:
+            await self._cache.delete(batch_cache_key(batch_id))
+        # L'UPDATE gardé suffit à connaître le résultat : pas de relecture du lot
+        return TransitionedBatch(id=batch_id, status=transition.to_status, action=transition.action, timestamp=timestamp)
+    
+    async def _transition_many(self, batch_ids: List[UUID], transition: BatchTransition) -> List[BatchTransitionResult]:
+        transitioned = set(await self._repository.apply_transition(batch_ids, transition, datetime.now()))
+        
+        rejected = [batch_id for batch_id in batch_ids if batch_id not in transitioned]
+        statuses = await self._repository.find_statuses(rejected)
+        
+        if self._cache is not None:
+            for batch_id in transitioned:
+                await self._cache.delete(batch_cache_key(batch_id))
+        
+        return [
+            BatchTransitionResult(batch_id=batch_id)
+            if batch_id in transitioned
+            else BatchTransitionResult(
+                batch_id=batch_id,
+                error=transition.rejection if batch_id in statuses else f"Batch {batch_id} not found"
+            )
+            for batch_id in batch_ids
+        ]
\ No newline at end of file
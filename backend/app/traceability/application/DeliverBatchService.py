@@ -0,0 +1,17 @@
+from typing import List
+from uuid import UUID
+
+from app.traceability.application.BatchTransitionService import (
+    BatchTransitionResult,
+    BatchTransitionService,
+    TransitionedBatch,
+)
+from app.traceability.domain import BatchTransition
+
+
+class DeliverBatchService(BatchTransitionService):
+    async def execute(self, batch_id: UUID) -> TransitionedBatch:
+        return await self._transition_one(batch_id, BatchTransition.delivery())
+    
+    async def execute_many(self, batch_ids: List[UUID]) -> List[BatchTransitionResult]:
+        return await self._transition_many(batch_ids, BatchTransition.delivery())
\ No newline at end of file
@@ -0,0 +1,51 @@
+import csv
+import io
+import json
+from typing import AsyncIterator
+from uuid import UUID
+
+from app.traceability.domain.CocoaBatchRepositoryInterface import CocoaBatchRepositoryInterface
+
+EXPORT_COLUMNS = [
+    "id",
+    "producer_id",
+    "quantity",
+    "harvest_date",
+    "status",
+    "latitude",
+    "longitude",
+    "region",
+    "country",
+]
+
+
+class ExportBatchesService:
+    def __init__(self, repository: CocoaBatchRepositoryInterface, chunk_size: int = 1000):
+        self._repository = repository
+        self._chunk_size = chunk_size
+    
+    async def export_ndjson(self, producer_id: UUID) -> AsyncIterator[bytes]:
+        async for rows in self._repository.stream_by_producer(producer_id, self._chunk_size):
+            yield "".join(
+                json.dumps({column: self._format(row[column]) for column in EXPORT_COLUMNS}) + "\n"
+                for row in rows
+            ).encode()
+    
+    async def export_csv(self, producer_id: UUID) -> AsyncIterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        yield buffer.getvalue().encode()
+        
+        async for rows in self._repository.stream_by_producer(producer_id, self._chunk_size):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([self._format(row[column]) for column in EXPORT_COLUMNS] for row in rows)
+            yield buffer.getvalue().encode()
+    
+    def _format(self, value):
+        if isinstance(value, UUID):
+            return str(value)
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        return value
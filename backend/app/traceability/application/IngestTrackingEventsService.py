@@ -0,0 +1,125 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from app.shared_kernel import CacheBackend
+from app.traceability.application.RetrieveBatchService import batch_cache_key
+from app.traceability.domain import BatchProjection, CocoaBatch, Location, RouteDistanceCalculator, TransportMode
+from app.traceability.domain.CocoaBatchRepositoryInterface import CocoaBatchRepositoryInterface
+
+MAX_CONFLICT_RETRIES = 2
+
+
+@dataclass(frozen=True)
+class ShipEvent:
+    batch_id: UUID
+    destination: Location
+    transport_mode: TransportMode
+    received_at: datetime
+
+
+@dataclass(frozen=True)
+class ProcessEvent:
+    batch_id: UUID
+    processing_type: str
+    received_at: datetime
+
+
+@dataclass(frozen=True)
+class DeliverEvent:
+    batch_id: UUID
+    received_at: datetime
+
+
+TrackingEvent = ShipEvent | ProcessEvent | DeliverEvent
+
+
+@dataclass(frozen=True)
+class RejectedEvent:
+    event: TrackingEvent
+    reason: str
+    error: str
+
+
+@dataclass
+class IngestionReport:
+    applied: int = 0
+    rejected: List[RejectedEvent] = field(default_factory=list)
+    
+    def outcomes(self) -> Dict[str, int]:
+        return {"applied": self.applied, **Counter(rejection.reason for rejection in self.rejected)}
+
+
+class IngestTrackingEventsService:
+    # Applique un micro-lot d'événements : une lecture pour tous les lots concernés, les événements
+    # d'un même lot rejoués dans l'ordre d'arrivée sur un seul agrégat, puis un UPSERT versionné
+    # unique et un commit. Les lots modifiés entre-temps par l'API synchrone sont relus et rejoués
+    def __init__(
+        self,
+        repository: CocoaBatchRepositoryInterface,
+        cache: Optional[CacheBackend] = None,
+        distances: Optional[RouteDistanceCalculator] = None
+    ):
+        self._repository = repository
+        self._cache = cache
+        self._distances = distances or RouteDistanceCalculator()
+    
+    async def apply(self, events: List[TrackingEvent]) -> IngestionReport:
+        report = IngestionReport()
+        pending: Dict[UUID, List[TrackingEvent]] = {}
+        for event in events:
+            pending.setdefault(event.batch_id, []).append(event)
+        
+        for _ in range(MAX_CONFLICT_RETRIES):
+            batches = {
+                batch.id: batch
+                for batch in await self._repository.find_by_ids(list(pending), projection=BatchProjection.SUMMARY)
+            }
+            
+            changed: List[CocoaBatch] = []
+            applied: Dict[UUID, int] = {}
+            for batch_id, batch_events in pending.items():
+                batch = batches.get(batch_id)
+                if batch is None:
+                    report.rejected += [RejectedEvent(event, "not_found", f"Batch {batch_id} not found") for event in batch_events]
+                    continue
+                for event in batch_events:
+                    try:
+                        self._apply(batch, event)
+                    except ValueError as e:
+                        report.rejected.append(RejectedEvent(event, "invalid_transition", str(e)))
+                        continue
+                    applied[batch_id] = applied.get(batch_id, 0) + 1
+                if batch_id in applied:
+                    changed.append(batch)
+            
+            conflicts = set(await self._repository.save_versioned(changed))
+            report.applied += sum(total for batch_id, total in applied.items() if batch_id not in conflicts)
+            if self._cache is not None:
+                for batch in changed:
+                    if batch.id not in conflicts:
+                        await self._cache.delete(batch_cache_key(batch.id))
+            
+            # Les rejets déjà constatés sur un lot en conflit seront réévalués à la relecture
+            report.rejected = [rejection for rejection in report.rejected if rejection.event.batch_id not in conflicts]
+            pending = {batch_id: pending[batch_id] for batch_id in conflicts}
+            if not pending:
+                break
+        
+        for batch_id, batch_events in pending.items():
+            report.rejected += [
+                RejectedEvent(event, "conflict", f"Batch {batch_id} was modified concurrently")
+                for event in batch_events
+            ]
+        return report
+    
+    def _apply(self, batch: CocoaBatch, event: TrackingEvent) -> None:
+        if isinstance(event, ShipEvent):
+            distance = self._distances.between(batch.current_location, event.destination, event.transport_mode)
+            batch.ship(event.destination, event.transport_mode, distance, event.received_at)
+        elif isinstance(event, ProcessEvent):
+            batch.process(event.processing_type, event.received_at)
+        else:
+            batch.deliver(event.received_at)
\ No newline at end of file
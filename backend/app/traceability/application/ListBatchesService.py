@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from app.shared_kernel import CursorPaginationParams, to_naive_utc
+from app.traceability.domain import BatchStatus, CocoaBatch
+from app.traceability.domain.CocoaBatchRepositoryInterface import CocoaBatchRepositoryInterface
+
+
+class ListBatchesService:
+    def __init__(self, repository: CocoaBatchRepositoryInterface):
+        self._repository = repository
+    
+    async def execute(
+        self,
+        pagination: CursorPaginationParams,
+        producer_id: Optional[UUID] = None,
+        status: Optional[BatchStatus] = None,
+        country: Optional[str] = None
+    ) -> Tuple[List[CocoaBatch], Optional[str]]:
+        after = None
+        cursor = pagination.decode_cursor()
+        if cursor is not None:
+            try:
+                harvest_date, batch_id = cursor
+                after = (to_naive_utc(datetime.fromisoformat(harvest_date)), UUID(batch_id))
+            except (TypeError, ValueError):
+                raise ValueError("Invalid pagination cursor")
+        
+        batches = await self._repository.find_page(
+            producer_id=producer_id,
+            status=status,
+            country=country,
+            after=after,
+            limit=pagination.limit + 1
+        )
+        
+        if len(batches) <= pagination.limit:
+            return batches, None
+        
+        batches = batches[:pagination.limit]
+        last = batches[-1]
+        return batches, CursorPaginationParams.encode_cursor([last.harvest_date.isoformat(), str(last.id)])
\ No newline at end of file
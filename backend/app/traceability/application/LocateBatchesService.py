@@ -0,0 +1,27 @@
+from typing import List, Tuple
+
+from app.shared_kernel import BoundingBox
+from app.traceability.domain import CocoaBatch
+from app.traceability.domain.CocoaBatchRepositoryInterface import CocoaBatchRepositoryInterface
+
+
+class LocateBatchesService:
+    def __init__(self, repository: CocoaBatchRepositoryInterface):
+        self._repository = repository
+    
+    async def nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int = 100
+    ) -> List[Tuple[CocoaBatch, float]]:
+        return await self._repository.find_within(
+            BoundingBox.around(latitude, longitude, radius_km),
+            near=(latitude, longitude),
+            radius_km=radius_km,
+            limit=limit
+        )
+    
+    async def within(self, bounding_box: BoundingBox, limit: int = 100) -> List[Tuple[CocoaBatch, float]]:
+        return await self._repository.find_within(bounding_box, limit=limit)
\ No newline at end of file
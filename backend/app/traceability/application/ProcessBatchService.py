@@ -0,0 +1,17 @@
+from typing import List
+from uuid import UUID
+
+from app.traceability.application.BatchTransitionService import (
+    BatchTransitionResult,
+    BatchTransitionService,
+    TransitionedBatch,
+)
+from app.traceability.domain import BatchTransition
+
+
+class ProcessBatchService(BatchTransitionService):
+    async def execute(self, batch_id: UUID, processing_type: str) -> TransitionedBatch:
+        return await self._transition_one(batch_id, BatchTransition.processing(processing_type))
+    
+    async def execute_many(self, batch_ids: List[UUID], processing_type: str) -> List[BatchTransitionResult]:
+        return await self._transition_many(batch_ids, BatchTransition.processing(processing_type))
\ No newline at end of file
@@ -0,0 +1,20 @@
+from typing import Optional
+
+from app.traceability.domain import RouteDistanceCalculator
+from app.traceability.domain.RoutePointRepositoryInterface import RoutePointRepositoryInterface
+
+
+class RecomputeRouteDistancesService:
+    def __init__(self, repository: RoutePointRepositoryInterface, distances: Optional[RouteDistanceCalculator] = None):
+        self._repository = repository
+        self._distances = distances or RouteDistanceCalculator()
+    
+    async def execute(self, chunk_size: int = 1000) -> int:
+        updated = 0
+        after = None
+        while True:
+            points = await self._repository.load_page(after=after, limit=chunk_size)
+            if not points.batch_ids:
+                return updated
+            updated += await self._repository.update_distances(points, self._distances.legs(points))
+            after = points.batch_ids[-1]
\ No newline at end of file
@@ -1,29 +1,67 @@
+from dataclasses import dataclass
 from datetime import datetime
-from app.traceability.domain import CocoaBatch, Location, Quantity, BatchStatus
+from typing import List, Optional
+from app.shared_kernel import IdGenerator, id_generator
+from app.traceability.domain import CocoaBatch, Location, Quantity
 from app.traceability.domain.CocoaBatchRepositoryInterface import CocoaBatchRepositoryInterface
 from uuid import UUID
 
 
+@dataclass(frozen=True)
+class RegisterBatchCommand:
+    producer_id: UUID
+    quantity: float
+    harvest_date: datetime
+    location: Location
+    batch_id: Optional[UUID] = None
+
+
+@dataclass(frozen=True)
+class BatchRegistrationResult:
+    index: int
+    batch: Optional[CocoaBatch] = None
+    error: Optional[str] = None
+
+
 class RegisterBatchService:
-    def __init__(self, repository: CocoaBatchRepositoryInterface):
+    def __init__(self, repository: CocoaBatchRepositoryInterface, ids: Optional[IdGenerator] = None):
         self._repository = repository
+        self._ids = ids or id_generator
     
     async def execute(
         self,
-        batch_id: UUID,
         producer_id: UUID,
         quantity: float,
         harvest_date: datetime,
-        location: Location
+        location: Location,
+        batch_id: Optional[UUID] = None
     ) -> CocoaBatch:
-        batch = CocoaBatch(
-            id=batch_id,
-            producer_id=producer_id,
-            quantity=Quantity(quantity),
-            harvest_date=harvest_date,
-            status=BatchStatus.HARVESTED,
-            current_location=location
-        )
+        batch = self._build(RegisterBatchCommand(producer_id, quantity, harvest_date, location, batch_id))
         
         await self._repository.save(batch)
-        return batch
\ No newline at end of file
+        return batch
+    
+    async def execute_many(self, commands: List[RegisterBatchCommand]) -> List[BatchRegistrationResult]:
+        results = []
+        batches = []
+        for index, command in enumerate(commands):
+            try:
+                batch = self._build(command)
+            except ValueError as e:
+                results.append(BatchRegistrationResult(index=index, error=str(e)))
+                continue
+            batches.append(batch)
+            results.append(BatchRegistrationResult(index=index, batch=batch))
+        
+        if batches:
+            await self._repository.insert_all(batches)
+        return results
+    
+    def _build(self, command: RegisterBatchCommand) -> CocoaBatch:
+        return CocoaBatch.harvest(
+            id=command.batch_id or self._ids.new_id(),
+            producer_id=command.producer_id,
+            quantity=Quantity(command.quantity),
+            harvest_date=command.harvest_date,
+            location=command.location
+        )
\ No newline at end of file
@@ -1,12 +1,46 @@
-from typing import Optional
+from typing import Callable, List, Optional
 from uuid import UUID
 
+from app.shared_kernel import CacheBackend
 from app.traceability.domain.CocoaBatch import CocoaBatch
 from app.traceability.domain.CocoaBatchRepositoryInterface import CocoaBatchRepositoryInterface
 
+
+def batch_cache_key(batch_id: UUID) -> str:
+    return f"traceability:batch:{batch_id}"
+
+
 class RetrieveBatchService:
-    def __init__(self, repository: CocoaBatchRepositoryInterface):
+    def __init__(self, repository: CocoaBatchRepositoryInterface, cache: Optional[CacheBackend] = None):
         self._repository = repository
+        self._cache = cache
 
     async def retrieve_batch(self, batch_id: UUID) -> Optional[CocoaBatch]:
-        return await self._repository.find_by_id(batch_id)
\ No newline at end of file
+        return await self._repository.find_by_id(batch_id)
+
+    async def retrieve_batches(self, batch_ids: List[UUID]) -> List[Optional[CocoaBatch]]:
+        batches = {batch.id: batch for batch in await self._repository.find_by_ids(batch_ids)}
+        return [batches.get(batch_id) for batch_id in batch_ids]
+
+    async def retrieve_batch_payload(
+        self,
+        batch_id: UUID,
+        serialize: Callable[[CocoaBatch], bytes]
+    ) -> Optional[bytes]:
+        key = batch_cache_key(batch_id)
+        generation = 0
+        if self._cache is not None:
+            payload = await self._cache.get(key)
+            if payload is not None:
+                return payload
+            # Relevée avant la lecture en base : une invalidation pendant la lecture empêche le remplissage
+            generation = await self._cache.generation(key)
+
+        batch = await self._repository.find_by_id(batch_id)
+        if batch is None:
+            return None
+
+        payload = serialize(batch)
+        if self._cache is not None:
+            await self._cache.fill(key, payload, generation)
+        return payload
\ No newline at end of file
@@ -1,23 +1,88 @@
+from dataclasses import dataclass
+from typing import List, Optional
 from uuid import UUID
-from app.traceability.domain import CocoaBatch, Location, TransportMode
+from app.shared_kernel import BusinessRuleViolation, CacheBackend, NotFoundError
+from app.traceability.application.RetrieveBatchService import batch_cache_key
+from app.traceability.domain import BatchProjection, CocoaBatch, Location, RouteDistanceCalculator, TransportMode
 from app.traceability.domain.CocoaBatchRepositoryInterface import CocoaBatchRepositoryInterface
 
+
+@dataclass(frozen=True)
+class BatchShipmentResult:
+    batch_id: UUID
+    batch: Optional[CocoaBatch] = None
+    error: Optional[str] = None
+
+
 class ShipBatchService:
-    def __init__(self, repository: CocoaBatchRepositoryInterface):
+    def __init__(
+        self,
+        repository: CocoaBatchRepositoryInterface,
+        cache: Optional[CacheBackend] = None,
+        distances: Optional[RouteDistanceCalculator] = None
+    ):
         self._repository = repository
+        self._cache = cache
+        self._distances = distances or RouteDistanceCalculator()
     
     async def execute(
         self,
         batch_id: UUID,
         destination: Location,
-        transport_mode: TransportMode,
-        distance: float
+        transport_mode: TransportMode
     ) -> CocoaBatch:
-        batch = await self._repository.find_by_id(batch_id)
+        batch = await self._repository.find_by_id(batch_id, projection=BatchProjection.SUMMARY)
         if batch is None:
-            raise ValueError(f"Batch {batch_id} not found")
+            raise NotFoundError(
+                f"Batch {batch_id} not found", code="BATCH_NOT_FOUND", details={"batch_id": str(batch_id)}
+            )
         
-        batch.ship(destination, transport_mode, distance)
+        try:
+            batch.ship(destination, transport_mode, self._distances.between(batch.current_location, destination, transport_mode))
+        except ValueError as e:
+            raise BusinessRuleViolation(str(e), code="ILLEGAL_TRANSITION", details={"batch_id": str(batch_id)})
         await self._repository.save(batch)
+        if self._cache is not None:
+            await self._cache.delete(batch_cache_key(batch_id))
+        
+        return batch
+    
+    async def execute_many(
+        self,
+        batch_ids: List[UUID],
+        destination: Location,
+        transport_mode: TransportMode
+    ) -> List[BatchShipmentResult]:
+        batches = {
+            batch.id: batch
+            for batch in await self._repository.find_by_ids(batch_ids, projection=BatchProjection.SUMMARY)
+        }
+        
+        errors = {}
+        shippable = []
+        for batch_id in batch_ids:
+            batch = batches.get(batch_id)
+            if batch is None:
+                errors[batch_id] = f"Batch {batch_id} not found"
+                continue
+            try:
+                batch.ship(destination, transport_mode, self._distances.between(batch.current_location, destination, transport_mode))
+            except ValueError as e:
+                errors[batch_id] = str(e)
+                continue
+            shippable.append(batch)
+        
+        for batch_id in await self._repository.save_versioned(shippable):
+            errors[batch_id] = f"Batch {batch_id} was modified concurrently"
+        
+        if self._cache is not None:
+            for batch in shippable:
+                if batch.id not in errors:
+                    await self._cache.delete(batch_cache_key(batch.id))
         
-        return batch
\ No newline at end of file
+        return [
+            BatchShipmentResult(batch_id=batch_id, error=errors[batch_id])
+            if batch_id in errors
+            else BatchShipmentResult(batch_id=batch_id, batch=batches[batch_id])
+            for batch_id in batch_ids
+        ]
\ No newline at end of file
@@ -0,0 +1,5 @@
+from enum import Enum
+
+class BatchProjection(Enum):
+    SUMMARY = "SUMMARY"
+    FULL = "FULL"
\ No newline at end of file
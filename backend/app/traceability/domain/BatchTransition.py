@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+from app.traceability.domain.BatchStatus import BatchStatus
+
+
+@dataclass(frozen=True, slots=True)
+class BatchTransition:
+    from_status: BatchStatus
+    to_status: BatchStatus
+    action: str
+    rejection: str
+    
+    @classmethod
+    def processing(cls, processing_type: str) -> "BatchTransition":
+        return cls(
+            from_status=BatchStatus.IN_TRANSIT,
+            to_status=BatchStatus.PROCESSED,
+            action=f"PROCESSED_{processing_type}",
+            rejection="Batch must be in transit to be processed"
+        )
+    
+    @classmethod
+    def delivery(cls) -> "BatchTransition":
+        return cls(
+            from_status=BatchStatus.PROCESSED,
+            to_status=BatchStatus.DELIVERED,
+            action="DELIVERED",
+            rejection="Batch must be processed before delivery"
+        )
\ No newline at end of file
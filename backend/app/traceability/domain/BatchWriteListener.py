@@ -0,0 +1,42 @@
+from abc import ABC
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, NamedTuple
+from uuid import UUID
+
+from app.traceability.domain.BatchTransition import BatchTransition
+from app.traceability.domain.CocoaBatch import CocoaBatch
+
+
+@dataclass(frozen=True)
+class BatchesWritten:
+    # Lots effectivement écrits, avant mark_persisted : pending_tracking_entries et persisted_status
+    # décrivent encore ce que l'écriture a changé
+    batches: List[CocoaBatch]
+    origins: Dict[UUID, str]
+    shipped_at: Dict[UUID, datetime] = field(default_factory=dict)
+
+
+class TransitionedRow(NamedTuple):
+    batch_id: UUID
+    producer_id: UUID
+    origin_country: str
+    quantity: float
+
+
+@dataclass(frozen=True)
+class TransitionApplied:
+    rows: List[TransitionedRow]
+    transition: BatchTransition
+    timestamp: datetime
+    shipped_at: Dict[UUID, datetime] = field(default_factory=dict)
+
+
+class BatchWriteListener(ABC):
+    # Appelé par le dépôt dans la transaction de l'écriture, avant le commit : une projection d'un autre
+    # contexte reste cohérente avec les lots sans que la traçabilité connaisse son infrastructure
+    async def batches_written(self, event: BatchesWritten) -> None:
+        pass
+    
+    async def transition_applied(self, event: TransitionApplied) -> None:
+        pass
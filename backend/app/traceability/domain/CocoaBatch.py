@@ -1,12 +1,28 @@
 from datetime import datetime
-from typing import List
+from typing import Callable, Optional, Sequence, Tuple
 from uuid import UUID
 
 from app.traceability.domain import Quantity, Location, BatchStatus
 from app.traceability.domain.TransportMode import TransportMode
 from app.traceability.domain.TrackingEntry import TrackingEntry
+from app.traceability.domain.BatchTransition import BatchTransition
 
 class CocoaBatch:
+    __slots__ = (
+        "_id",
+        "_producer_id",
+        "_quantity",
+        "_harvest_date",
+        "_status",
+        "_current_location",
+        "_tracking_history",
+        "_history_loader",
+        "_persisted_tracking_count",
+        "_unsaved_from",
+        "_version",
+        "_persisted_status",
+    )
+    
     def __init__(
         self,
         id: UUID,
@@ -15,7 +31,10 @@ class CocoaBatch:
         harvest_date: datetime,
         status: BatchStatus,
         current_location: Location,
-        tracking_history: List[TrackingEntry] = None
+        tracking_history: Sequence[TrackingEntry] = (),
+        persisted_tracking_count: Optional[int] = None,
+        version: int = 0,
+        history_loader: Optional[Callable[[], Sequence[TrackingEntry]]] = None
     ):
         self._id = id
         self._producer_id = producer_id
@@ -23,7 +42,37 @@ class CocoaBatch:
         self._harvest_date = harvest_date
         self._status = status
         self._current_location = current_location
-        self._tracking_history = tracking_history or []
+        self._tracking_history: Tuple[TrackingEntry, ...] = tuple(tracking_history or ())
+        self._persisted_tracking_count = (
+            len(self._tracking_history) if persisted_tracking_count is None else persisted_tracking_count
+        )
+        self._unsaved_from = len(self._tracking_history)
+        self._version = version
+        self._persisted_status = status if version > 0 else None
+        self._history_loader = history_loader
+    
+    @classmethod
+    def harvest(
+        cls,
+        id: UUID,
+        producer_id: UUID,
+        quantity: Quantity,
+        harvest_date: datetime,
+        location: Location
+    ) -> "CocoaBatch":
+        # Le lieu de récolte ouvre l'historique : c'est l'origine de la première étape de transport
+        batch = cls(
+            id=id,
+            producer_id=producer_id,
+            quantity=quantity,
+            harvest_date=harvest_date,
+            status=BatchStatus.HARVESTED,
+            current_location=location
+        )
+        batch._tracking_history = (
+            TrackingEntry(timestamp=harvest_date, action="HARVESTED", location=location),
+        )
+        return batch
     
     @property
     def id(self) -> UUID:
@@ -37,52 +86,91 @@ class CocoaBatch:
     def quantity(self) -> Quantity:
         return self._quantity
     
+    @property
+    def harvest_date(self) -> datetime:
+        return self._harvest_date
+    
     @property
     def status(self) -> BatchStatus:
         return self._status
     
     @property
-    def tracking_history(self) -> List[TrackingEntry]:
-        return self._tracking_history.copy()
+    def current_location(self) -> Location:
+        return self._current_location
+    
+    @property
+    def tracking_history(self) -> Tuple[TrackingEntry, ...]:
+        return self._loaded_history()
+    
+    @property
+    def version(self) -> int:
+        return self._version
     
-    def ship(self, destination: Location, transport_mode: TransportMode, distance: float) -> None:
+    @property
+    def persisted_tracking_count(self) -> int:
+        return self._persisted_tracking_count
+    
+    @property
+    def persisted_status(self) -> Optional[BatchStatus]:
+        return self._persisted_status
+    
+    @property
+    def pending_tracking_entries(self) -> Tuple[TrackingEntry, ...]:
+        if self._history_loader is not None:
+            return ()
+        return self._tracking_history[self._unsaved_from:]
+    
+    def mark_persisted(self, version: int) -> None:
+        self._persisted_tracking_count += len(self._tracking_history) - self._unsaved_from
+        self._unsaved_from = len(self._tracking_history)
+        self._version = version
+        self._persisted_status = self._status
+    
+    def _loaded_history(self) -> Tuple[TrackingEntry, ...]:
+        # Historique différé : construit au premier accès seulement
+        if self._history_loader is not None:
+            self._tracking_history = tuple(self._history_loader())
+            self._unsaved_from = len(self._tracking_history)
+            self._history_loader = None
+        return self._tracking_history
+    
+    def ship(
+        self,
+        destination: Location,
+        transport_mode: TransportMode,
+        distance: float,
+        timestamp: Optional[datetime] = None
+    ) -> None:
         if self._status != BatchStatus.HARVESTED:
             raise ValueError("Only harvested batches can be shipped")
         
         self._status = BatchStatus.IN_TRANSIT
         self._current_location = destination
-        self._tracking_history.append(
+        self._tracking_history = self._loaded_history() + (
             TrackingEntry(
-                timestamp=datetime.now(),
+                timestamp=timestamp or datetime.now(),
                 action="SHIPPED",
                 location=destination,
                 transport_mode=transport_mode,
                 distance=distance
-            )
+            ),
         )
     
-    def process(self, processing_type: str) -> None:
-        if self._status != BatchStatus.IN_TRANSIT:
-            raise ValueError("Batch must be in transit to be processed")
-        
-        self._status = BatchStatus.PROCESSED
-        self._tracking_history.append(
-            TrackingEntry(
-                timestamp=datetime.now(),
-                action=f"PROCESSED_{processing_type}",
-                location=self._current_location
-            )
-        )
+    def process(self, processing_type: str, timestamp: Optional[datetime] = None) -> None:
+        self._apply(BatchTransition.processing(processing_type), timestamp)
+    
+    def deliver(self, timestamp: Optional[datetime] = None) -> None:
+        self._apply(BatchTransition.delivery(), timestamp)
     
-    def deliver(self) -> None:
-        if self._status != BatchStatus.PROCESSED:
-            raise ValueError("Batch must be processed before delivery")
+    def _apply(self, transition: BatchTransition, timestamp: Optional[datetime] = None) -> None:
+        if self._status != transition.from_status:
+            raise ValueError(transition.rejection)
         
-        self._status = BatchStatus.DELIVERED
-        self._tracking_history.append(
+        self._status = transition.to_status
+        self._tracking_history = self._loaded_history() + (
             TrackingEntry(
-                timestamp=datetime.now(),
-                action="DELIVERED",
+                timestamp=timestamp or datetime.now(),
+                action=transition.action,
                 location=self._current_location
-            )
+            ),
         )
\ No newline at end of file
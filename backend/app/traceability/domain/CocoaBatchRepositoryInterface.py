@@ -1,18 +1,93 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 
+from app.shared_kernel.geo import BoundingBox
+from app.traceability.domain.BatchProjection import BatchProjection
+from app.traceability.domain.BatchStatus import BatchStatus
+from app.traceability.domain.BatchTransition import BatchTransition
 from app.traceability.domain.CocoaBatch import CocoaBatch
+from app.traceability.domain.TrackingEntry import TrackingEntry
 
 class CocoaBatchRepositoryInterface(ABC):
     @abstractmethod
     async def save(self, batch: CocoaBatch) -> None:
         pass
     
+    # INSERT groupé de lots neufs, sans upsert : un identifiant déjà présent fait échouer tout le lot
     @abstractmethod
-    async def find_by_id(self, batch_id: UUID) -> Optional[CocoaBatch]:
+    async def insert_all(self, batches: List[CocoaBatch]) -> None:
         pass
     
+    # Écriture conditionnée par la version lue : les lots écrits sont marqués persistés, ceux modifiés
+    # entre-temps sont ignorés et leurs identifiants renvoyés (conflits, pas lots sauvegardés)
     @abstractmethod
-    async def find_by_producer(self, producer_id: UUID) -> List[CocoaBatch]:
+    async def save_versioned(self, batches: List[CocoaBatch]) -> List[UUID]:
+        pass
+    
+    @abstractmethod
+    async def apply_transition(
+        self,
+        batch_ids: List[UUID],
+        transition: BatchTransition,
+        timestamp: datetime
+    ) -> List[UUID]:
+        pass
+    
+    @abstractmethod
+    async def find_statuses(self, batch_ids: List[UUID]) -> Dict[UUID, BatchStatus]:
+        pass
+    
+    @abstractmethod
+    async def find_by_id(
+        self,
+        batch_id: UUID,
+        projection: BatchProjection = BatchProjection.FULL
+    ) -> Optional[CocoaBatch]:
+        pass
+    
+    @abstractmethod
+    async def find_by_ids(
+        self,
+        batch_ids: List[UUID],
+        projection: BatchProjection = BatchProjection.FULL
+    ) -> List[CocoaBatch]:
+        pass
+    
+    @abstractmethod
+    async def find_by_producer(
+        self,
+        producer_id: UUID,
+        projection: BatchProjection = BatchProjection.FULL
+    ) -> List[CocoaBatch]:
+        pass
+    
+    @abstractmethod
+    async def find_page(
+        self,
+        producer_id: Optional[UUID] = None,
+        status: Optional[BatchStatus] = None,
+        country: Optional[str] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 20
+    ) -> List[CocoaBatch]:
+        pass
+    
+    @abstractmethod
+    async def find_within(
+        self,
+        bounding_box: BoundingBox,
+        near: Optional[Tuple[float, float]] = None,
+        radius_km: Optional[float] = None,
+        limit: int = 100
+    ) -> List[Tuple[CocoaBatch, float]]:
+        pass
+    
+    @abstractmethod
+    def stream_by_producer(self, producer_id: UUID, chunk_size: int = 1000) -> AsyncIterator[List[dict]]:
+        pass
+    
+    @abstractmethod
+    async def find_tracking_history(self, batch_id: UUID) -> List[TrackingEntry]:
         pass
\ No newline at end of file
@@ -1,9 +1,17 @@
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Location:
     latitude: float
     longitude: float
     region: str
-    country: str
\ No newline at end of file
+    country: str
+
+
+# Les mêmes entrepôts et ports reviennent dans la quasi-totalité des historiques :
+# une seule instance partagée par lieu distinct lors de l'hydratation
+@lru_cache(maxsize=65536)
+def intern_location(latitude: float, longitude: float, region: str, country: str) -> Location:
+    return Location(latitude, longitude, region, country)
\ No newline at end of file
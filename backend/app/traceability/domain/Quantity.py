@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Quantity:
     value: float
-    unit: str = "kg"
\ No newline at end of file
+    unit: str = "kg"
+    def __post_init__(self):
+        if self.value <= 0:
+            raise ValueError("Quantity must be positive")
\ No newline at end of file
@@ -0,0 +1,48 @@
+from functools import lru_cache
+from typing import Dict, Optional
+
+import numpy as np
+
+from app.shared_kernel.geo import haversine_km, haversine_km_array
+from app.traceability.domain.Location import Location
+from app.traceability.domain.RoutePoints import RoutePoints
+from app.traceability.domain.TransportMode import TransportMode
+
+
+# Les trajets entrepôt → port reviennent sans cesse : la distance d'une paire de lieux n'est calculée qu'une fois
+@lru_cache(maxsize=16384)
+def great_circle_km(origin: Location, destination: Location) -> float:
+    return haversine_km(origin.latitude, origin.longitude, destination.latitude, destination.longitude)
+
+
+class RouteDistanceCalculator:
+    def __init__(self, detour_factors: Optional[Dict[TransportMode, float]] = None):
+        self._detour_factors = detour_factors or {}
+    
+    def detour_factor(self, transport_mode: Optional[TransportMode]) -> float:
+        return self._detour_factors.get(transport_mode, 1.0)
+    
+    def between(self, origin: Location, destination: Location, transport_mode: TransportMode) -> float:
+        return great_circle_km(origin, destination) * self.detour_factor(transport_mode)
+    
+    def legs(self, points: RoutePoints) -> np.ndarray:
+        # Une étape relie chaque point de transport au point précédent du même lot ;
+        # renvoie la distance pour chaque point, NaN lorsqu'il ne s'agit pas d'une étape
+        distances = np.full(len(points), np.nan)
+        if len(points) < 2:
+            return distances
+        
+        factor_by_mode = {mode: self.detour_factor(mode) for mode in TransportMode}
+        factor_by_mode[None] = np.nan
+        factors = np.fromiter(
+            map(factor_by_mode.__getitem__, points.transport_modes), dtype=np.float64, count=len(points)
+        )
+        is_leg = (points.batch_index[1:] == points.batch_index[:-1]) & ~np.isnan(factors[1:])
+        
+        distances[1:][is_leg] = haversine_km_array(
+            points.latitudes[:-1][is_leg],
+            points.longitudes[:-1][is_leg],
+            points.latitudes[1:][is_leg],
+            points.longitudes[1:][is_leg],
+        ) * factors[1:][is_leg]
+        return distances
\ No newline at end of file
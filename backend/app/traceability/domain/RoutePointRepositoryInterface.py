@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+import numpy as np
+
+from app.traceability.domain.RoutePoints import RoutePoints
+
+
+class RoutePointRepositoryInterface(ABC):
+    @abstractmethod
+    async def load_page(self, after: Optional[UUID] = None, limit: int = 1000) -> RoutePoints:
+        pass
+    
+    @abstractmethod
+    async def update_distances(self, points: RoutePoints, distances_km: np.ndarray) -> int:
+        pass
\ No newline at end of file
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from uuid import UUID
+
+import numpy as np
+
+from app.traceability.domain.TransportMode import TransportMode
+
+
+@dataclass(frozen=True)
+class RoutePoints:
+    batch_ids: List[UUID]
+    batch_index: np.ndarray
+    sequences: np.ndarray
+    latitudes: np.ndarray
+    longitudes: np.ndarray
+    transport_modes: List[Optional[TransportMode]]
+    
+    def __len__(self) -> int:
+        return len(self.sequences)
\ No newline at end of file
@@ -6,7 +6,7 @@ from app.traceability.domain import Location
 from app.traceability.domain.TransportMode import TransportMode
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrackingEntry:
     timestamp: datetime
     action: str
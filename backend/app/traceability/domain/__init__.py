@@ -0,0 +1,30 @@
+from .BatchStatus import BatchStatus
+from .BatchProjection import BatchProjection
+from .BatchTransition import BatchTransition
+from .TransportMode import TransportMode
+from .Quantity import Quantity
+from .Location import Location, intern_location
+from .TrackingEntry import TrackingEntry
+from .CocoaBatch import CocoaBatch
+from .BatchWriteListener import BatchWriteListener, BatchesWritten, TransitionApplied, TransitionedRow
+from .RoutePoints import RoutePoints
+from .RouteDistanceCalculator import RouteDistanceCalculator, great_circle_km
+
+__all__ = [
+    "BatchStatus",
+    "BatchProjection",
+    "BatchTransition",
+    "TransportMode",
+    "Quantity",
+    "Location",
+    "intern_location",
+    "TrackingEntry",
+    "CocoaBatch",
+    "BatchWriteListener",
+    "BatchesWritten",
+    "TransitionApplied",
+    "TransitionedRow",
+    "RoutePoints",
+    "RouteDistanceCalculator",
+    "great_circle_km",
+]
@@ -0,0 +1,89 @@
+from functools import lru_cache
+
+from app.traceability.application.BatchTransitionService import TransitionedBatch
+from app.traceability.domain import CocoaBatch, Location, TrackingEntry
+from app.traceability.infrastructure.api.BatchSchemas import (
+    BatchDistanceSchema,
+    BatchSchema,
+    BatchSummarySchema,
+    LocationSchema,
+    ShippedBatchSchema,
+    TrackingEntrySchema,
+    TransitionedBatchSchema,
+)
+
+
+# Les objets du domaine sont déjà valides : model_construct évite une validation Pydantic redondante.
+# Les Location sont immuables et très répétées dans un historique, leur schéma est donc mis en cache
+class BatchMapper:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def to_location(location: Location) -> LocationSchema:
+        return LocationSchema.model_construct(
+            latitude=location.latitude,
+            longitude=location.longitude,
+            region=location.region,
+            country=location.country
+        )
+    
+    @staticmethod
+    def to_tracking_entry(entry: TrackingEntry) -> TrackingEntrySchema:
+        return TrackingEntrySchema.model_construct(
+            timestamp=entry.timestamp,
+            action=entry.action,
+            location=BatchMapper.to_location(entry.location),
+            transport_mode=entry.transport_mode,
+            distance=entry.distance
+        )
+    
+    @staticmethod
+    def to_summary(batch: CocoaBatch) -> BatchSummarySchema:
+        return BatchSummarySchema.model_construct(
+            id=batch.id,
+            producer_id=batch.producer_id,
+            quantity=batch.quantity.value,
+            harvest_date=batch.harvest_date,
+            status=batch.status,
+            current_location=BatchMapper.to_location(batch.current_location)
+        )
+    
+    @staticmethod
+    def to_distance(batch: CocoaBatch, distance_km: float) -> BatchDistanceSchema:
+        return BatchDistanceSchema.model_construct(
+            id=batch.id,
+            producer_id=batch.producer_id,
+            quantity=batch.quantity.value,
+            harvest_date=batch.harvest_date,
+            status=batch.status,
+            current_location=BatchMapper.to_location(batch.current_location),
+            distance_km=distance_km
+        )
+    
+    @staticmethod
+    def to_detail(batch: CocoaBatch) -> BatchSchema:
+        return BatchSchema.model_construct(
+            id=batch.id,
+            producer_id=batch.producer_id,
+            quantity=batch.quantity.value,
+            harvest_date=batch.harvest_date,
+            status=batch.status,
+            current_location=BatchMapper.to_location(batch.current_location),
+            tracking_history=[BatchMapper.to_tracking_entry(entry) for entry in batch.tracking_history]
+        )
+    
+    @staticmethod
+    def to_shipped(batch: CocoaBatch) -> ShippedBatchSchema:
+        return ShippedBatchSchema.model_construct(
+            id=batch.id,
+            status=batch.status,
+            current_location=BatchMapper.to_location(batch.current_location)
+        )
+    
+    @staticmethod
+    def to_transitioned(batch: TransitionedBatch) -> TransitionedBatchSchema:
+        return TransitionedBatchSchema.model_construct(
+            id=batch.id,
+            status=batch.status,
+            action=batch.action,
+            timestamp=batch.timestamp
+        )
\ No newline at end of file
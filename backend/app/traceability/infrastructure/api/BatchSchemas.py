@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from app.shared_kernel import BaseSchema
+from app.traceability.domain import BatchStatus, TransportMode
+
+
+class LocationSchema(BaseSchema):
+    latitude: float
+    longitude: float
+    region: str
+    country: str
+
+
+class TrackingEntrySchema(BaseSchema):
+    timestamp: datetime
+    action: str
+    location: LocationSchema
+    transport_mode: Optional[TransportMode] = None
+    distance: Optional[float] = None
+
+
+class BatchSummarySchema(BaseSchema):
+    id: UUID
+    producer_id: UUID
+    quantity: float
+    harvest_date: datetime
+    status: BatchStatus
+    current_location: LocationSchema
+
+
+class BatchDistanceSchema(BatchSummarySchema):
+    distance_km: float
+
+
+class BatchSchema(BatchSummarySchema):
+    tracking_history: List[TrackingEntrySchema]
+
+
+class ShippedBatchSchema(BaseSchema):
+    id: UUID
+    status: BatchStatus
+    current_location: LocationSchema
+
+
+class TransitionedBatchSchema(BaseSchema):
+    id: UUID
+    status: BatchStatus
+    action: str
+    timestamp: datetime
\ No newline at end of file
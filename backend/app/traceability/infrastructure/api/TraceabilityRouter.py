@@ -1,15 +1,67 @@
-from fastapi import APIRouter, Depends, HTTPException
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
-from pydantic import BaseModel
+from typing import Annotated, Any, Callable, Dict, List, Literal, Optional, Union
+from pydantic import BaseModel, Field, ValidationError
 
+from app.traceability.application.BatchTransitionService import BatchTransitionResult
+from app.traceability.application.DeliverBatchService import DeliverBatchService
+from app.traceability.application.ExportBatchesService import ExportBatchesService
+from app.traceability.application.IngestTrackingEventsService import (
+    DeliverEvent,
+    IngestTrackingEventsService,
+    ProcessEvent,
+    ShipEvent,
+    TrackingEvent,
+)
+from app.traceability.application.ListBatchesService import ListBatchesService
+from app.traceability.application.LocateBatchesService import LocateBatchesService
+from app.traceability.application.ProcessBatchService import ProcessBatchService
 from app.traceability.application.RetrieveBatchService import RetrieveBatchService
-from app.traceability.application.RegisterBatchService import RegisterBatchService
+from app.traceability.application.RegisterBatchService import RegisterBatchCommand, RegisterBatchService
 from app.traceability.application.ShipBatchService import ShipBatchService
+from app.traceability.infrastructure.api.BatchMapper import BatchMapper
+from app.traceability.infrastructure.api.BatchSchemas import (
+    BatchSchema,
+    BatchDistanceSchema,
+    BatchSummarySchema,
+    LocationSchema,
+    ShippedBatchSchema,
+    TransitionedBatchSchema,
+)
 from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import PostgresCocoaBatchRepository
-from app.traceability.domain import Location, TransportMode
-from app.shared_kernel import get_db
+from app.traceability.domain import (
+    BatchStatus,
+    BatchWriteListener,
+    CocoaBatch,
+    Location,
+    RouteDistanceCalculator,
+    TransportMode,
+)
+from app.shared_kernel import (
+    AsyncSessionLocal,
+    BoundingBox,
+    BusinessRuleViolation,
+    CacheBackend,
+    ConcurrencyConflictError,
+    CursorPaginatedResponse,
+    CursorPaginationParams,
+    IDEMPOTENT_ROUTE,
+    NaiveUtcDatetime,
+    NotFoundError,
+    SchemaResponse,
+    WriteBehindQueue,
+    config,
+    create_cache_backend,
+    get_async_db,
+    measure_serialization,
+)
+
+ingestion_logger = logging.getLogger("sustaain.ingestion")
 
 router = APIRouter(
     prefix="/traceability",
@@ -18,34 +70,173 @@ router = APIRouter(
 )
 
 
-class LocationSchema(BaseModel):
-    latitude: float
-    longitude: float
-    region: str
-    country: str
-
-
 class RegisterBatchRequest(BaseModel):
     producer_id: UUID
     quantity: float
-    harvest_date: datetime
+    harvest_date: NaiveUtcDatetime
     location: LocationSchema
 
 
+class BulkRegisterBatchRequest(BaseModel):
+    items: List[Dict[str, Any]] = Field(..., min_length=1, max_length=5000)
+
+
+class BulkRegisterItemResult(BaseModel):
+    index: int
+    status: str
+    id: Optional[UUID] = None
+    errors: List[str] = []
+
+
+class BulkRegisterBatchResponse(BaseModel):
+    registered: int
+    failed: int
+    results: List[BulkRegisterItemResult]
+
+
+class BatchGetRequest(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1, max_length=1000)
+
+
+class BatchGetResponse(BaseModel):
+    batches: List[BatchSchema]
+    not_found: List[UUID]
+
+
 class ShipBatchRequest(BaseModel):
     destination: LocationSchema
     transport_mode: str
-    distance: float
 
 
-def get_batch_repository(db: Session = Depends(get_db)) -> PostgresCocoaBatchRepository:
-    return PostgresCocoaBatchRepository(db)
+class BulkShipBatchRequest(ShipBatchRequest):
+    ids: List[UUID] = Field(..., min_length=1, max_length=5000)
+
+
+class BulkShipItemResult(BaseModel):
+    id: UUID
+    status: str
+    errors: List[str] = []
+
+
+class BulkShipBatchResponse(BaseModel):
+    shipped: int
+    failed: int
+    results: List[BulkShipItemResult]
+
+
+class ProcessBatchRequest(BaseModel):
+    processing_type: str = Field(..., min_length=1, max_length=64, pattern=r"^[A-Z][A-Z0-9_]*$")
+
+
+class BulkProcessBatchRequest(ProcessBatchRequest):
+    ids: List[UUID] = Field(..., min_length=1, max_length=5000)
+
+
+class BulkDeliverBatchRequest(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1, max_length=5000)
+
+
+class ShipEventRequest(BaseModel):
+    type: Literal["SHIP"]
+    batch_id: UUID
+    destination: LocationSchema
+    transport_mode: TransportMode
+
+
+class ProcessEventRequest(ProcessBatchRequest):
+    type: Literal["PROCESS"]
+    batch_id: UUID
+
+
+class DeliverEventRequest(BaseModel):
+    type: Literal["DELIVER"]
+    batch_id: UUID
+
+
+class IngestEventsRequest(BaseModel):
+    events: List[Annotated[
+        Union[ShipEventRequest, ProcessEventRequest, DeliverEventRequest],
+        Field(discriminator="type")
+    ]] = Field(..., min_length=1, max_length=1000)
+
+
+class IngestEventsResponse(BaseModel):
+    accepted: int
+    queue_depth: int
+
+
+class BulkTransitionItemResult(BaseModel):
+    id: UUID
+    status: str
+    errors: List[str] = []
+
+
+class BulkTransitionBatchResponse(BaseModel):
+    transitioned: int
+    failed: int
+    results: List[BulkTransitionItemResult]
+
+
+batch_cache = create_cache_backend()
+
+
+def get_batch_cache() -> CacheBackend:
+    return batch_cache
+
+
+route_distances = RouteDistanceCalculator({
+    TransportMode.TRUCK: config.truck_detour_factor,
+    TransportMode.TRAIN: config.train_detour_factor,
+})
+
+
+def get_route_distances() -> RouteDistanceCalculator:
+    return route_distances
+
+
+# Projections d'autres contextes à tenir à jour à chaque écriture de lots : une fabrique par session,
+# enregistrée par la racine de composition (app.main) pour que la traçabilité n'importe pas leur infrastructure
+batch_write_listeners: List[Callable[[AsyncSession], BatchWriteListener]] = []
+
+
+def batch_repository(db: AsyncSession) -> PostgresCocoaBatchRepository:
+    return PostgresCocoaBatchRepository(db, [listener(db) for listener in batch_write_listeners])
+
+
+async def flush_tracking_events(events: List[TrackingEvent]) -> Dict[str, int]:
+    async with AsyncSessionLocal() as db:
+        report = await IngestTrackingEventsService(batch_repository(db), batch_cache, route_distances).apply(events)
+    
+    # Le client a déjà reçu 202 : les rejets ne sont visibles que dans les journaux et les statistiques
+    for rejection in report.rejected:
+        ingestion_logger.warning(
+            "rejected %s for batch %s: %s", type(rejection.event).__name__, rejection.event.batch_id, rejection.error
+        )
+    return report.outcomes()
+
+
+tracking_events: WriteBehindQueue[TrackingEvent] = WriteBehindQueue(
+    flush_tracking_events,
+    max_size=config.ingestion_queue_size,
+    batch_size=config.ingestion_batch_size,
+    flush_interval_s=config.ingestion_flush_interval_ms / 1000,
+    enqueue_timeout_s=config.ingestion_enqueue_timeout_ms / 1000,
+)
+
+
+def get_tracking_events() -> WriteBehindQueue[TrackingEvent]:
+    return tracking_events
+
+
+def get_batch_repository(db: AsyncSession = Depends(get_async_db)) -> PostgresCocoaBatchRepository:
+    return batch_repository(db)
 
 
 def get_retrieve_batch_service(
-    repository: PostgresCocoaBatchRepository = Depends(get_batch_repository)
+    repository: PostgresCocoaBatchRepository = Depends(get_batch_repository),
+    cache: CacheBackend = Depends(get_batch_cache)
 ) -> RetrieveBatchService:
-    return RetrieveBatchService(repository)
+    return RetrieveBatchService(repository, cache)
 
 
 def get_register_batch_service(
@@ -55,17 +246,111 @@ def get_register_batch_service(
 
 
 def get_ship_batch_service(
-    repository: PostgresCocoaBatchRepository = Depends(get_batch_repository)
+    repository: PostgresCocoaBatchRepository = Depends(get_batch_repository),
+    cache: CacheBackend = Depends(get_batch_cache),
+    distances: RouteDistanceCalculator = Depends(get_route_distances)
 ) -> ShipBatchService:
-    return ShipBatchService(repository)
+    return ShipBatchService(repository, cache, distances)
+
+
+def get_export_batches_service(
+    repository: PostgresCocoaBatchRepository = Depends(get_batch_repository)
+) -> ExportBatchesService:
+    return ExportBatchesService(repository)
+
 
+def get_list_batches_service(
+    repository: PostgresCocoaBatchRepository = Depends(get_batch_repository)
+) -> ListBatchesService:
+    return ListBatchesService(repository)
+
+
+def get_process_batch_service(
+    repository: PostgresCocoaBatchRepository = Depends(get_batch_repository),
+    cache: CacheBackend = Depends(get_batch_cache)
+) -> ProcessBatchService:
+    return ProcessBatchService(repository, cache)
+
+
+def get_deliver_batch_service(
+    repository: PostgresCocoaBatchRepository = Depends(get_batch_repository),
+    cache: CacheBackend = Depends(get_batch_cache)
+) -> DeliverBatchService:
+    return DeliverBatchService(repository, cache)
+
+
+def get_locate_batches_service(
+    repository: PostgresCocoaBatchRepository = Depends(get_batch_repository)
+) -> LocateBatchesService:
+    return LocateBatchesService(repository)
+
+
+@router.get("/batches", response_model=CursorPaginatedResponse, response_class=SchemaResponse)
+async def list_batches(
+    producer_id: Optional[UUID] = None,
+    status: Optional[BatchStatus] = None,
+    country: Optional[str] = None,
+    pagination: CursorPaginationParams = Depends(),
+    service: ListBatchesService = Depends(get_list_batches_service)
+):
+    try:
+        batches, next_cursor = await service.execute(
+            pagination,
+            producer_id=producer_id,
+            status=status,
+            country=country
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return SchemaResponse(CursorPaginatedResponse.model_construct(
+        items=[BatchMapper.to_summary(batch) for batch in batches],
+        page_size=pagination.page_size,
+        next_cursor=next_cursor
+    ))
+
+
+@router.get("/batches:nearby", response_model=List[BatchDistanceSchema], response_class=SchemaResponse)
+async def find_nearby_batches(
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(..., gt=0, le=2000),
+    limit: int = Query(100, ge=1, le=1000),
+    service: LocateBatchesService = Depends(get_locate_batches_service)
+):
+    results = await service.nearby(latitude, longitude, radius_km, limit=limit)
+    return SchemaResponse([BatchMapper.to_distance(batch, distance) for batch, distance in results])
+
+
+@router.get("/batches:withinBox", response_model=List[BatchDistanceSchema], response_class=SchemaResponse)
+async def find_batches_within_box(
+    min_latitude: float = Query(..., ge=-90, le=90),
+    min_longitude: float = Query(..., ge=-180, le=180),
+    max_latitude: float = Query(..., ge=-90, le=90),
+    max_longitude: float = Query(..., ge=-180, le=180),
+    limit: int = Query(100, ge=1, le=1000),
+    service: LocateBatchesService = Depends(get_locate_batches_service)
+):
+    try:
+        bounding_box = BoundingBox(min_latitude, min_longitude, max_latitude, max_longitude)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    results = await service.within(bounding_box, limit=limit)
+    return SchemaResponse([BatchMapper.to_distance(batch, distance) for batch, distance in results])
 
-@router.post("/batches", status_code=201)
+
+@router.post(
+    "/batches",
+    status_code=201,
+    response_model=BatchSummarySchema,
+    response_class=SchemaResponse,
+    openapi_extra=IDEMPOTENT_ROUTE
+)
 async def register_batch(
     request: RegisterBatchRequest,
     service: RegisterBatchService = Depends(get_register_batch_service)
 ):
-    batch_id = UUID(int=0)
     location = Location(
         latitude=request.location.latitude,
         longitude=request.location.longitude,
@@ -73,70 +358,132 @@ async def register_batch(
         country=request.location.country
     )
     
-    batch = await service.execute(
-        batch_id=batch_id,
-        producer_id=request.producer_id,
-        quantity=request.quantity,
-        harvest_date=request.harvest_date,
-        location=location
-    )
+    try:
+        batch = await service.execute(
+            producer_id=request.producer_id,
+            quantity=request.quantity,
+            harvest_date=request.harvest_date,
+            location=location
+        )
+    except ConcurrencyConflictError as e:
+        raise HTTPException(status_code=409, detail=e.message)
+    
+    return SchemaResponse(BatchMapper.to_summary(batch), status_code=201)
+
+
+@router.post(
+    "/batches:batchCreate",
+    response_model=BulkRegisterBatchResponse,
+    response_class=SchemaResponse,
+    openapi_extra=IDEMPOTENT_ROUTE
+)
+async def register_batches(
+    request: BulkRegisterBatchRequest,
+    service: RegisterBatchService = Depends(get_register_batch_service)
+):
+    results: Dict[int, BulkRegisterItemResult] = {}
+    commands: List[RegisterBatchCommand] = []
+    command_indexes: List[int] = []
     
-    return {
-        "id": str(batch.id),
-        "producer_id": str(batch.producer_id),
-        "quantity": batch.quantity.value,
-        "harvest_date": batch._harvest_date.isoformat(),
-        "status": batch.status.value,
-        "current_location": {
-            "latitude": batch._current_location.latitude,
-            "longitude": batch._current_location.longitude,
-            "region": batch._current_location.region,
-            "country": batch._current_location.country
-        }
-    }
-
-
-@router.get("/batches/{batch_id}")
+    for index, item in enumerate(request.items):
+        try:
+            parsed = RegisterBatchRequest.model_validate(item)
+        except ValidationError as e:
+            results[index] = BulkRegisterItemResult(
+                index=index,
+                status="error",
+                errors=[f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()]
+            )
+            continue
+        
+        commands.append(RegisterBatchCommand(
+            producer_id=parsed.producer_id,
+            quantity=parsed.quantity,
+            harvest_date=parsed.harvest_date,
+            location=Location(
+                latitude=parsed.location.latitude,
+                longitude=parsed.location.longitude,
+                region=parsed.location.region,
+                country=parsed.location.country
+            )
+        ))
+        command_indexes.append(index)
+    
+    for result in await service.execute_many(commands):
+        index = command_indexes[result.index]
+        if result.error is not None:
+            results[index] = BulkRegisterItemResult(index=index, status="error", errors=[result.error])
+        else:
+            results[index] = BulkRegisterItemResult(index=index, status="created", id=result.batch.id)
+    
+    ordered = [results[index] for index in sorted(results)]
+    registered = sum(1 for result in ordered if result.status == "created")
+    return SchemaResponse(BulkRegisterBatchResponse(
+        registered=registered,
+        failed=len(ordered) - registered,
+        results=ordered
+    ))
+
+
+def serialize_batch(batch: CocoaBatch) -> bytes:
+    with measure_serialization():
+        return to_json(BatchMapper.to_detail(batch))
+
+
+@router.get("/batches/{batch_id}", response_model=BatchSchema, response_class=SchemaResponse)
 async def get_batch(
     batch_id: UUID,
     service: RetrieveBatchService = Depends(get_retrieve_batch_service)
 ):
-    batch = await service.retrieve_batch(batch_id)
+    payload = await service.retrieve_batch_payload(batch_id, serialize_batch)
     
-    if batch is None:
+    if payload is None:
         raise HTTPException(status_code=404, detail="Batch not found")
     
-    return {
-        "id": str(batch.id),
-        "producer_id": str(batch.producer_id),
-        "quantity": batch.quantity.value,
-        "harvest_date": batch._harvest_date.isoformat(),
-        "status": batch.status.value,
-        "current_location": {
-            "latitude": batch._current_location.latitude,
-            "longitude": batch._current_location.longitude,
-            "region": batch._current_location.region,
-            "country": batch._current_location.country
-        },
-        "tracking_history": [
-            {
-                "timestamp": entry.timestamp.isoformat(),
-                "action": entry.action,
-                "location": {
-                    "latitude": entry.location.latitude,
-                    "longitude": entry.location.longitude,
-                    "region": entry.location.region,
-                    "country": entry.location.country
-                },
-                "transport_mode": entry.transport_mode.value if entry.transport_mode else None,
-                "distance": entry.distance
-            }
-            for entry in batch.tracking_history
-        ]
-    }
+    return SchemaResponse(payload)
+
+
+@router.post("/batches:batchGet", response_model=BatchGetResponse, response_class=SchemaResponse)
+async def get_batches(
+    request: BatchGetRequest,
+    service: RetrieveBatchService = Depends(get_retrieve_batch_service)
+):
+    batch_ids = list(dict.fromkeys(request.ids))
+    batches = await service.retrieve_batches(batch_ids)
+    
+    return SchemaResponse(BatchGetResponse.model_construct(
+        batches=[BatchMapper.to_detail(batch) for batch in batches if batch is not None],
+        not_found=[batch_id for batch_id, batch in zip(batch_ids, batches) if batch is None]
+    ))
 
 
-@router.post("/batches/{batch_id}/ship")
+@router.get("/cache/stats")
+async def get_cache_stats(cache: CacheBackend = Depends(get_batch_cache)):
+    return cache.describe()
+
+
+@router.get("/producers/{producer_id}/batches:export")
+async def export_producer_batches(
+    producer_id: UUID,
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    service: ExportBatchesService = Depends(get_export_batches_service)
+):
+    if format == "csv":
+        return StreamingResponse(
+            service.export_csv(producer_id),
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="batches-{producer_id}.csv"'}
+        )
+    
+    return StreamingResponse(service.export_ndjson(producer_id), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/batches/{batch_id}/ship",
+    response_model=ShippedBatchSchema,
+    response_class=SchemaResponse,
+    openapi_extra=IDEMPOTENT_ROUTE
+)
 async def ship_batch(
     batch_id: UUID,
     request: ShipBatchRequest,
@@ -161,19 +508,187 @@ async def ship_batch(
         batch = await service.execute(
             batch_id=batch_id,
             destination=destination,
-            transport_mode=transport_mode,
-            distance=request.distance
+            transport_mode=transport_mode
         )
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    
-    return {
-        "id": str(batch.id),
-        "status": batch.status.value,
-        "current_location": {
-            "latitude": batch._current_location.latitude,
-            "longitude": batch._current_location.longitude,
-            "region": batch._current_location.region,
-            "country": batch._current_location.country
-        }
-    }
\ No newline at end of file
+    except ConcurrencyConflictError as e:
+        raise HTTPException(status_code=409, detail=e.message, headers={"Retry-After": "0"})
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=e.message)
+    except BusinessRuleViolation as e:
+        raise HTTPException(status_code=409, detail=e.message)
+    
+    return SchemaResponse(BatchMapper.to_shipped(batch))
+
+
+@router.post(
+    "/batches:batchShip",
+    response_model=BulkShipBatchResponse,
+    response_class=SchemaResponse,
+    openapi_extra=IDEMPOTENT_ROUTE
+)
+async def ship_batches(
+    request: BulkShipBatchRequest,
+    service: ShipBatchService = Depends(get_ship_batch_service)
+):
+    destination = Location(
+        latitude=request.destination.latitude,
+        longitude=request.destination.longitude,
+        region=request.destination.region,
+        country=request.destination.country
+    )
+    
+    try:
+        transport_mode = TransportMode[request.transport_mode]
+    except KeyError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid transport mode. Valid options: {[m.name for m in TransportMode]}"
+        )
+    
+    results = await service.execute_many(
+        batch_ids=list(dict.fromkeys(request.ids)),
+        destination=destination,
+        transport_mode=transport_mode
+    )
+    
+    shipped = sum(1 for result in results if result.error is None)
+    return SchemaResponse(BulkShipBatchResponse(
+        shipped=shipped,
+        failed=len(results) - shipped,
+        results=[
+            BulkShipItemResult(id=result.batch_id, status="error", errors=[result.error])
+            if result.error is not None
+            else BulkShipItemResult(id=result.batch_id, status="shipped")
+            for result in results
+        ]
+    ))
+
+
+def to_transition_response(results: List[BatchTransitionResult], status: str) -> BulkTransitionBatchResponse:
+    transitioned = sum(1 for result in results if result.error is None)
+    return BulkTransitionBatchResponse(
+        transitioned=transitioned,
+        failed=len(results) - transitioned,
+        results=[
+            BulkTransitionItemResult(id=result.batch_id, status="error", errors=[result.error])
+            if result.error is not None
+            else BulkTransitionItemResult(id=result.batch_id, status=status)
+            for result in results
+        ]
+    )
+
+
+@router.post(
+    "/batches/{batch_id}/process",
+    response_model=TransitionedBatchSchema,
+    response_class=SchemaResponse,
+    openapi_extra=IDEMPOTENT_ROUTE
+)
+async def process_batch(
+    batch_id: UUID,
+    request: ProcessBatchRequest,
+    service: ProcessBatchService = Depends(get_process_batch_service)
+):
+    try:
+        batch = await service.execute(batch_id, request.processing_type)
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=e.message)
+    except BusinessRuleViolation as e:
+        raise HTTPException(status_code=409, detail=e.message)
+    
+    return SchemaResponse(BatchMapper.to_transitioned(batch))
+
+
+@router.post(
+    "/batches:batchProcess",
+    response_model=BulkTransitionBatchResponse,
+    response_class=SchemaResponse,
+    openapi_extra=IDEMPOTENT_ROUTE
+)
+async def process_batches(
+    request: BulkProcessBatchRequest,
+    service: ProcessBatchService = Depends(get_process_batch_service)
+):
+    results = await service.execute_many(list(dict.fromkeys(request.ids)), request.processing_type)
+    return SchemaResponse(to_transition_response(results, "processed"))
+
+
+@router.post(
+    "/batches/{batch_id}/deliver",
+    response_model=TransitionedBatchSchema,
+    response_class=SchemaResponse,
+    openapi_extra=IDEMPOTENT_ROUTE
+)
+async def deliver_batch(
+    batch_id: UUID,
+    service: DeliverBatchService = Depends(get_deliver_batch_service)
+):
+    try:
+        batch = await service.execute(batch_id)
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=e.message)
+    except BusinessRuleViolation as e:
+        raise HTTPException(status_code=409, detail=e.message)
+    
+    return SchemaResponse(BatchMapper.to_transitioned(batch))
+
+
+@router.post(
+    "/batches:batchDeliver",
+    response_model=BulkTransitionBatchResponse,
+    response_class=SchemaResponse,
+    openapi_extra=IDEMPOTENT_ROUTE
+)
+async def deliver_batches(
+    request: BulkDeliverBatchRequest,
+    service: DeliverBatchService = Depends(get_deliver_batch_service)
+):
+    results = await service.execute_many(list(dict.fromkeys(request.ids)))
+    return SchemaResponse(to_transition_response(results, "delivered"))
+
+
+def to_tracking_event(
+    request: Union[ShipEventRequest, ProcessEventRequest, DeliverEventRequest],
+    received_at: datetime
+) -> TrackingEvent:
+    if isinstance(request, ShipEventRequest):
+        return ShipEvent(
+            batch_id=request.batch_id,
+            destination=Location(
+                latitude=request.destination.latitude,
+                longitude=request.destination.longitude,
+                region=request.destination.region,
+                country=request.destination.country
+            ),
+            transport_mode=request.transport_mode,
+            received_at=received_at
+        )
+    if isinstance(request, ProcessEventRequest):
+        return ProcessEvent(batch_id=request.batch_id, processing_type=request.processing_type, received_at=received_at)
+    return DeliverEvent(batch_id=request.batch_id, received_at=received_at)
+
+
+@router.post(
+    "/batches:ingestEvents",
+    status_code=202,
+    response_model=IngestEventsResponse,
+    response_class=SchemaResponse,
+    responses={503: {"description": "Ingestion queue full"}},
+    openapi_extra=IDEMPOTENT_ROUTE
+)
+async def ingest_tracking_events(
+    request: IngestEventsRequest,
+    queue: WriteBehindQueue[TrackingEvent] = Depends(get_tracking_events)
+):
+    received_at = datetime.now()
+    events = [to_tracking_event(event, received_at) for event in request.events]
+    
+    if not await queue.put_many(events):
+        raise HTTPException(status_code=503, detail="Ingestion queue is full", headers={"Retry-After": "1"})
+    
+    return SchemaResponse(IngestEventsResponse(accepted=len(events), queue_depth=queue.depth), status_code=202)
+
+
+@router.get("/ingestion/stats")
+async def get_ingestion_stats(queue: WriteBehindQueue[TrackingEvent] = Depends(get_tracking_events)):
+    return queue.describe()
\ No newline at end of file
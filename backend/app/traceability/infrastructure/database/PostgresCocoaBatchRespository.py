@@ -1,104 +1,527 @@
-from sqlalchemy import Column, Float, DateTime, Enum as SQLEnum, JSON, String
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import (
+    Column,
+    Float,
+    DateTime,
+    Enum as SQLEnum,
+    ForeignKey,
+    Index,
+    Integer,
+    JSON,
+    Row,
+    String,
+    Uuid,
+    and_,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+import heapq
+from functools import partial
+from itertools import chain
+from operator import itemgetter
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
 from uuid import UUID
 from datetime import datetime
 
-from app.shared_kernel.database import Base
+from app.shared_kernel.database import Base, upsert
+from app.shared_kernel.geo import BoundingBox, encode_geohash, haversine_km
+from app.shared_kernel.exceptions import ConcurrencyConflictError
+
 
 from app.traceability.domain.CocoaBatchRepositoryInterface import CocoaBatchRepositoryInterface
 from app.traceability.domain.CocoaBatch import CocoaBatch
-from app.traceability.domain import Location, TransportMode, Quantity
+from app.traceability.domain import (
+    BatchProjection,
+    BatchTransition,
+    BatchWriteListener,
+    BatchesWritten,
+    TransitionApplied,
+    TransitionedRow,
+    TransportMode,
+    Quantity,
+    intern_location,
+)
 from app.traceability.domain.TrackingEntry import TrackingEntry
 from app.traceability.domain.BatchStatus import BatchStatus
 
 
 class CocoaBatchModel(Base):
     __tablename__ = "cocoa_batches"
-
-    id = Column(PG_UUID(as_uuid=True), primary_key=True)
-    producer_id = Column(PG_UUID(as_uuid=True), nullable=False)
+    
+    id = Column(Uuid, primary_key=True)
+    producer_id = Column(Uuid, nullable=False)
     quantity = Column(Float, nullable=False)
     harvest_date = Column(DateTime, nullable=False)
     status = Column(String, nullable=False)
     current_location = Column(JSON, nullable=False)
-    tracking_history = Column(JSON, nullable=False)
+    country = Column(String, nullable=False)
+    origin_country = Column(String, nullable=False)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    geohash = Column(String, nullable=False)
+    version = Column(Integer, nullable=False, default=1)
+    
+    __table_args__ = (
+        Index("ix_cocoa_batches_geohash", "geohash"),
+        Index("ix_cocoa_batches_producer_status_harvest", "producer_id", "status", "harvest_date", "id"),
+        Index("ix_cocoa_batches_producer_harvest", "producer_id", "harvest_date", "id"),
+        Index("ix_cocoa_batches_country_harvest", "country", "harvest_date", "id"),
+        Index("ix_cocoa_batches_harvest", "harvest_date", "id"),
+    )
+
+
+class TrackingEntryModel(Base):
+    __tablename__ = "tracking_entries"
+    
+    batch_id = Column(Uuid, ForeignKey("cocoa_batches.id", ondelete="CASCADE"), primary_key=True)
+    sequence = Column(Integer, primary_key=True, autoincrement=False)
+    timestamp = Column(DateTime, nullable=False)
+    action = Column(String, nullable=False)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    region = Column(String, nullable=False)
+    country = Column(String, nullable=False)
+    transport_mode = Column(String, nullable=True)
+    distance = Column(Float, nullable=True)
+
 
 class PostgresCocoaBatchRepository(CocoaBatchRepositoryInterface):
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession, listeners: Sequence[BatchWriteListener] = ()):
         self._session = session
+        self._listeners = list(listeners)
     
     async def save(self, batch: CocoaBatch) -> None:
-        model = CocoaBatchModel(
-            id=batch.id.value,
-            producer_id=batch.producer_id.value,
-            quantity=batch.quantity.value,
-            harvest_date=batch._harvest_date,
-            status=batch.status.value,
-            current_location={
-                "latitude": batch._current_location.latitude,
-                "longitude": batch._current_location.longitude,
-                "region": batch._current_location.region,
-                "country": batch._current_location.country
-            },
-            tracking_history=[
-                {
-                    "timestamp": entry.timestamp.isoformat(),
-                    "action": entry.action,
-                    "location": {
-                        "latitude": entry.location.latitude,
-                        "longitude": entry.location.longitude,
-                        "region": entry.location.region,
-                        "country": entry.location.country
-                    },
-                    "transport_mode": entry.transport_mode.value if entry.transport_mode else None,
-                    "distance": entry.distance
-                }
-                for entry in batch.tracking_history
-            ]
+        conflicts = await self._upsert_versioned([batch])
+        if conflicts:
+            await self._session.rollback()
+            raise ConcurrencyConflictError(
+                f"Batch {batch.id} was modified concurrently",
+                code="BATCH_VERSION_CONFLICT",
+                details={"batch_id": str(batch.id), "expected_version": batch.version}
+            )
+        
+        await self._session.commit()
+        batch.mark_persisted(batch.version + 1)
+    
+    async def save_versioned(self, batches: List[CocoaBatch]) -> List[UUID]:
+        conflicts = await self._upsert_versioned(batches)
+        
+        await self._session.commit()
+        for batch in batches:
+            if batch.id not in conflicts:
+                batch.mark_persisted(batch.version + 1)
+        return [batch.id for batch in batches if batch.id in conflicts]
+    
+    async def insert_all(self, batches: List[CocoaBatch]) -> None:
+        await self._session.execute(
+            insert(CocoaBatchModel),
+            [self._to_row(batch) for batch in batches]
         )
         
-        self._session.add(model)
-        self._session.commit()
+        entries = [row for batch in batches for row in self._pending_entry_rows(batch)]
+        if entries:
+            await self._session.execute(insert(TrackingEntryModel), entries)
+        await self._publish_written(batches, {batch.id: self._origin_country(batch) for batch in batches})
+        
+        await self._session.commit()
+        for batch in batches:
+            batch.mark_persisted(batch.version + 1)
     
-    async def find_by_id(self, batch_id: UUID) -> Optional[CocoaBatch]:
-        model = self._session.query(CocoaBatchModel).filter(
-            CocoaBatchModel.id == batch_id
-        ).first()
+    async def apply_transition(
+        self,
+        batch_ids: List[UUID],
+        transition: BatchTransition,
+        timestamp: datetime
+    ) -> List[UUID]:
+        # Transition ensembliste : un UPDATE gardé par le statut courant, puis un INSERT ... SELECT
+        # des entrées de traçabilité, sans charger ni hydrater les lots
+        if not batch_ids:
+            return []
+        
+        result = await self._session.execute(
+            update(CocoaBatchModel)
+            .where(
+                CocoaBatchModel.id.in_(batch_ids),
+                CocoaBatchModel.status == transition.from_status.value
+            )
+            .values(status=transition.to_status.value, version=CocoaBatchModel.version + 1)
+            .returning(
+                CocoaBatchModel.id,
+                CocoaBatchModel.producer_id,
+                CocoaBatchModel.origin_country,
+                CocoaBatchModel.quantity
+            )
+        )
+        rows = [TransitionedRow(*row) for row in result.tuples()]
+        transitioned = [row.batch_id for row in rows]
         
-        if model is None:
+        if transitioned:
+            next_sequence = (
+                select(func.coalesce(func.max(TrackingEntryModel.sequence), 0) + 1)
+                .where(TrackingEntryModel.batch_id == CocoaBatchModel.id)
+                .scalar_subquery()
+            )
+            await self._session.execute(
+                insert(TrackingEntryModel).from_select(
+                    ["batch_id", "sequence", "timestamp", "action", "latitude", "longitude", "region", "country"],
+                    select(
+                        CocoaBatchModel.id,
+                        next_sequence,
+                        literal(timestamp, DateTime),
+                        literal(transition.action),
+                        CocoaBatchModel.latitude,
+                        CocoaBatchModel.longitude,
+                        CocoaBatchModel.current_location["region"].as_string(),
+                        CocoaBatchModel.country,
+                    ).where(CocoaBatchModel.id.in_(transitioned))
+                )
+            )
+            shipped_at = (
+                await self._shipped_at(transitioned) if transition.to_status is BatchStatus.DELIVERED else {}
+            )
+            event = TransitionApplied(rows=rows, transition=transition, timestamp=timestamp, shipped_at=shipped_at)
+            for listener in self._listeners:
+                await listener.transition_applied(event)
+        
+        await self._session.commit()
+        return transitioned
+    
+    async def find_statuses(self, batch_ids: List[UUID]) -> Dict[UUID, BatchStatus]:
+        if not batch_ids:
+            return {}
+        result = await self._session.execute(
+            select(CocoaBatchModel.id, CocoaBatchModel.status).where(CocoaBatchModel.id.in_(batch_ids))
+        )
+        return {batch_id: BatchStatus(status) for batch_id, status in result.tuples()}
+    
+    async def find_by_id(
+        self,
+        batch_id: UUID,
+        projection: BatchProjection = BatchProjection.FULL
+    ) -> Optional[CocoaBatch]:
+        result = await self._session.execute(self._summary_query().where(CocoaBatchModel.id == batch_id))
+        row = result.one_or_none()
+        
+        if row is None:
             return None
         
-        return self._to_domain(model)
-
-    async def find_by_producer(self, producer_id: UUID) -> List[CocoaBatch]:
-        models = self._session.query(CocoaBatchModel).filter(
-            CocoaBatchModel.producer_id == producer_id
-        ).all()
+        if projection is BatchProjection.SUMMARY:
+            return self._to_domain(row)
+        histories = await self._load_history_rows([batch_id])
+        return self._to_domain(row, histories.get(batch_id, []))
+    
+    async def find_by_ids(
+        self,
+        batch_ids: List[UUID],
+        projection: BatchProjection = BatchProjection.FULL
+    ) -> List[CocoaBatch]:
+        if not batch_ids:
+            return []
+        
+        result = await self._session.execute(
+            self._summary_query().where(CocoaBatchModel.id.in_(batch_ids))
+        )
+        rows = result.all()
         
-        return [self._to_domain(model) for model in models]
+        if projection is BatchProjection.SUMMARY:
+            return [self._to_domain(row) for row in rows]
+        histories = await self._load_history_rows([row.id for row in rows])
+        return [self._to_domain(row, histories.get(row.id, [])) for row in rows]
     
-    def _to_domain(self, model: CocoaBatchModel) -> CocoaBatch:
-        location = Location(**model.current_location)
+    async def find_by_producer(
+        self,
+        producer_id: UUID,
+        projection: BatchProjection = BatchProjection.FULL
+    ) -> List[CocoaBatch]:
+        result = await self._session.execute(
+            self._summary_query().where(CocoaBatchModel.producer_id == producer_id)
+        )
+        rows = result.all()
         
-        tracking_history = [
+        if projection is BatchProjection.SUMMARY:
+            return [self._to_domain(row) for row in rows]
+        histories = await self._load_history_rows([row.id for row in rows])
+        return [self._to_domain(row, histories.get(row.id, [])) for row in rows]
+    
+    async def find_page(
+        self,
+        producer_id: Optional[UUID] = None,
+        status: Optional[BatchStatus] = None,
+        country: Optional[str] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 20
+    ) -> List[CocoaBatch]:
+        result = await self._session.execute(self._page_query(producer_id, status, country, after, limit))
+        return [self._to_domain(row) for row in result.all()]
+    
+    def _page_query(
+        self,
+        producer_id: Optional[UUID],
+        status: Optional[BatchStatus],
+        country: Optional[str],
+        after: Optional[Tuple[datetime, UUID]],
+        limit: int
+    ):
+        # Chaque combinaison de filtres a un index qui se termine par (harvest_date, id) :
+        # la page est lue dans l'ordre de l'index, sans tri de toutes les lignes correspondantes
+        query = self._summary_query()
+        if producer_id is not None:
+            query = query.where(CocoaBatchModel.producer_id == producer_id)
+        if status is not None:
+            query = query.where(CocoaBatchModel.status == status.value)
+        if country is not None:
+            query = query.where(CocoaBatchModel.country == country)
+        if after is not None:
+            query = query.where(tuple_(CocoaBatchModel.harvest_date, CocoaBatchModel.id) < tuple_(*after))
+        return query.order_by(CocoaBatchModel.harvest_date.desc(), CocoaBatchModel.id.desc()).limit(limit)
+    
+    async def find_within(
+        self,
+        bounding_box: BoundingBox,
+        near: Optional[Tuple[float, float]] = None,
+        radius_km: Optional[float] = None,
+        limit: int = 100,
+        chunk_size: int = 1000
+    ) -> List[Tuple[CocoaBatch, float]]:
+        # Filtre grossier sur les plages de geohash (index), puis exact sur latitude/longitude ;
+        # la distance est calculée côté application pour rester en SQL portable (pas de trigonométrie).
+        # Les lignes arrivent par paquets et seules les `limit` plus proches sont gardées : la mémoire
+        # reste bornée à limit + chunk_size même quand la boîte couvre une zone dense
+        cells = or_(*[
+            and_(CocoaBatchModel.geohash >= prefix, CocoaBatchModel.geohash < prefix + "{")
+            for prefix in bounding_box.geohash_prefixes()
+        ])
+        result = await self._session.stream(
+            self._summary_query().where(
+                cells,
+                CocoaBatchModel.latitude.between(bounding_box.min_latitude, bounding_box.max_latitude),
+                CocoaBatchModel.longitude.between(bounding_box.min_longitude, bounding_box.max_longitude)
+            )
+            .execution_options(yield_per=chunk_size)
+        )
+        
+        latitude, longitude = near if near is not None else bounding_box.center
+        nearest: List[Tuple[float, Row]] = []
+        async for partition in result.partitions():
+            candidates = []
+            for row in partition:
+                location = row.current_location
+                distance = haversine_km(latitude, longitude, location["latitude"], location["longitude"])
+                if radius_km is None or distance <= radius_km:
+                    candidates.append((distance, row))
+            nearest = heapq.nsmallest(limit, chain(nearest, candidates), key=itemgetter(0))
+        return [(self._to_domain(row), distance) for distance, row in nearest]
+    
+    async def stream_by_producer(self, producer_id: UUID, chunk_size: int = 1000) -> AsyncIterator[List[dict]]:
+        result = await self._session.stream(
+            select(
+                CocoaBatchModel.id,
+                CocoaBatchModel.producer_id,
+                CocoaBatchModel.quantity,
+                CocoaBatchModel.harvest_date,
+                CocoaBatchModel.status,
+                CocoaBatchModel.current_location,
+            )
+            .where(CocoaBatchModel.producer_id == producer_id)
+            .execution_options(yield_per=chunk_size)
+        )
+        async for partition in result.mappings().partitions():
+            yield [
+                {
+                    "id": row["id"],
+                    "producer_id": row["producer_id"],
+                    "quantity": row["quantity"],
+                    "harvest_date": row["harvest_date"],
+                    "status": row["status"],
+                    **row["current_location"],
+                }
+                for row in partition
+            ]
+    
+    async def find_tracking_history(self, batch_id: UUID) -> List[TrackingEntry]:
+        histories = await self._load_history_rows([batch_id])
+        return self._to_entries(histories.get(batch_id, []))
+    
+    async def _upsert_versioned(self, batches: List[CocoaBatch]) -> set:
+        # Une seule instruction multi-lignes ; une ligne n'est mise à jour que si sa version
+        # en base est celle lue par l'appelant, les autres ne sont pas renvoyées par RETURNING
+        if not batches:
+            return set()
+        
+        statement = upsert(self._session, CocoaBatchModel)
+        statement = statement.on_conflict_do_update(
+            index_elements=[CocoaBatchModel.id],
+            set_={
+                "status": statement.excluded.status,
+                "current_location": statement.excluded.current_location,
+                "country": statement.excluded.country,
+                "latitude": statement.excluded.latitude,
+                "longitude": statement.excluded.longitude,
+                "geohash": statement.excluded.geohash,
+                "version": statement.excluded.version,
+            },
+            where=CocoaBatchModel.version + 1 == statement.excluded.version
+        ).returning(CocoaBatchModel.id, CocoaBatchModel.origin_country)
+        
+        result = await self._session.execute(statement, [self._to_row(batch) for batch in batches])
+        written = dict(result.tuples().all())
+        saved = [batch for batch in batches if batch.id in written]
+        
+        entries = [row for batch in saved for row in self._pending_entry_rows(batch)]
+        if entries:
+            await self._session.execute(insert(TrackingEntryModel), entries)
+        await self._publish_written(saved, written)
+        return {batch.id for batch in batches} - written.keys()
+    
+    async def _publish_written(self, batches: List[CocoaBatch], origins: Dict[UUID, str]) -> None:
+        event = BatchesWritten(
+            batches=batches,
+            origins=origins,
+            shipped_at=await self._shipped_at(self._newly_delivered(batches))
+        )
+        for listener in self._listeners:
+            await listener.batches_written(event)
+    
+    async def _shipped_at(self, batch_ids: List[UUID]) -> Dict[UUID, datetime]:
+        if not batch_ids:
+            return {}
+        result = await self._session.execute(
+            select(TrackingEntryModel.batch_id, func.max(TrackingEntryModel.timestamp))
+            .where(TrackingEntryModel.batch_id.in_(batch_ids), TrackingEntryModel.action == "SHIPPED")
+            .group_by(TrackingEntryModel.batch_id)
+        )
+        return dict(result.tuples().all())
+    
+    def _newly_delivered(self, batches: List[CocoaBatch]) -> List[UUID]:
+        return [
+            batch.id for batch in batches
+            if batch.status is BatchStatus.DELIVERED and batch.persisted_status is not BatchStatus.DELIVERED
+        ]
+    
+    def _origin_country(self, batch: CocoaBatch) -> str:
+        # Pays de récolte : figé à l'insertion, il n'est jamais réécrit par l'upsert
+        pending = batch.pending_tracking_entries
+        if batch.persisted_status is None and pending and pending[0].action == "HARVESTED":
+            return pending[0].location.country
+        return batch._current_location.country
+    
+    def _summary_query(self):
+        # Projection SUMMARY : colonnes scalaires seulement, sans entités ORM ni historique
+        tracking_count = (
+            select(func.count())
+            .where(TrackingEntryModel.batch_id == CocoaBatchModel.id)
+            .correlate(CocoaBatchModel)
+            .scalar_subquery()
+        )
+        return select(
+            CocoaBatchModel.id,
+            CocoaBatchModel.producer_id,
+            CocoaBatchModel.quantity,
+            CocoaBatchModel.harvest_date,
+            CocoaBatchModel.status,
+            CocoaBatchModel.current_location,
+            CocoaBatchModel.version,
+            tracking_count.label("tracking_count"),
+        )
+    
+    async def _load_history_rows(self, batch_ids: Iterable[UUID]) -> Dict[UUID, List[tuple]]:
+        batch_ids = list(batch_ids)
+        if not batch_ids:
+            return {}
+        
+        result = await self._session.execute(
+            select(
+                TrackingEntryModel.batch_id,
+                TrackingEntryModel.timestamp,
+                TrackingEntryModel.action,
+                TrackingEntryModel.latitude,
+                TrackingEntryModel.longitude,
+                TrackingEntryModel.region,
+                TrackingEntryModel.country,
+                TrackingEntryModel.transport_mode,
+                TrackingEntryModel.distance,
+            )
+            .where(TrackingEntryModel.batch_id.in_(batch_ids))
+            .order_by(TrackingEntryModel.batch_id, TrackingEntryModel.sequence)
+        )
+        
+        histories: Dict[UUID, List[tuple]] = {}
+        for row in result.tuples():
+            histories.setdefault(row[0], []).append(row)
+        return histories
+    
+    def _to_entries(self, rows: List[tuple]) -> List[TrackingEntry]:
+        return [
             TrackingEntry(
-                timestamp=datetime.fromisoformat(entry["timestamp"]),
-                action=entry["action"],
-                location=Location(**entry["location"]),
-                transport_mode=TransportMode[entry["transport_mode"]] if entry["transport_mode"] else None,
-                distance=entry["distance"]
+                timestamp=timestamp,
+                action=action,
+                location=intern_location(latitude, longitude, region, country),
+                transport_mode=TransportMode(transport_mode) if transport_mode else None,
+                distance=distance
             )
-            for entry in model.tracking_history
+            for _, timestamp, action, latitude, longitude, region, country, transport_mode, distance in rows
         ]
+    
+    def _to_row(self, batch: CocoaBatch) -> dict:
+        return {
+            "id": batch.id,
+            "producer_id": batch.producer_id,
+            "quantity": batch.quantity.value,
+            "harvest_date": batch._harvest_date,
+            "status": batch.status.value,
+            "current_location": {
+                "latitude": batch._current_location.latitude,
+                "longitude": batch._current_location.longitude,
+                "region": batch._current_location.region,
+                "country": batch._current_location.country
+            },
+            "country": batch._current_location.country,
+            "origin_country": self._origin_country(batch),
+            "latitude": batch._current_location.latitude,
+            "longitude": batch._current_location.longitude,
+            "geohash": encode_geohash(batch._current_location.latitude, batch._current_location.longitude),
+            "version": batch.version + 1
+        }
+    
+    def _pending_entry_rows(self, batch: CocoaBatch) -> List[dict]:
+        return [
+            {
+                "batch_id": batch.id,
+                "sequence": batch.persisted_tracking_count + offset,
+                "timestamp": entry.timestamp,
+                "action": entry.action,
+                "latitude": entry.location.latitude,
+                "longitude": entry.location.longitude,
+                "region": entry.location.region,
+                "country": entry.location.country,
+                "transport_mode": entry.transport_mode.value if entry.transport_mode else None,
+                "distance": entry.distance
+            }
+            for offset, entry in enumerate(batch.pending_tracking_entries, start=1)
+        ]
+    
+    def _to_domain(self, row, history_rows: Optional[List[tuple]] = None) -> CocoaBatch:
+        current_location = row.current_location
+        location = intern_location(
+            current_location["latitude"],
+            current_location["longitude"],
+            current_location["region"],
+            current_location["country"]
+        )
         
         return CocoaBatch(
-            id=model.id,
-            producer_id=model.producer_id,
-            quantity=Quantity(model.quantity),
-            harvest_date=model.harvest_date,
-            status=BatchStatus(model.status),
+            id=row.id,
+            producer_id=row.producer_id,
+            quantity=Quantity(row.quantity),
+            harvest_date=row.harvest_date,
+            status=BatchStatus(row.status),
             current_location=location,
-            tracking_history=tracking_history
+            persisted_tracking_count=row.tracking_count,
+            version=row.version,
+            history_loader=partial(self._to_entries, history_rows) if history_rows is not None else None
         )
\ No newline at end of file
@@ -0,0 +1,68 @@
+from typing import Optional
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.traceability.domain import RoutePoints, TransportMode
+from app.traceability.domain.RoutePointRepositoryInterface import RoutePointRepositoryInterface
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import (
+    CocoaBatchModel,
+    TrackingEntryModel,
+)
+
+
+class PostgresRoutePointRepository(RoutePointRepositoryInterface):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+    
+    async def load_page(self, after: Optional[UUID] = None, limit: int = 1000) -> RoutePoints:
+        query = select(CocoaBatchModel.id).order_by(CocoaBatchModel.id).limit(limit)
+        if after is not None:
+            query = query.where(CocoaBatchModel.id > after)
+        batch_ids = list((await self._session.execute(query)).scalars())
+        
+        points = []
+        if batch_ids:
+            points = (await self._session.execute(
+                select(
+                    TrackingEntryModel.batch_id,
+                    TrackingEntryModel.sequence,
+                    TrackingEntryModel.latitude,
+                    TrackingEntryModel.longitude,
+                    TrackingEntryModel.transport_mode,
+                )
+                .where(TrackingEntryModel.batch_id.in_(batch_ids))
+                .order_by(TrackingEntryModel.batch_id, TrackingEntryModel.sequence)
+            )).all()
+        
+        positions = {batch_id: position for position, batch_id in enumerate(batch_ids)}
+        count = len(points)
+        return RoutePoints(
+            batch_ids=batch_ids,
+            batch_index=np.fromiter((positions[row[0]] for row in points), dtype=np.int64, count=count),
+            sequences=np.fromiter((row[1] for row in points), dtype=np.int64, count=count),
+            latitudes=np.fromiter((row[2] for row in points), dtype=np.float64, count=count),
+            longitudes=np.fromiter((row[3] for row in points), dtype=np.float64, count=count),
+            transport_modes=[TransportMode(row[4]) if row[4] else None for row in points]
+        )
+    
+    async def update_distances(self, points: RoutePoints, distances_km: np.ndarray) -> int:
+        legs = np.flatnonzero(~np.isnan(distances_km))
+        if len(legs) == 0:
+            return 0
+        
+        batch_ids = points.batch_ids
+        batch_index = points.batch_index[legs].tolist()
+        sequences = points.sequences[legs].tolist()
+        distances = distances_km[legs].tolist()
+        await self._session.execute(
+            update(TrackingEntryModel),
+            [
+                {"batch_id": batch_ids[index], "sequence": sequence, "distance": distance}
+                for index, sequence, distance in zip(batch_index, sequences, distances)
+            ]
+        )
+        await self._session.commit()
+        return len(legs)
\ No newline at end of file
@@ -0,0 +1,31 @@
+import asyncio
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.shared_kernel import AsyncSessionLocal, config
+from app.traceability.application.RecomputeRouteDistancesService import RecomputeRouteDistancesService
+from app.traceability.domain import RouteDistanceCalculator, TransportMode
+from app.traceability.infrastructure.database.PostgresRoutePointRepository import PostgresRoutePointRepository
+from app.carbon_footprint.application.FootprintReportService import FootprintReportService
+from app.carbon_footprint.infrastructure.database.PostgresFootprintAggregateRepository import (
+    PostgresFootprintAggregateRepository,
+)
+
+
+async def main() -> None:
+    distances = RouteDistanceCalculator({
+        TransportMode.TRUCK: config.truck_detour_factor,
+        TransportMode.TRAIN: config.train_detour_factor,
+    })
+    async with AsyncSessionLocal() as db:
+        updated = await RecomputeRouteDistancesService(PostgresRoutePointRepository(db), distances).execute()
+        print(f"✅ Distances recalculées pour {updated} étapes de transport")
+        # Les agrégats d'empreinte dépendent des distances : ils sont reconstruits dans la foulée
+        rebuilt = await FootprintReportService(PostgresFootprintAggregateRepository(db)).rebuild()
+    print(f"✅ Agrégats d'empreinte carbone reconstruits pour {rebuilt} lots")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,177 @@
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+from benchmarks.common import latency_summary, print_report, use_sqlite_database
+
+use_sqlite_database("async_lookup")
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.shared_kernel import SessionLocal, async_engine, engine, get_async_db_context, init_db
+from app.traceability.domain import (
+    BatchProjection,
+    BatchStatus,
+    CocoaBatch,
+    Location,
+    Quantity,
+    TrackingEntry,
+    TransportMode,
+)
+from app.traceability.infrastructure.api.TraceabilityRouter import get_batch_repository
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import (
+    CocoaBatchModel,
+    PostgresCocoaBatchRepository,
+    TrackingEntryModel,
+)
+
+
+class BlockingCocoaBatchRepository(PostgresCocoaBatchRepository):
+    def __init__(self, session: Session):
+        self._session = session
+
+    async def find_by_id(
+        self,
+        batch_id: UUID,
+        projection: BatchProjection = BatchProjection.FULL
+    ) -> Optional[CocoaBatch]:
+        batches = await self.find_by_ids([batch_id], projection)
+        return batches[0] if batches else None
+
+    async def find_by_ids(
+        self,
+        batch_ids: List[UUID],
+        projection: BatchProjection = BatchProjection.FULL
+    ) -> List[CocoaBatch]:
+        rows = self._session.execute(
+            self._summary_query().where(CocoaBatchModel.id.in_(batch_ids))
+        ).all()
+        if not rows:
+            return []
+        histories = {}
+        for entry in self._session.execute(
+            select(
+                TrackingEntryModel.batch_id,
+                TrackingEntryModel.timestamp,
+                TrackingEntryModel.action,
+                TrackingEntryModel.latitude,
+                TrackingEntryModel.longitude,
+                TrackingEntryModel.region,
+                TrackingEntryModel.country,
+                TrackingEntryModel.transport_mode,
+                TrackingEntryModel.distance,
+            )
+            .where(TrackingEntryModel.batch_id.in_([row.id for row in rows]))
+            .order_by(TrackingEntryModel.batch_id, TrackingEntryModel.sequence)
+        ).tuples():
+            histories.setdefault(entry[0], []).append(entry)
+        return [self._to_domain(row, histories.get(row.id, [])) for row in rows]
+
+
+def blocking_batch_repository():
+    db = SessionLocal()
+    try:
+        yield BlockingCocoaBatchRepository(db)
+    finally:
+        db.close()
+
+
+def simulate_query_latency(delay_ms: float) -> None:
+    # Chaque SELECT sur cocoa_batches dort côté SQLite pour reproduire une requête lente
+    for sync_engine in (engine, async_engine.sync_engine):
+        @event.listens_for(sync_engine, "connect")
+        def register_sleep(dbapi_connection, _):
+            dbapi_connection.create_function("bench_sleep", 1, lambda ms: time.sleep(ms / 1000) or 1)
+
+        @event.listens_for(sync_engine, "before_cursor_execute", retval=True)
+        def slow_down(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("SELECT") and "FROM cocoa_batches" in statement and "WHERE" in statement:
+                statement = f"{statement} AND bench_sleep({delay_ms}) = 1"
+            return statement, parameters
+
+
+async def seed(batches: int, history: int) -> list:
+    ids = []
+    warehouse = Location(latitude=5.35, longitude=-4.01, region="Abidjan", country="CI")
+    async with get_async_db_context() as db:
+        repository = PostgresCocoaBatchRepository(db)
+        for _ in range(batches):
+            batch = CocoaBatch(
+                id=uuid4(),
+                producer_id=uuid4(),
+                quantity=Quantity(1000.0),
+                harvest_date=datetime(2024, 10, 1),
+                status=BatchStatus.HARVESTED,
+                current_location=warehouse,
+            )
+            batch._tracking_history += tuple(
+                TrackingEntry(
+                    timestamp=datetime(2024, 10, 2),
+                    action="SHIPPED",
+                    location=warehouse,
+                    transport_mode=TransportMode.TRUCK,
+                    distance=120.0,
+                )
+                for _ in range(history)
+            )
+            await repository.save(batch)
+            ids.append(batch.id)
+    return ids
+
+
+async def drive(ids: list, requests: int, concurrency: int) -> dict:
+    samples = []
+    queue = asyncio.Queue()
+    for index in range(requests):
+        queue.put_nowait(ids[index % len(ids)])
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        async def worker():
+            while not queue.empty():
+                batch_id = queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.get(f"/api/traceability/batches/{batch_id}")
+                samples.append(time.perf_counter() - start)
+                assert response.status_code == 200, response.text
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return latency_summary(samples, elapsed)
+
+
+async def main(args: argparse.Namespace) -> None:
+    init_db()
+    ids = await seed(args.batches, args.history)
+    if args.query_delay_ms:
+        await async_engine.dispose()
+        engine.dispose()
+        simulate_query_latency(args.query_delay_ms)
+
+    app.dependency_overrides[get_batch_repository] = blocking_batch_repository
+    blocking = await drive(ids, args.requests, args.concurrency)
+    app.dependency_overrides.clear()
+    native = await drive(ids, args.requests, args.concurrency)
+
+    print_report({
+        "benchmark": "concurrent GET /batches/{id}",
+        "parameters": vars(args),
+        "blocking_session": blocking,
+        "async_session": native,
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batches", type=int, default=500)
+    parser.add_argument("--history", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--query-delay-ms", type=float, default=0.0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,97 @@
+import argparse
+import asyncio
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from benchmarks.common import Stopwatch, latency_summary, print_report, use_sqlite_database
+
+use_sqlite_database("batch_listing")
+
+from sqlalchemy import text
+
+from app.shared_kernel import AsyncSessionLocal, id_generator, init_db
+from app.traceability.domain import BatchStatus, CocoaBatch, Location, Quantity
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import PostgresCocoaBatchRepository
+
+CHUNK_SIZE = 1000
+FARMS = [
+    Location(latitude=5.35, longitude=-4.01, region="Abidjan", country="CI"),
+    Location(latitude=6.82, longitude=-5.28, region="Yamoussoukro", country="CI"),
+    Location(latitude=5.56, longitude=-0.20, region="Accra", country="GH"),
+]
+
+
+async def seed(args: argparse.Namespace, rng: random.Random) -> list:
+    producer_ids = [id_generator.new_id() for _ in range(args.producers)]
+    start = datetime(2024, 1, 1)
+    batches = [
+        CocoaBatch.harvest(
+            id=id_generator.new_id(),
+            producer_id=rng.choice(producer_ids),
+            quantity=Quantity(750.0),
+            harvest_date=start + timedelta(minutes=rng.randrange(525_600)),
+            location=rng.choice(FARMS)
+        )
+        for _ in range(args.batches)
+    ]
+    for chunk in range(0, len(batches), CHUNK_SIZE):
+        async with AsyncSessionLocal() as db:
+            await PostgresCocoaBatchRepository(db).insert_all(batches[chunk:chunk + CHUNK_SIZE])
+    return producer_ids
+
+
+async def query_plan(repository: PostgresCocoaBatchRepository, filters: Dict[str, object]) -> str:
+    query = repository._page_query(after=(datetime(2024, 7, 1), id_generator.new_id()), limit=20, **filters)
+    compiled = query.compile(repository._session.bind, compile_kwargs={"literal_binds": True})
+    result = await repository._session.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+    return " | ".join(row[-1] for row in result.all())
+
+
+async def walk(repository: PostgresCocoaBatchRepository, filters: Dict[str, object], pages: int) -> dict:
+    samples = []
+    after: Optional[tuple] = None
+    with Stopwatch() as watch:
+        for _ in range(pages):
+            with Stopwatch() as page:
+                batches = await repository.find_page(after=after, limit=20, **filters)
+            samples.append(page.elapsed)
+            if len(batches) < 20:
+                break
+            after = (batches[-1].harvest_date, batches[-1].id)
+    return latency_summary(samples, watch.elapsed)
+
+
+async def main(args: argparse.Namespace) -> int:
+    init_db()
+    rng = random.Random(args.seed)
+    producer_ids = await seed(args, rng)
+
+    shapes = {
+        "unfiltered": {},
+        "producer": {"producer_id": producer_ids[0]},
+        "producer_status": {"producer_id": producer_ids[0], "status": BatchStatus.HARVESTED},
+        "country": {"country": "CI"},
+    }
+    report = {"benchmark": f"keyset listing over {args.batches} batches", "shapes": {}, "temp_sorts": []}
+    async with AsyncSessionLocal() as db:
+        repository = PostgresCocoaBatchRepository(db)
+        for name, filters in shapes.items():
+            plan = await query_plan(repository, {"producer_id": None, "status": None, "country": None, **filters})
+            report["shapes"][name] = {"plan": plan, **await walk(repository, filters, args.pages)}
+            # Un tri temporaire signifie que chaque page trie toutes les lignes du filtre au lieu de suivre l'index
+            if "TEMP B-TREE" in plan:
+                report["temp_sorts"].append(name)
+
+    print_report(report)
+    return 1 if report["temp_sorts"] else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batches", type=int, default=50_000)
+    parser.add_argument("--producers", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=50, help="pages parcourues par forme de requête")
+    parser.add_argument("--seed", type=int, default=42)
+    sys.exit(asyncio.run(main(parser.parse_args())))
\ No newline at end of file
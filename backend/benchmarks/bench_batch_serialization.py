@@ -0,0 +1,151 @@
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime
+from uuid import UUID
+
+from benchmarks.common import Stopwatch, latency_summary, print_report, use_sqlite_database
+
+use_sqlite_database("batch_serialization")
+os.environ["CACHE_BACKEND"] = "none"
+
+from fastapi import Depends, HTTPException
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.shared_kernel import get_async_db_context, id_generator, init_db
+from app.traceability.application.RetrieveBatchService import RetrieveBatchService
+from app.traceability.domain import (
+    BatchStatus,
+    CocoaBatch,
+    Location,
+    Quantity,
+    TrackingEntry,
+    TransportMode,
+)
+from app.traceability.infrastructure.api.TraceabilityRouter import get_retrieve_batch_service, serialize_batch
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import PostgresCocoaBatchRepository
+
+WAREHOUSE = Location(latitude=5.35, longitude=-4.01, region="Abidjan", country="CI")
+
+
+def legacy_batch_dict(batch: CocoaBatch) -> dict:
+    # Ancienne implémentation : dict construit à la main puis repassé par jsonable_encoder
+    return {
+        "id": str(batch.id),
+        "producer_id": str(batch.producer_id),
+        "quantity": batch.quantity.value,
+        "harvest_date": batch._harvest_date.isoformat(),
+        "status": batch.status.value,
+        "current_location": {
+            "latitude": batch._current_location.latitude,
+            "longitude": batch._current_location.longitude,
+            "region": batch._current_location.region,
+            "country": batch._current_location.country
+        },
+        "tracking_history": [
+            {
+                "timestamp": entry.timestamp.isoformat(),
+                "action": entry.action,
+                "location": {
+                    "latitude": entry.location.latitude,
+                    "longitude": entry.location.longitude,
+                    "region": entry.location.region,
+                    "country": entry.location.country
+                },
+                "transport_mode": entry.transport_mode.value if entry.transport_mode else None,
+                "distance": entry.distance
+            }
+            for entry in batch.tracking_history
+        ]
+    }
+
+
+@app.get("/bench/legacy/batches/{batch_id}")
+async def legacy_get_batch(batch_id: UUID, service: RetrieveBatchService = Depends(get_retrieve_batch_service)):
+    batch = await service.retrieve_batch(batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return legacy_batch_dict(batch)
+
+
+async def seed(history: int) -> CocoaBatch:
+    async with get_async_db_context() as db:
+        batch = CocoaBatch(
+            id=id_generator.new_id(),
+            producer_id=id_generator.new_id(),
+            quantity=Quantity(1000.0),
+            harvest_date=datetime(2024, 10, 1),
+            status=BatchStatus.HARVESTED,
+            current_location=WAREHOUSE,
+        )
+        batch._tracking_history += tuple(
+            TrackingEntry(
+                timestamp=datetime(2024, 10, 2, 8, 30),
+                action="SHIPPED",
+                location=WAREHOUSE,
+                transport_mode=TransportMode.TRUCK,
+                distance=120.0,
+            )
+            for _ in range(history)
+        )
+        await PostgresCocoaBatchRepository(db).save(batch)
+    return batch
+
+
+async def drive(client: AsyncClient, path: str, requests: int) -> dict:
+    samples = []
+    start = time.perf_counter()
+    for _ in range(requests):
+        request_start = time.perf_counter()
+        response = await client.get(path)
+        samples.append(time.perf_counter() - request_start)
+        assert response.status_code == 200, response.text
+    return latency_summary(samples, time.perf_counter() - start)
+
+
+def serialize_only(batch: CocoaBatch, iterations: int) -> dict:
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+
+    with Stopwatch() as legacy:
+        for _ in range(iterations):
+            JSONResponse(jsonable_encoder(legacy_batch_dict(batch)))
+    with Stopwatch() as single_pass:
+        for _ in range(iterations):
+            serialize_batch(batch)
+    return {
+        "legacy_us": round(legacy.elapsed / iterations * 1e6, 1),
+        "single_pass_us": round(single_pass.elapsed / iterations * 1e6, 1),
+        "speedup": round(legacy.elapsed / single_pass.elapsed, 1),
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    init_db()
+    results = {}
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        for history in args.histories:
+            batch = await seed(history)
+            legacy = await drive(client, f"/bench/legacy/batches/{batch.id}", args.requests)
+            single_pass = await drive(client, f"/api/traceability/batches/{batch.id}", args.requests)
+            results[f"history_{history}"] = {
+                "legacy_dict_jsonable_encoder": legacy,
+                "schema_single_pass": single_pass,
+                "rps_speedup": round(single_pass["throughput_rps"] / legacy["throughput_rps"], 2),
+                "serialization_only": serialize_only(batch, max(10, args.requests // 10)),
+            }
+
+    print_report({
+        "benchmark": "GET /batches/{id} serialization",
+        "parameters": vars(args),
+        **results,
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--histories", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--requests", type=int, default=300)
+    asyncio.run(main(parser.parse_args()))
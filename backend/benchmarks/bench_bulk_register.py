@@ -0,0 +1,78 @@
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from benchmarks.common import print_report, use_sqlite_database
+
+use_sqlite_database("bulk_register")
+
+from app.shared_kernel import AsyncSessionLocal, init_db
+from app.traceability.application.RegisterBatchService import RegisterBatchCommand, RegisterBatchService
+from app.traceability.domain import Location
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import PostgresCocoaBatchRepository
+
+FARM = Location(latitude=6.82, longitude=-5.28, region="Yamoussoukro", country="CI")
+
+
+def commands(count: int) -> list:
+    producer_id = uuid4()
+    return [
+        RegisterBatchCommand(
+            producer_id=producer_id,
+            quantity=750.0,
+            harvest_date=datetime(2024, 10, 1),
+            location=FARM,
+        )
+        for _ in range(count)
+    ]
+
+
+async def single_item_loop(items: list) -> float:
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        service = RegisterBatchService(PostgresCocoaBatchRepository(db))
+        for command in items:
+            await service.execute(
+                producer_id=command.producer_id,
+                quantity=command.quantity,
+                harvest_date=command.harvest_date,
+                location=command.location,
+            )
+    return time.perf_counter() - start
+
+
+async def bulk(items: list) -> float:
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        service = RegisterBatchService(PostgresCocoaBatchRepository(db))
+        results = await service.execute_many(items)
+    assert all(result.error is None for result in results)
+    return time.perf_counter() - start
+
+
+async def main(args: argparse.Namespace) -> None:
+    init_db()
+    single_elapsed = await single_item_loop(commands(args.rows))
+    bulk_elapsed = await bulk(commands(args.rows))
+
+    print_report({
+        "benchmark": "batch registration",
+        "parameters": vars(args),
+        "single_item_loop": {
+            "elapsed_s": round(single_elapsed, 4),
+            "rows_per_s": round(args.rows / single_elapsed, 1),
+        },
+        "execute_many": {
+            "elapsed_s": round(bulk_elapsed, 4),
+            "rows_per_s": round(args.rows / bulk_elapsed, 1),
+        },
+        "speedup": round(single_elapsed / bulk_elapsed, 1),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5000)
+    asyncio.run(main(parser.parse_args()))
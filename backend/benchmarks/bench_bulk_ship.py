@@ -0,0 +1,79 @@
+import argparse
+import asyncio
+import os
+from datetime import datetime
+from uuid import uuid4
+
+from benchmarks.common import Stopwatch, print_report, use_sqlite_database
+
+use_sqlite_database("bulk_ship")
+os.environ["CACHE_BACKEND"] = "none"
+
+from app.shared_kernel import AsyncSessionLocal, init_db
+from app.traceability.application.RegisterBatchService import RegisterBatchCommand, RegisterBatchService
+from app.traceability.application.ShipBatchService import ShipBatchService
+from app.traceability.domain import Location, TransportMode
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import PostgresCocoaBatchRepository
+
+FARM = Location(latitude=6.82, longitude=-5.28, region="Yamoussoukro", country="CI")
+PORT = Location(latitude=5.31, longitude=-4.02, region="Abidjan", country="CI")
+
+
+async def register(count: int) -> list:
+    producer_id = uuid4()
+    async with AsyncSessionLocal() as db:
+        results = await RegisterBatchService(PostgresCocoaBatchRepository(db)).execute_many([
+            RegisterBatchCommand(producer_id, 750.0, datetime(2024, 10, 1), FARM)
+            for _ in range(count)
+        ])
+    return [result.batch.id for result in results]
+
+
+async def ship_one_by_one(batch_ids: list) -> float:
+    async with AsyncSessionLocal() as db:
+        service = ShipBatchService(PostgresCocoaBatchRepository(db))
+        with Stopwatch() as watch:
+            for batch_id in batch_ids:
+                await service.execute(batch_id, PORT, TransportMode.TRUCK)
+    return watch.elapsed
+
+
+async def ship_consolidated(batch_ids: list) -> tuple:
+    async with AsyncSessionLocal() as db:
+        service = ShipBatchService(PostgresCocoaBatchRepository(db))
+        with Stopwatch() as watch:
+            results = await service.execute_many(batch_ids, PORT, TransportMode.TRUCK)
+    return watch.elapsed, sum(1 for result in results if result.error is None)
+
+
+async def main(args: argparse.Namespace) -> None:
+    init_db()
+    single_elapsed = await ship_one_by_one(await register(args.batches))
+
+    batch_ids = await register(args.batches)
+    already_shipped = batch_ids[:args.already_shipped]
+    await ship_one_by_one(already_shipped)
+    bulk_elapsed, shipped = await ship_consolidated(batch_ids)
+
+    print_report({
+        "benchmark": "consolidated shipment",
+        "parameters": vars(args),
+        "execute_loop": {
+            "elapsed_s": round(single_elapsed, 4),
+            "batches_per_s": round(args.batches / single_elapsed, 1),
+        },
+        "execute_many": {
+            "elapsed_s": round(bulk_elapsed, 4),
+            "batches_per_s": round(args.batches / bulk_elapsed, 1),
+            "shipped": shipped,
+            "rejected": args.batches - shipped,
+        },
+        "speedup": round(single_elapsed / bulk_elapsed, 1),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batches", type=int, default=1000)
+    parser.add_argument("--already-shipped", type=int, default=50, help="lots déjà expédiés, rejetés individuellement")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,85 @@
+import argparse
+import asyncio
+import os
+from datetime import datetime
+from uuid import uuid4
+
+from benchmarks.common import Stopwatch, print_report, use_sqlite_database
+
+use_sqlite_database("bulk_transitions")
+os.environ["CACHE_BACKEND"] = "none"
+
+from app.shared_kernel import AsyncSessionLocal, init_db
+from app.traceability.application.DeliverBatchService import DeliverBatchService
+from app.traceability.application.ProcessBatchService import ProcessBatchService
+from app.traceability.application.RegisterBatchService import RegisterBatchCommand, RegisterBatchService
+from app.traceability.application.ShipBatchService import ShipBatchService
+from app.traceability.domain import BatchProjection, Location, TransportMode
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import PostgresCocoaBatchRepository
+
+FARM = Location(latitude=6.82, longitude=-5.28, region="Yamoussoukro", country="CI")
+PLANT = Location(latitude=52.37, longitude=4.90, region="Amsterdam", country="NL")
+
+
+async def in_transit_batches(count: int) -> list:
+    producer_id = uuid4()
+    async with AsyncSessionLocal() as db:
+        repository = PostgresCocoaBatchRepository(db)
+        results = await RegisterBatchService(repository).execute_many([
+            RegisterBatchCommand(producer_id, 750.0, datetime(2024, 10, 1), FARM)
+            for _ in range(count)
+        ])
+        batch_ids = [result.batch.id for result in results]
+        await ShipBatchService(repository).execute_many(batch_ids, PLANT, TransportMode.SHIP)
+    return batch_ids
+
+
+async def load_mutate_save(batch_ids: list) -> float:
+    async with AsyncSessionLocal() as db:
+        repository = PostgresCocoaBatchRepository(db)
+        with Stopwatch() as watch:
+            for batch_id in batch_ids:
+                batch = await repository.find_by_id(batch_id, projection=BatchProjection.SUMMARY)
+                batch.process("FERMENTATION")
+                await repository.save(batch)
+            for batch_id in batch_ids:
+                batch = await repository.find_by_id(batch_id, projection=BatchProjection.SUMMARY)
+                batch.deliver()
+                await repository.save(batch)
+    return watch.elapsed
+
+
+async def set_based(batch_ids: list) -> tuple:
+    async with AsyncSessionLocal() as db:
+        repository = PostgresCocoaBatchRepository(db)
+        with Stopwatch() as watch:
+            processed = await ProcessBatchService(repository).execute_many(batch_ids, "FERMENTATION")
+            delivered = await DeliverBatchService(repository).execute_many(batch_ids)
+    return watch.elapsed, sum(1 for result in processed + delivered if result.error is None)
+
+
+async def main(args: argparse.Namespace) -> None:
+    init_db()
+    loop_elapsed = await load_mutate_save(await in_transit_batches(args.batches))
+    bulk_elapsed, transitioned = await set_based(await in_transit_batches(args.batches))
+
+    print_report({
+        "benchmark": "process + deliver transitions",
+        "parameters": vars(args),
+        "load_mutate_save": {
+            "elapsed_s": round(loop_elapsed, 4),
+            "transitions_per_s": round(2 * args.batches / loop_elapsed, 1),
+        },
+        "set_based": {
+            "elapsed_s": round(bulk_elapsed, 4),
+            "transitions_per_s": round(2 * args.batches / bulk_elapsed, 1),
+            "transitioned": transitioned,
+        },
+        "speedup": round(loop_elapsed / bulk_elapsed, 1),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batches", type=int, default=1000)
+    asyncio.run(main(parser.parse_args()))
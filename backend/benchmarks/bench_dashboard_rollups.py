@@ -0,0 +1,141 @@
+import argparse
+import asyncio
+import os
+import random
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from benchmarks.common import Stopwatch, latency_summary, print_report, use_sqlite_database
+
+use_sqlite_database("dashboard_rollups")
+os.environ["CACHE_BACKEND"] = "none"
+
+from app.analytics.application.DashboardService import DashboardService
+from app.analytics.domain import DashboardRollup, harvest_month
+from app.analytics.infrastructure.database.DashboardRollupWriter import DashboardRollupWriter
+from app.analytics.infrastructure.database.PostgresDashboardRepository import PostgresDashboardRepository
+from app.shared_kernel import AsyncSessionLocal, init_db
+from app.traceability.domain import BatchProjection, BatchStatus, CocoaBatch, Location, Quantity, TrackingEntry, TransportMode
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import PostgresCocoaBatchRepository
+
+FARMS = [
+    Location(latitude=6.82, longitude=-5.28, region="Yamoussoukro", country="CI"),
+    Location(latitude=5.56, longitude=-0.20, region="Accra", country="GH"),
+]
+PORT = Location(latitude=52.37, longitude=4.90, region="Amsterdam", country="NL")
+STEPS = [
+    (BatchStatus.IN_TRANSIT, "SHIPPED"),
+    (BatchStatus.PROCESSED, "PROCESSED_FERMENTATION"),
+    (BatchStatus.DELIVERED, "DELIVERED"),
+]
+
+
+def synthetic_batch(producer_id, farm: Location, rng: random.Random) -> CocoaBatch:
+    harvest_date = datetime(2023, 1, 1) + timedelta(days=rng.randrange(730))
+    batch = CocoaBatch.harvest(
+        id=uuid4(),
+        producer_id=producer_id,
+        quantity=Quantity(rng.uniform(100.0, 2000.0)),
+        harvest_date=harvest_date,
+        location=farm
+    )
+    # Cycle de vie écrit directement pour dater les étapes sur plusieurs jours
+    timestamp = harvest_date
+    for status, action in STEPS[:rng.randrange(len(STEPS) + 1)]:
+        timestamp += timedelta(hours=rng.uniform(12.0, 240.0))
+        batch._status = status
+        batch._tracking_history += (
+            TrackingEntry(
+                timestamp=timestamp,
+                action=action,
+                location=PORT,
+                transport_mode=TransportMode.SHIP if action == "SHIPPED" else None,
+                distance=5000.0 if action == "SHIPPED" else None
+            ),
+        )
+    return batch
+
+
+async def seed(args: argparse.Namespace) -> list:
+    rng = random.Random(args.seed)
+    producer_ids = [uuid4() for _ in range(args.producers)]
+    for producer_id in producer_ids:
+        farm = rng.choice(FARMS)
+        async with AsyncSessionLocal() as db:
+            await PostgresCocoaBatchRepository(db, [DashboardRollupWriter(db)]).insert_all(
+                [synthetic_batch(producer_id, farm, rng) for _ in range(args.batches)]
+            )
+    return producer_ids
+
+
+def naive_dashboard(batches: list, months: int) -> DashboardRollup:
+    rollup = DashboardRollup()
+    for batch in batches:
+        quantity = batch.quantity.value
+        rollup.move(None, batch.status, quantity)
+        rollup.add_harvest(harvest_month(batch.harvest_date), quantity)
+        if batch.status is BatchStatus.DELIVERED:
+            shipped = [entry.timestamp for entry in batch.tracking_history if entry.action == "SHIPPED"]
+            delivered = [entry.timestamp for entry in batch.tracking_history if entry.action == "DELIVERED"]
+            if shipped and delivered:
+                rollup.add_delivery((max(delivered) - max(shipped)).total_seconds())
+    rollup.harvest_by_month = dict(sorted(rollup.harvest_by_month.items())[-months:])
+    return rollup
+
+
+async def measure(query, producer_ids: list, requests: int) -> tuple:
+    samples = []
+    with Stopwatch() as total:
+        for index in range(requests):
+            async with AsyncSessionLocal() as db:
+                with Stopwatch() as watch:
+                    rollup = await query(db, producer_ids[index % len(producer_ids)])
+            samples.append(watch.elapsed)
+    return latency_summary(samples, total.elapsed), rollup
+
+
+def same_dashboard(left: DashboardRollup, right: DashboardRollup) -> bool:
+    return (
+        {status: totals.batch_count for status, totals in left.by_status.items()}
+        == {status: totals.batch_count for status, totals in right.by_status.items()}
+        and {month: totals.batch_count for month, totals in left.harvest_by_month.items()}
+        == {month: totals.batch_count for month, totals in right.harvest_by_month.items()}
+        and left.timed_deliveries == right.timed_deliveries
+        and round(left.transit_seconds) == round(right.transit_seconds)
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    init_db()
+    with Stopwatch() as seeding:
+        producer_ids = await seed(args)
+
+    async def naive(db, producer_id):
+        batches = await PostgresCocoaBatchRepository(db).find_by_producer(producer_id, projection=BatchProjection.FULL)
+        return naive_dashboard(batches, args.months)
+
+    async def rollups(db, producer_id):
+        return await DashboardService(PostgresDashboardRepository(db)).for_producer(producer_id, args.months)
+
+    naive_summary, naive_rollup = await measure(naive, producer_ids, args.requests)
+    rollup_summary, rollup_rollup = await measure(rollups, producer_ids, args.requests)
+
+    print_report({
+        "benchmark": "producer dashboard",
+        "parameters": vars(args),
+        "seed_s": round(seeding.elapsed, 3),
+        "naive_python_aggregation": naive_summary,
+        "materialized_rollups": rollup_summary,
+        "same_result": same_dashboard(naive_rollup, rollup_rollup),
+        "speedup_p50": round(naive_summary["p50_ms"] / rollup_summary["p50_ms"], 1),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--producers", type=int, default=20)
+    parser.add_argument("--batches", type=int, default=2000, help="lots par producteur")
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,169 @@
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional
+from uuid import uuid4
+
+from benchmarks.common import Stopwatch, print_report
+
+from app.traceability.domain import (
+    BatchStatus,
+    CocoaBatch,
+    Quantity,
+    TrackingEntry,
+    TransportMode,
+    intern_location,
+)
+
+
+# Anciennes versions des objets du domaine : dataclasses avec __dict__, historique copié à chaque accès
+@dataclass(frozen=True)
+class LegacyQuantity:
+    value: float
+    unit: str = "kg"
+
+
+@dataclass(frozen=True)
+class LegacyLocation:
+    latitude: float
+    longitude: float
+    region: str
+    country: str
+
+
+@dataclass(frozen=True)
+class LegacyTrackingEntry:
+    timestamp: datetime
+    action: str
+    location: LegacyLocation
+    transport_mode: Optional[TransportMode] = None
+    distance: Optional[float] = None
+
+
+class LegacyCocoaBatch:
+    def __init__(self, id, producer_id, quantity, harvest_date, status, current_location, tracking_history):
+        self._id = id
+        self._producer_id = producer_id
+        self._quantity = quantity
+        self._harvest_date = harvest_date
+        self._status = status
+        self._current_location = current_location
+        self._tracking_history = tracking_history or []
+        self._persisted_tracking_count = len(self._tracking_history)
+        self._unsaved_from = len(self._tracking_history)
+
+    @property
+    def tracking_history(self) -> List[LegacyTrackingEntry]:
+        return self._tracking_history.copy()
+
+
+def database_rows(batches: int, history: int, warehouses: int) -> list:
+    # Chaque ligne porte ses propres objets, comme un curseur de base de données
+    producer_id = uuid4()
+    rows = []
+    for index in range(batches):
+        site = index % warehouses
+        location = (float(site) / 10, -float(site) / 10, f"Region {site}", "CI")
+        entries = [
+            (datetime(2024, 10, 1) + timedelta(days=day), "SHIPPED", *location, "TRUCK", 120.0)
+            for day in range(history)
+        ]
+        rows.append((uuid4(), producer_id, 750.0, datetime(2024, 9, 1), "IN_TRANSIT", location, entries))
+    return rows
+
+
+def hydrate_legacy(rows: list) -> list:
+    return [
+        LegacyCocoaBatch(
+            id=batch_id,
+            producer_id=producer_id,
+            quantity=LegacyQuantity(quantity),
+            harvest_date=harvest_date,
+            status=BatchStatus(status),
+            current_location=LegacyLocation(*location),
+            tracking_history=[
+                LegacyTrackingEntry(
+                    timestamp=timestamp,
+                    action=action,
+                    location=LegacyLocation(latitude, longitude, region, country),
+                    transport_mode=TransportMode(mode),
+                    distance=distance,
+                )
+                for timestamp, action, latitude, longitude, region, country, mode, distance in entries
+            ],
+        )
+        for batch_id, producer_id, quantity, harvest_date, status, location, entries in rows
+    ]
+
+
+def hydrate_compact(rows: list) -> list:
+    return [
+        CocoaBatch(
+            id=batch_id,
+            producer_id=producer_id,
+            quantity=Quantity(quantity),
+            harvest_date=harvest_date,
+            status=BatchStatus(status),
+            current_location=intern_location(*location),
+            tracking_history=[
+                TrackingEntry(
+                    timestamp=timestamp,
+                    action=action,
+                    location=intern_location(latitude, longitude, region, country),
+                    transport_mode=TransportMode(mode),
+                    distance=distance,
+                )
+                for timestamp, action, latitude, longitude, region, country, mode, distance in entries
+            ],
+        )
+        for batch_id, producer_id, quantity, harvest_date, status, location, entries in rows
+    ]
+
+
+def measure(hydrate, rows: list, reads: int) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    with Stopwatch() as hydration:
+        batches = hydrate(rows)
+    retained, hydration_peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    with Stopwatch() as access:
+        for _ in range(reads):
+            for batch in batches:
+                batch.tracking_history
+
+    return {
+        "hydration_s": round(hydration.elapsed, 3),
+        "retained_mib": round(retained / 2**20, 2),
+        "hydration_peak_mib": round(hydration_peak / 2**20, 2),
+        "bytes_per_batch": round(retained / len(batches), 1),
+        "history_access_s": round(access.elapsed, 3),
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    rows = database_rows(args.batches, args.history, args.warehouses)
+    legacy = measure(hydrate_legacy, rows, args.reads)
+    intern_location.cache_clear()
+    compact = measure(hydrate_compact, rows, args.reads)
+
+    print_report({
+        "benchmark": "domain object memory",
+        "parameters": vars(args),
+        "legacy_dict_dataclasses": legacy,
+        "slotted_interned": compact,
+        "retained_ratio": round(legacy["retained_mib"] / compact["retained_mib"], 2),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batches", type=int, default=100_000)
+    parser.add_argument("--history", type=int, default=3)
+    parser.add_argument("--warehouses", type=int, default=200)
+    parser.add_argument("--reads", type=int, default=3)
+    main(parser.parse_args())
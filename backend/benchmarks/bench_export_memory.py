@@ -0,0 +1,102 @@
+import argparse
+import asyncio
+import time
+import tracemalloc
+from datetime import datetime
+from uuid import uuid4
+
+from benchmarks.common import print_report, use_sqlite_database
+
+use_sqlite_database("export_memory")
+
+from app.main import app
+from app.shared_kernel import AsyncSessionLocal, init_db
+from app.traceability.application.RegisterBatchService import RegisterBatchCommand, RegisterBatchService
+from app.traceability.domain import Location
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import PostgresCocoaBatchRepository
+
+FARM = Location(latitude=6.82, longitude=-5.28, region="Yamoussoukro", country="CI")
+
+
+async def seed(producer_id, rows: int) -> None:
+    async with AsyncSessionLocal() as db:
+        service = RegisterBatchService(PostgresCocoaBatchRepository(db))
+        for offset in range(0, rows, 5000):
+            await service.execute_many([
+                RegisterBatchCommand(producer_id, 750.0, datetime(2024, 10, 1), FARM)
+                for _ in range(min(5000, rows - offset))
+            ])
+
+
+async def measure_export(producer_id, export_format: str) -> dict:
+    # Appel ASGI direct : le transport httpx bufferise tout le corps et fausserait la mesure
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": f"/api/traceability/producers/{producer_id}/batches:export",
+        "raw_path": f"/api/traceability/producers/{producer_id}/batches:export".encode(),
+        "query_string": f"format={export_format}".encode(),
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+        "root_path": "",
+    }
+    size = 0
+    requested = False
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal size
+        if message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    disconnected.set()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"elapsed_s": round(elapsed, 3), "bytes": size, "peak_mib": round(peak / 2**20, 2)}
+
+
+async def measure_materialized(producer_id) -> dict:
+    tracemalloc.start()
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        batches = await PostgresCocoaBatchRepository(db).find_by_producer(producer_id)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"elapsed_s": round(elapsed, 3), "batches": len(batches), "peak_mib": round(peak / 2**20, 2)}
+
+
+async def main(args: argparse.Namespace) -> None:
+    init_db()
+    report = {"benchmark": "producer export memory", "parameters": vars(args), "sizes": {}}
+    for rows in args.sizes:
+        producer_id = uuid4()
+        await seed(producer_id, rows)
+        report["sizes"][rows] = {
+            "find_by_producer": await measure_materialized(producer_id),
+            "ndjson_stream": await measure_export(producer_id, "ndjson"),
+            "csv_stream": await measure_export(producer_id, "csv"),
+        }
+    print_report(report)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000])
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,80 @@
+import argparse
+from collections import defaultdict
+from uuid import uuid4
+
+import numpy as np
+
+from benchmarks.common import Stopwatch, print_report
+
+from app.carbon_footprint.application.FootprintCalculator import FootprintCalculator
+from app.carbon_footprint.domain import EMISSION_FACTORS_KG_CO2E_PER_TONNE_KM, TRANSPORT_MODES, TransportLegs
+
+
+def synthetic_legs(entries: int, batches: int, producers: int, seed: int) -> TransportLegs:
+    rng = np.random.default_rng(seed)
+    producer_ids = [uuid4() for _ in range(producers)]
+    batch_masses_t = rng.uniform(0.1, 25.0, size=batches)
+    batch_index = rng.integers(0, batches, size=entries)
+    return TransportLegs(
+        batch_ids=[uuid4() for _ in range(batches)],
+        producer_ids=[producer_ids[index % producers] for index in range(batches)],
+        batch_index=batch_index,
+        modes=rng.integers(0, len(TRANSPORT_MODES), size=entries),
+        distances_km=rng.uniform(5.0, 9000.0, size=entries),
+        masses_t=batch_masses_t[batch_index],
+    )
+
+
+def per_entry_loop(legs: TransportLegs) -> dict:
+    emissions = defaultdict(float)
+    for batch, mode, distance, mass in zip(
+        legs.batch_index.tolist(), legs.modes.tolist(), legs.distances_km.tolist(), legs.masses_t.tolist()
+    ):
+        emissions[batch] += EMISSION_FACTORS_KG_CO2E_PER_TONNE_KM[TRANSPORT_MODES[mode]] * distance * mass
+    return emissions
+
+
+def main(args: argparse.Namespace) -> None:
+    legs = synthetic_legs(args.entries, args.batches, args.producers, args.seed)
+    calculator = FootprintCalculator()
+
+    with Stopwatch() as loop:
+        expected = per_entry_loop(legs)
+    with Stopwatch() as vectorized:
+        footprints = calculator.compute(legs)
+    with Stopwatch() as summary:
+        totals = calculator.summarize(legs)
+
+    max_error = max(
+        abs(footprint.emissions_kg_co2e - expected.get(index, 0.0))
+        for index, footprint in enumerate(footprints)
+    )
+
+    print_report({
+        "benchmark": "carbon footprint engine",
+        "parameters": vars(args),
+        "per_entry_loop": {
+            "elapsed_s": round(loop.elapsed, 4),
+            "entries_per_s": round(args.entries / loop.elapsed, 1),
+        },
+        "vectorized_per_batch": {
+            "elapsed_s": round(vectorized.elapsed, 4),
+            "entries_per_s": round(args.entries / vectorized.elapsed, 1),
+        },
+        "vectorized_summary": {
+            "elapsed_s": round(summary.elapsed, 4),
+            "entries_per_s": round(args.entries / summary.elapsed, 1),
+        },
+        "speedup": round(loop.elapsed / vectorized.elapsed, 1),
+        "total_emissions_kg_co2e": round(totals["emissions_kg_co2e"], 3),
+        "max_abs_error_kg_co2e": max_error,
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--batches", type=int, default=100_000)
+    parser.add_argument("--producers", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=42)
+    main(parser.parse_args())
@@ -0,0 +1,107 @@
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from benchmarks.common import print_report, use_sqlite_database
+
+use_sqlite_database("id_ordering")
+
+from app.shared_kernel import Base, IdGenerator, RandomIdGenerator, TimeOrderedIdGenerator
+from app.shared_kernel.geo import encode_geohash
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import CocoaBatchModel
+
+FARM = {"latitude": 6.82, "longitude": -5.28, "region": "Yamoussoukro", "country": "CI"}
+FARM_GEOHASH = encode_geohash(FARM["latitude"], FARM["longitude"])
+
+
+def rows(ids: IdGenerator, producer_id, count: int) -> list:
+    return [
+        {
+            "id": ids.new_id(),
+            "producer_id": producer_id,
+            "quantity": 750.0,
+            "harvest_date": datetime(2024, 10, 1),
+            "status": "HARVESTED",
+            "current_location": FARM,
+            "country": "CI",
+            "origin_country": "CI",
+            "latitude": FARM["latitude"],
+            "longitude": FARM["longitude"],
+            "geohash": FARM_GEOHASH,
+            "version": 1,
+        }
+        for _ in range(count)
+    ]
+
+
+async def run(name: str, ids: IdGenerator, args: argparse.Namespace) -> dict:
+    if args.database_url:
+        url = args.database_url
+    else:
+        path = os.path.join(tempfile.gettempdir(), f"sustaain_id_ordering_{name}.db")
+        if os.path.exists(path):
+            os.remove(path)
+        url = f"sqlite+aiosqlite:///{path}"
+
+    engine = create_async_engine(url)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+
+    producer_id = uuid4()
+    chunk_rates = []
+    start = time.perf_counter()
+    for _ in range(args.rows // args.chunk_size):
+        chunk = rows(ids, producer_id, args.chunk_size)
+        chunk_start = time.perf_counter()
+        async with engine.begin() as connection:
+            await connection.execute(insert(CocoaBatchModel), chunk)
+        chunk_rates.append(args.chunk_size / (time.perf_counter() - chunk_start))
+    elapsed = time.perf_counter() - start
+
+    async with engine.connect() as connection:
+        if engine.dialect.name == "postgresql":
+            index_bytes = (await connection.execute(
+                text("SELECT pg_relation_size('cocoa_batches_pkey')")
+            )).scalar_one()
+        else:
+            page_size = (await connection.execute(text("PRAGMA page_size"))).scalar_one()
+            page_count = (await connection.execute(text("PRAGMA page_count"))).scalar_one()
+            index_bytes = page_size * page_count
+    await engine.dispose()
+
+    tail = chunk_rates[-max(1, len(chunk_rates) // 10):]
+    return {
+        "elapsed_s": round(elapsed, 4),
+        "rows_per_s": round(args.rows / elapsed, 1),
+        "last_10pct_rows_per_s": round(sum(tail) / len(tail), 1),
+        "pk_index_bytes" if engine.dialect.name == "postgresql" else "database_bytes": index_bytes,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    random_keys = await run("uuid4", RandomIdGenerator(), args)
+    ordered_keys = await run("uuid7", TimeOrderedIdGenerator(), args)
+
+    print_report({
+        "benchmark": "primary key ordering on cocoa_batches",
+        "parameters": {**vars(args), "database_url": args.database_url or "sqlite (temp files)"},
+        "random_uuid4": random_keys,
+        "time_ordered_uuid7": ordered_keys,
+        "speedup": round(random_keys["elapsed_s"] / ordered_keys["elapsed_s"], 2),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--database-url", default=None, help="URL async d'une base jetable (tables recréées), ex: postgresql+asyncpg://...")
+    asyncio.run(main(parser.parse_args()))
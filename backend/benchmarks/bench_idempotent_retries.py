@@ -0,0 +1,92 @@
+import argparse
+import asyncio
+import os
+import random
+
+from benchmarks.common import Stopwatch, print_report, use_sqlite_database
+
+use_sqlite_database("idempotent_retries")
+os.environ["CACHE_BACKEND"] = "none"
+
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.shared_kernel import DatabaseIdempotencyStore, InMemoryIdempotencyStore, IdempotencyMiddleware, init_db
+
+PRODUCER_ID = "00000000-0000-0000-0000-0000000000be"
+FARM = {"latitude": 6.82, "longitude": -5.28, "region": "Yamoussoukro", "country": "CI"}
+PORT = {"latitude": 43.30, "longitude": 5.37, "region": "Marseille", "country": "FR"}
+
+
+def use_store(store) -> None:
+    # Remplace le magasin du middleware déjà déclaré sur l'application
+    for middleware in app.user_middleware:
+        if middleware.cls is IdempotencyMiddleware:
+            middleware.kwargs["store"] = store
+    app.middleware_stack = None
+
+
+async def run(name: str, store, args: argparse.Namespace, rng: random.Random) -> dict:
+    use_store(store)
+    sends = 0
+    created = set()
+    shipped = 0
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        with Stopwatch() as watch:
+            for index in range(args.requests):
+                # Chaque appareil renvoie sa requête jusqu'à --max-retries fois (réponse perdue sur le réseau)
+                attempts = 1 + sum(1 for _ in range(args.max_retries) if rng.random() < args.retry_rate)
+                headers = {"Idempotency-Key": f"{name}-register-{index}"} if store is not None else {}
+                for _ in range(attempts):
+                    response = await client.post("/api/traceability/batches", headers=headers, json={
+                        "producer_id": PRODUCER_ID,
+                        "quantity": 750.0,
+                        "harvest_date": "2024-10-01T00:00:00",
+                        "location": FARM,
+                    })
+                    sends += 1
+                    batch_id = response.json()["id"]
+                    created.add(batch_id)
+                headers = {"Idempotency-Key": f"{name}-ship-{index}"} if store is not None else {}
+                for _ in range(attempts):
+                    response = await client.post(f"/api/traceability/batches/{batch_id}/ship", headers=headers, json={
+                        "destination": PORT,
+                        "transport_mode": "SHIP",
+                    })
+                    sends += 1
+                    shipped += response.status_code == 200
+    return {
+        "requests_sent": sends,
+        "elapsed_s": round(watch.elapsed, 4),
+        "throughput_rps": round(sends / watch.elapsed, 1),
+        "batches_created": len(created),
+        "duplicate_batches": len(created) - args.requests,
+        "ship_responses_200": shipped,
+        "idempotency": store.describe() if store is not None else None,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    init_db()
+    reports = {}
+    for name, store in (
+        ("no_key", None),
+        ("memory_store", InMemoryIdempotencyStore()),
+        ("database_store", DatabaseIdempotencyStore()),
+    ):
+        reports[name] = await run(name, store, args, random.Random(args.seed))
+
+    print_report({
+        "benchmark": "retried register + ship requests",
+        "parameters": vars(args),
+        **reports,
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500, help="requêtes logiques (enregistrement puis expédition)")
+    parser.add_argument("--retry-rate", type=float, default=0.3, help="probabilité de chaque nouvel envoi")
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(main(parser.parse_args()))
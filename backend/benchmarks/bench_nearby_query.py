@@ -0,0 +1,108 @@
+import argparse
+import asyncio
+import os
+import random
+from datetime import datetime
+from uuid import uuid4
+
+from benchmarks.common import Stopwatch, latency_summary, print_report, use_sqlite_database
+
+use_sqlite_database("nearby_query")
+os.environ["CACHE_BACKEND"] = "none"
+
+from sqlalchemy import select
+
+from app.shared_kernel import AsyncSessionLocal, BoundingBox, haversine_km, init_db
+from app.traceability.application.RegisterBatchService import RegisterBatchCommand, RegisterBatchService
+from app.traceability.domain import Location
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import (
+    CocoaBatchModel,
+    PostgresCocoaBatchRepository,
+)
+
+# Zone de production ivoirienne et ghanéenne
+AREA = BoundingBox(4.5, -8.5, 10.5, 0.5)
+CHUNK_SIZE = 5000
+
+
+async def populate(count: int, rng: random.Random) -> None:
+    producer_id = uuid4()
+    for start in range(0, count, CHUNK_SIZE):
+        async with AsyncSessionLocal() as db:
+            await RegisterBatchService(PostgresCocoaBatchRepository(db)).execute_many([
+                RegisterBatchCommand(
+                    producer_id,
+                    500.0,
+                    datetime(2024, 10, 1),
+                    Location(
+                        latitude=rng.uniform(AREA.min_latitude, AREA.max_latitude),
+                        longitude=rng.uniform(AREA.min_longitude, AREA.max_longitude),
+                        region="Zone",
+                        country="CI",
+                    ),
+                )
+                for _ in range(min(CHUNK_SIZE, count - start))
+            ])
+
+
+async def full_scan(latitude: float, longitude: float, radius_km: float, limit: int) -> int:
+    async with AsyncSessionLocal() as db:
+        rows = (await db.execute(
+            select(CocoaBatchModel.id, CocoaBatchModel.latitude, CocoaBatchModel.longitude)
+        )).all()
+    distances = sorted(
+        (distance, batch_id)
+        for batch_id, lat, lon in rows
+        for distance in (haversine_km(latitude, longitude, lat, lon),)
+        if distance <= radius_km
+    )
+    return len(distances[:limit])
+
+
+async def geohash_query(latitude: float, longitude: float, radius_km: float, limit: int) -> int:
+    async with AsyncSessionLocal() as db:
+        results = await PostgresCocoaBatchRepository(db).find_within(
+            BoundingBox.around(latitude, longitude, radius_km),
+            near=(latitude, longitude),
+            radius_km=radius_km,
+            limit=limit,
+        )
+    return len(results)
+
+
+async def measure(query, points: list, radius_km: float, limit: int) -> dict:
+    samples = []
+    found = 0
+    with Stopwatch() as total:
+        for latitude, longitude in points:
+            with Stopwatch() as watch:
+                found += await query(latitude, longitude, radius_km, limit)
+            samples.append(watch.elapsed)
+    return {**latency_summary(samples, total.elapsed), "found": found}
+
+
+async def main(args: argparse.Namespace) -> None:
+    init_db()
+    rng = random.Random(args.seed)
+    await populate(args.batches, rng)
+    points = [
+        (rng.uniform(AREA.min_latitude, AREA.max_latitude), rng.uniform(AREA.min_longitude, AREA.max_longitude))
+        for _ in range(args.queries)
+    ]
+
+    print_report({
+        "benchmark": "nearby batches",
+        "parameters": vars(args),
+        "full_scan": await measure(full_scan, points, args.radius_km, args.limit),
+        "geohash_index": await measure(geohash_query, points, args.radius_km, args.limit),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batches", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--radius-km", type=float, default=25.0)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,114 @@
+import argparse
+from uuid import uuid4
+
+import numpy as np
+
+from benchmarks.common import Stopwatch, print_report
+
+from app.shared_kernel import haversine_km
+from app.traceability.domain import Location, RouteDistanceCalculator, RoutePoints, TransportMode, great_circle_km
+
+DETOUR_FACTORS = {TransportMode.TRUCK: 1.3, TransportMode.TRAIN: 1.2}
+
+
+def synthetic_points(batches: int, points_per_batch: int, seed: int) -> RoutePoints:
+    rng = np.random.default_rng(seed)
+    count = batches * points_per_batch
+    modes = [None] + list(TransportMode)
+    mode_codes = rng.integers(0, len(modes), size=count)
+    mode_codes[::points_per_batch] = 0
+    return RoutePoints(
+        batch_ids=[uuid4() for _ in range(batches)],
+        batch_index=np.repeat(np.arange(batches), points_per_batch),
+        sequences=np.tile(np.arange(1, points_per_batch + 1), batches),
+        latitudes=rng.uniform(-35.0, 55.0, size=count),
+        longitudes=rng.uniform(-90.0, 120.0, size=count),
+        transport_modes=[modes[code] for code in mode_codes.tolist()],
+    )
+
+
+def per_leg_loop(points: RoutePoints) -> list:
+    distances = [None] * len(points)
+    batch_index = points.batch_index.tolist()
+    latitudes = points.latitudes.tolist()
+    longitudes = points.longitudes.tolist()
+    for index in range(1, len(points)):
+        mode = points.transport_modes[index]
+        if mode is None or batch_index[index] != batch_index[index - 1]:
+            continue
+        distances[index] = haversine_km(
+            latitudes[index - 1], longitudes[index - 1], latitudes[index], longitudes[index]
+        ) * DETOUR_FACTORS.get(mode, 1.0)
+    return distances
+
+
+def recurring_pairs(shipments: int, warehouses: int, ports: int, seed: int) -> list:
+    rng = np.random.default_rng(seed)
+    origins = [
+        Location(float(lat), float(lon), f"Entrepôt {index}", "CI")
+        for index, (lat, lon) in enumerate(zip(rng.uniform(5, 10, warehouses), rng.uniform(-8, -3, warehouses)))
+    ]
+    destinations = [
+        Location(float(lat), float(lon), f"Port {index}", "FR")
+        for index, (lat, lon) in enumerate(zip(rng.uniform(40, 55, ports), rng.uniform(-5, 10, ports)))
+    ]
+    return [
+        (origins[origin], destinations[destination])
+        for origin, destination in zip(
+            rng.integers(0, warehouses, size=shipments).tolist(), rng.integers(0, ports, size=shipments).tolist()
+        )
+    ]
+
+
+def main(args: argparse.Namespace) -> None:
+    points = synthetic_points(args.batches, args.points_per_batch, args.seed)
+    calculator = RouteDistanceCalculator(DETOUR_FACTORS)
+
+    with Stopwatch() as loop:
+        expected = per_leg_loop(points)
+    with Stopwatch() as vectorized:
+        distances = calculator.legs(points)
+
+    legs = [index for index, distance in enumerate(expected) if distance is not None]
+    max_error = max(abs(distances[index] - expected[index]) for index in legs)
+
+    pairs = recurring_pairs(args.shipments, args.warehouses, args.ports, args.seed)
+    with Stopwatch() as uncached:
+        for origin, destination in pairs:
+            haversine_km(origin.latitude, origin.longitude, destination.latitude, destination.longitude)
+    great_circle_km.cache_clear()
+    with Stopwatch() as cached:
+        for origin, destination in pairs:
+            great_circle_km(origin, destination)
+    cache_info = great_circle_km.cache_info()
+
+    print_report({
+        "benchmark": "route distances",
+        "parameters": vars(args),
+        "history_recomputation": {
+            "points": len(points),
+            "legs": len(legs),
+            "per_leg_loop_s": round(loop.elapsed, 4),
+            "vectorized_s": round(vectorized.elapsed, 4),
+            "speedup": round(loop.elapsed / vectorized.elapsed, 1),
+            "max_abs_error_km": max_error,
+        },
+        "recurring_pairs": {
+            "shipments": len(pairs),
+            "uncached_s": round(uncached.elapsed, 4),
+            "memoized_s": round(cached.elapsed, 4),
+            "cache_hits": cache_info.hits,
+            "cache_misses": cache_info.misses,
+        },
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batches", type=int, default=250000)
+    parser.add_argument("--points-per-batch", type=int, default=4)
+    parser.add_argument("--shipments", type=int, default=200000)
+    parser.add_argument("--warehouses", type=int, default=40)
+    parser.add_argument("--ports", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=42)
+    main(parser.parse_args())
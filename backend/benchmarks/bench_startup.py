@@ -0,0 +1,121 @@
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+from statistics import median
+
+import httpx
+
+from benchmarks.common import print_report, use_sqlite_database
+
+FARM = {"latitude": 5.35, "longitude": -4.01, "region": "Abidjan", "country": "CI"}
+PRODUCER_ID = "00000000-0000-0000-0000-0000000000df"
+STEADY_REQUESTS = 20
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(client: httpx.Client, process: subprocess.Popen, timeout_s: float) -> None:
+    # uvicorn n'ouvre son socket qu'après le démarrage du lifespan : la première réponse marque la fin du démarrage
+    deadline = time.perf_counter() + timeout_s
+    while time.perf_counter() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with code {process.returncode}")
+        try:
+            client.get("/", timeout=0.5)
+            return
+        except httpx.TransportError:
+            time.sleep(0.005)
+    raise TimeoutError("uvicorn did not start in time")
+
+
+def scenario(client: httpx.Client) -> list:
+    # Un appel par routeur, dans l'ordre d'un client qui enregistre un lot puis le consulte
+    state = {}
+
+    def register():
+        response = client.post("/api/traceability/batches", json={
+            "producer_id": PRODUCER_ID,
+            "quantity": 750.0,
+            "harvest_date": "2024-10-01T00:00:00",
+            "location": FARM,
+        })
+        state["batch_id"] = response.json()["id"]
+        return response
+
+    return [
+        ("register", register),
+        ("get", lambda: client.get(f"/api/traceability/batches/{state['batch_id']}")),
+        ("list", lambda: client.get("/api/traceability/batches", params={"producer_id": PRODUCER_ID})),
+        ("footprint", lambda: client.get(f"/api/carbon-footprint/batches/{state['batch_id']}")),
+        ("dashboard", lambda: client.get(f"/api/analytics/producers/{PRODUCER_ID}")),
+    ]
+
+
+def timed(send) -> float:
+    start = time.perf_counter()
+    response = send()
+    elapsed = time.perf_counter() - start
+    response.raise_for_status()
+    return elapsed * 1000
+
+
+def run_once(warmup: bool, args: argparse.Namespace) -> dict:
+    # Sans état propre au worker, pour que --workers > 1 soit accepté au démarrage
+    env = dict(os.environ, WARMUP_ENABLED="true" if warmup else "false", CACHE_BACKEND="none", IDEMPOTENCY_BACKEND="none")
+    env["DATABASE_URL"] = f"sqlite:///{use_sqlite_database('startup')}"
+    port = free_port()
+    spawned = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--workers", str(args.workers)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}") as client:
+            wait_until_ready(client, process, args.timeout)
+            ready_ms = (time.perf_counter() - spawned) * 1000
+
+            requests = scenario(client)
+            first = {name: timed(send) for name, send in requests}
+            steady = {name: median(timed(send) for _ in range(STEADY_REQUESTS)) for name, send in requests}
+    finally:
+        process.terminate()
+        process.wait()
+    return {"ready_ms": ready_ms, "first": first, "steady": steady}
+
+
+def summarize(runs: list) -> dict:
+    names = list(runs[0]["first"])
+    return {
+        "ready_ms": round(median(run["ready_ms"] for run in runs), 1),
+        "first_request_ms": {name: round(median(run["first"][name] for run in runs), 2) for name in names},
+        "first_requests_total_ms": round(median(sum(run["first"].values()) for run in runs), 2),
+        "steady_state_ms": {name: round(median(run["steady"][name] for run in runs), 2) for name in names},
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    reports = {}
+    for warmup in (False, True):
+        runs = [run_once(warmup, args) for _ in range(args.runs)]
+        reports["with_warmup" if warmup else "without_warmup"] = summarize(runs)
+
+    print_report({
+        "benchmark": f"uvicorn cold start, median of {args.runs} runs",
+        "parameters": vars(args),
+        **reports,
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=30.0, help="délai maximal de démarrage (s)")
+    main(parser.parse_args())
\ No newline at end of file
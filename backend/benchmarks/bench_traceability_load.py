@@ -0,0 +1,256 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.common import Stopwatch, latency_summary, print_report, use_sqlite_database
+
+SCENARIOS = ("register", "get", "ship")
+WAREHOUSES = [
+    {"latitude": 5.35, "longitude": -4.01, "region": "Abidjan", "country": "CI"},
+    {"latitude": 4.75, "longitude": -6.64, "region": "San-Pédro", "country": "CI"},
+    {"latitude": 6.82, "longitude": -5.28, "region": "Yamoussoukro", "country": "CI"},
+    {"latitude": 5.56, "longitude": -0.20, "region": "Accra", "country": "GH"},
+]
+PORTS = [
+    {"latitude": 52.37, "longitude": 4.90, "region": "Amsterdam", "country": "NL"},
+    {"latitude": 51.22, "longitude": 4.40, "region": "Anvers", "country": "BE"},
+    {"latitude": 43.30, "longitude": 5.37, "region": "Marseille", "country": "FR"},
+]
+SEED_CHUNK_SIZE = 1000
+
+
+def configure_database(args: argparse.Namespace) -> str:
+    # À faire avant tout import de app : les moteurs SQLAlchemy sont créés à l'import
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+        os.environ.pop("ASYNC_DATABASE_URL", None)
+    else:
+        use_sqlite_database("traceability_load")
+    os.environ["CACHE_BACKEND"] = args.cache_backend
+    return os.environ["DATABASE_URL"].split("://", 1)[0]
+
+
+def git_revision() -> str:
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True)
+        return f"{revision}-dirty" if dirty.stdout.strip() else revision
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def seed(args: argparse.Namespace, rng: random.Random) -> Dict[str, object]:
+    from app.shared_kernel import AsyncSessionLocal, id_generator
+    from app.traceability.domain import CocoaBatch, Location, Quantity, TrackingEntry, TransportMode
+    from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import PostgresCocoaBatchRepository
+
+    warehouses = [Location(**warehouse) for warehouse in WAREHOUSES]
+    harvest_date = datetime(2024, 10, 1)
+    producer_ids = [id_generator.new_id() for _ in range(args.producers)]
+
+    def batch_with_history(producer_id) -> CocoaBatch:
+        origin = rng.choice(warehouses)
+        batch = CocoaBatch.harvest(
+            id=id_generator.new_id(),
+            producer_id=producer_id,
+            quantity=Quantity(rng.uniform(100.0, 2000.0)),
+            harvest_date=harvest_date,
+            location=origin
+        )
+        # Entrées synthétiques écrites directement : le domaine n'autorise qu'une expédition par lot
+        batch._tracking_history += tuple(
+            TrackingEntry(
+                timestamp=harvest_date + timedelta(days=step),
+                action="SHIPPED",
+                location=rng.choice(warehouses),
+                transport_mode=TransportMode.TRUCK,
+                distance=rng.uniform(20.0, 600.0)
+            )
+            for step in range(1, args.history)
+        )
+        return batch
+
+    def harvested_batch() -> CocoaBatch:
+        return CocoaBatch.harvest(
+            id=id_generator.new_id(),
+            producer_id=rng.choice(producer_ids),
+            quantity=Quantity(750.0),
+            harvest_date=harvest_date,
+            location=rng.choice(warehouses)
+        )
+
+    readable = [batch_with_history(producer_id) for producer_id in producer_ids for _ in range(args.batches)]
+    shippable = [harvested_batch() for _ in range(args.requests + args.warmup)] if "ship" in args.scenarios else []
+
+    with Stopwatch() as watch:
+        batches = readable + shippable
+        for start in range(0, len(batches), SEED_CHUNK_SIZE):
+            async with AsyncSessionLocal() as db:
+                await PostgresCocoaBatchRepository(db).insert_all(batches[start:start + SEED_CHUNK_SIZE])
+
+    return {
+        "producer_ids": producer_ids,
+        "readable_ids": [batch.id for batch in readable],
+        "shippable_ids": [batch.id for batch in shippable],
+        "summary": {
+            "producers": args.producers,
+            "batches": len(batches),
+            "tracking_entries": sum(len(batch.tracking_history) for batch in batches),
+            "seed_s": round(watch.elapsed, 3),
+        },
+    }
+
+
+def scenario_requests(name: str, dataset: Dict[str, object], count: int, rng: random.Random) -> List[Callable]:
+    if name == "register":
+        return [
+            lambda client, producer_id=rng.choice(dataset["producer_ids"]), location=rng.choice(WAREHOUSES):
+                client.post("/api/traceability/batches", json={
+                    "producer_id": str(producer_id),
+                    "quantity": 750.0,
+                    "harvest_date": "2024-10-01T00:00:00",
+                    "location": location,
+                })
+            for _ in range(count)
+        ]
+    if name == "get":
+        return [
+            lambda client, batch_id=rng.choice(dataset["readable_ids"]):
+                client.get(f"/api/traceability/batches/{batch_id}")
+            for _ in range(count)
+        ]
+    shippable = dataset["shippable_ids"]
+    return [
+        lambda client, batch_id=shippable.pop(), destination=rng.choice(PORTS):
+            client.post(f"/api/traceability/batches/{batch_id}/ship", json={
+                "destination": destination,
+                "transport_mode": "SHIP",
+            })
+        for _ in range(count)
+    ]
+
+
+async def drive(client, requests: List[Callable], concurrency: int) -> Dict[str, object]:
+    samples = []
+    statuses = Counter()
+    queue = list(reversed(requests))
+
+    async def worker():
+        while queue:
+            send = queue.pop()
+            start = time.perf_counter()
+            response = await send(client)
+            samples.append(time.perf_counter() - start)
+            statuses[response.status_code] += 1
+
+    with Stopwatch() as watch:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    errors = sum(total for status, total in statuses.items() if status >= 400)
+    return {
+        **latency_summary(samples, watch.elapsed),
+        "errors": errors,
+        "status_codes": {str(status): total for status, total in sorted(statuses.items())},
+    }
+
+
+def compare(report: Dict[str, object], baseline: Dict[str, object], max_regression_pct: Optional[float]) -> Dict[str, object]:
+    # Écarts relatifs en % : positif = plus lent (latences) ou moins de débit
+    comparison = {"baseline_revision": baseline.get("environment", {}).get("revision"), "scenarios": {}, "regressions": []}
+    for name, current in report["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            continue
+        deltas = {
+            metric: round((current[metric] - previous[metric]) / previous[metric] * 100, 1)
+            for metric in ("p50_ms", "p95_ms", "p99_ms")
+            if previous[metric]
+        }
+        if previous["throughput_rps"]:
+            deltas["throughput_rps"] = round(
+                (previous["throughput_rps"] - current["throughput_rps"]) / previous["throughput_rps"] * 100, 1
+            )
+        comparison["scenarios"][name] = deltas
+        if max_regression_pct is not None:
+            for metric in ("p95_ms", "throughput_rps"):
+                if deltas.get(metric, 0.0) > max_regression_pct:
+                    comparison["regressions"].append(f"{name}.{metric}: +{deltas[metric]}%")
+    return comparison
+
+
+async def main(args: argparse.Namespace) -> int:
+    database = configure_database(args)
+
+    from httpx import ASGITransport, AsyncClient
+
+    from app.main import app
+    from app.shared_kernel import drop_db, init_db
+
+    drop_db()
+    init_db()
+    rng = random.Random(args.seed)
+    dataset = await seed(args, rng)
+
+    scenarios = {}
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        for name in args.scenarios:
+            if args.warmup:
+                await drive(client, scenario_requests(name, dataset, args.warmup, rng), args.concurrency)
+            scenarios[name] = await drive(
+                client, scenario_requests(name, dataset, args.requests, rng), args.concurrency
+            )
+
+    report = {
+        "benchmark": "traceability API load test",
+        "environment": {
+            "revision": git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "database": database,
+        },
+        "parameters": vars(args),
+        "dataset": dataset["summary"],
+        "scenarios": scenarios,
+    }
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            report["comparison"] = compare(report, json.load(baseline_file), args.max_regression_pct)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2, default=str)
+    print_report(report)
+
+    return 1 if report.get("comparison", {}).get("regressions") else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--producers", type=int, default=20)
+    parser.add_argument("--batches", type=int, default=50, help="lots par producteur")
+    parser.add_argument("--history", type=int, default=10, help="entrées de traçabilité par lot")
+    parser.add_argument("--requests", type=int, default=1000, help="requêtes mesurées par scénario")
+    parser.add_argument("--warmup", type=int, default=100, help="requêtes non mesurées par scénario")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--cache-backend", choices=("memory", "none"), default="none")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--database-url", default=None,
+        help="URL d'une base jetable (tables supprimées puis recréées), ex: postgresql://... ; SQLite temporaire par défaut"
+    )
+    parser.add_argument("--output", default=None, help="écrit le rapport JSON dans ce fichier")
+    parser.add_argument("--baseline", default=None, help="rapport JSON d'un commit précédent à comparer")
+    parser.add_argument("--max-regression-pct", type=float, default=None, help="code de sortie 1 si p95 ou débit régresse au-delà")
+    sys.exit(asyncio.run(main(parser.parse_args())))
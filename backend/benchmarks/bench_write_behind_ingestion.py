@@ -0,0 +1,106 @@
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime
+from uuid import UUID
+
+from benchmarks.common import Stopwatch, latency_summary, print_report, use_sqlite_database
+
+use_sqlite_database("write_behind_ingestion")
+os.environ["CACHE_BACKEND"] = "none"
+
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.shared_kernel import AsyncSessionLocal, id_generator, init_db
+from app.traceability.domain import CocoaBatch, Location, Quantity
+from app.traceability.infrastructure.api.TraceabilityRouter import tracking_events
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import PostgresCocoaBatchRepository
+
+PRODUCER_ID = UUID("00000000-0000-0000-0000-0000000000ce")
+FARM = Location(latitude=5.35, longitude=-4.01, region="Abidjan", country="CI")
+HARVEST_DATE = datetime(2024, 10, 1)
+PORT = {"latitude": 43.30, "longitude": 5.37, "region": "Marseille", "country": "FR"}
+
+
+async def seed(count: int) -> list:
+    batches = [
+        CocoaBatch.harvest(
+            id=id_generator.new_id(),
+            producer_id=PRODUCER_ID,
+            quantity=Quantity(750.0),
+            harvest_date=HARVEST_DATE,
+            location=FARM
+        )
+        for _ in range(count)
+    ]
+    async with AsyncSessionLocal() as db:
+        await PostgresCocoaBatchRepository(db).insert_all(batches)
+    return [str(batch.id) for batch in batches]
+
+
+async def burst(client, requests: list, concurrency: int) -> dict:
+    samples = []
+    statuses = {}
+    pending = list(reversed(requests))
+
+    async def worker():
+        while pending:
+            path, body = pending.pop()
+            start = time.perf_counter()
+            response = await client.post(path, json=body)
+            samples.append(time.perf_counter() - start)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    with Stopwatch() as watch:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    errors = sum(total for status, total in statuses.items() if status >= 400)
+    return {**latency_summary(samples, watch.elapsed), "errors": errors, "status_codes": statuses}
+
+
+async def main(args: argparse.Namespace) -> None:
+    init_db()
+    # ASGITransport n'exécute pas le lifespan : le worker de la file est démarré à la main
+    await tracking_events.start()
+
+    # Sous SQLite, les écritures concurrentes échouent sur « database is locked » : comptées en 500 plutôt que levées
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        ids = await seed(args.events)
+        synchronous = await burst(client, [
+            (f"/api/traceability/batches/{batch_id}/ship", {"destination": PORT, "transport_mode": "SHIP"})
+            for batch_id in ids
+        ], args.concurrency)
+
+        ids = await seed(args.events)
+        before = tracking_events.stats.flushed
+        write_behind = await burst(client, [
+            ("/api/traceability/batches:ingestEvents", {"events": [
+                {"type": "SHIP", "batch_id": batch_id, "destination": PORT, "transport_mode": "SHIP"}
+            ]})
+            for batch_id in ids
+        ], args.concurrency)
+        # Temps de vidange : jusqu'à ce que tous les événements acceptés soient écrits
+        with Stopwatch() as drain:
+            while tracking_events.stats.flushed + tracking_events.stats.failed - before < args.events:
+                await asyncio.sleep(0.001)
+
+    await tracking_events.stop()
+    print_report({
+        "benchmark": f"{args.events} shipment events, concurrency {args.concurrency}",
+        "synchronous_ship": synchronous,
+        "write_behind_ingest": {
+            **write_behind,
+            "drain_after_last_response_s": round(drain.elapsed, 4),
+            "end_to_end_events_per_s": round(args.events / (write_behind["elapsed_s"] + drain.elapsed), 1),
+            "queue": tracking_events.describe(),
+        },
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,41 @@
+import json
+import os
+import tempfile
+import time
+from statistics import quantiles
+from typing import Dict, List
+
+
+def use_sqlite_database(name: str) -> str:
+    path = os.path.join(tempfile.gettempdir(), f"sustaain_{name}.db")
+    if os.path.exists(path):
+        os.remove(path)
+    os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+    return path
+
+
+def latency_summary(samples: List[float], elapsed: float) -> Dict[str, float]:
+    ordered = sorted(samples)
+    percentiles = quantiles(ordered, n=100) if len(ordered) > 1 else ordered * 99
+    return {
+        "requests": len(samples),
+        "elapsed_s": round(elapsed, 4),
+        "throughput_rps": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentiles[49] * 1000, 3),
+        "p95_ms": round(percentiles[94] * 1000, 3),
+        "p99_ms": round(percentiles[98] * 1000, 3),
+    }
+
+
+def print_report(report: Dict) -> None:
+    print(json.dumps(report, indent=2, default=str))
+
+
+class Stopwatch:
+    def __enter__(self) -> "Stopwatch":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.elapsed = time.perf_counter() - self.start
@@ -0,0 +1,73 @@
+import time
+from uuid import uuid4
+
+import pytest
+
+from app.analytics.infrastructure.database.PostgresDashboardRepository import PostgresDashboardRepository
+from app.shared_kernel import AsyncSessionLocal
+from app.traceability.infrastructure.api.TraceabilityRouter import tracking_events
+
+
+def dashboards(client, producer_id: str, country: str) -> tuple:
+    return (
+        client.get(f"/api/analytics/producers/{producer_id}").json(),
+        client.get(f"/api/analytics/countries/{country}").json(),
+    )
+
+
+def rebuild(client) -> None:
+    async def run():
+        async with AsyncSessionLocal() as db:
+            await PostgresDashboardRepository(db).rebuild()
+    # Sur la boucle de l'application : les connexions aiosqlite du pool y sont attachées
+    client.portal.call(run)
+
+
+def ingest(client, events: list) -> None:
+    flushed = tracking_events.stats.flushed
+    response = client.post("/api/traceability/batches:ingestEvents", json={"events": events})
+    assert response.status_code == 202
+    
+    deadline = time.monotonic() + 5
+    while tracking_events.stats.flushed < flushed + len(events):
+        assert time.monotonic() < deadline, "ingestion queue was not flushed"
+        time.sleep(0.01)
+
+
+def test_incremental_rollups_match_rebuild(client, batch_payload, register_batch, ship_batch, port):
+    producer_id = str(uuid4())
+    created = client.post("/api/traceability/batches:batchCreate", json={
+        "items": [batch_payload(producer_id=producer_id), batch_payload(producer_id=producer_id, quantity=250.0)]
+    }).json()
+    bulk_ids = [result["id"] for result in created["results"]]
+    single_ids = [register_batch(producer_id=producer_id, harvest_date="2024-11-15T00:00:00") for _ in range(3)]
+    
+    ship_batch(single_ids[0])
+    client.post("/api/traceability/batches:batchShip", json={
+        "ids": bulk_ids, "destination": port, "transport_mode": "SHIP"
+    })
+    client.post(f"/api/traceability/batches/{single_ids[0]}/process", json={"processing_type": "FERMENTATION"})
+    client.post("/api/traceability/batches:batchProcess", json={"ids": [bulk_ids[0]], "processing_type": "DRYING"})
+    client.post(f"/api/traceability/batches/{single_ids[0]}/deliver")
+    client.post("/api/traceability/batches:batchDeliver", json={"ids": [bulk_ids[0]]})
+    ingest(client, [
+        {"type": "SHIP", "batch_id": single_ids[1], "destination": port, "transport_mode": "TRUCK"},
+        {"type": "PROCESS", "batch_id": bulk_ids[1], "processing_type": "FERMENTATION"},
+        {"type": "DELIVER", "batch_id": bulk_ids[1]},
+    ])
+    
+    incremental = dashboards(client, producer_id, "CI")
+    rebuild(client)
+    rebuilt = dashboards(client, producer_id, "CI")
+    
+    # Les durées de transit sont sommées dans un autre ordre : seule la moyenne diffère, à l'arrondi près
+    for incremental_dashboard, rebuilt_dashboard in zip(incremental, rebuilt):
+        assert incremental_dashboard.pop("average_transit_hours") == pytest.approx(
+            rebuilt_dashboard.pop("average_transit_hours")
+        )
+    assert incremental == rebuilt
+    producer = incremental[0]
+    assert producer["timed_deliveries"] == 3
+    assert {status: totals["batch_count"] for status, totals in producer["by_status"].items()} == {
+        "HARVESTED": 1, "IN_TRANSIT": 1, "PROCESSED": 0, "DELIVERED": 3
+    }
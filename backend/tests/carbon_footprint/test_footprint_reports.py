@@ -0,0 +1,29 @@
+from uuid import uuid4
+
+
+def test_batch_report_returns_404_for_unknown_batch(client):
+    response = client.get(f"/api/carbon-footprint/reports/batches/{uuid4()}")
+    
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Batch not found"
+
+
+def test_batch_report_is_zero_for_batch_never_shipped(client, register_batch):
+    batch_id = register_batch()
+    
+    response = client.get(f"/api/carbon-footprint/reports/batches/{batch_id}")
+    
+    assert response.status_code == 200
+    assert response.json()["hops"] == 0
+    assert response.json()["emissions_kg_co2e"] == 0.0
+
+
+def test_batch_report_accumulates_shipment(client, register_batch, ship_batch):
+    batch_id = register_batch()
+    ship_batch(batch_id)
+    
+    response = client.get(f"/api/carbon-footprint/reports/batches/{batch_id}")
+    
+    assert response.status_code == 200
+    assert response.json()["hops"] == 1
+    assert response.json()["emissions_kg_co2e"] > 0
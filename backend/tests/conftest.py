@@ -0,0 +1,62 @@
+import os
+import tempfile
+from uuid import uuid4
+
+import pytest
+
+# À faire avant tout import de app : les moteurs SQLAlchemy sont créés à l'import
+DATABASE_PATH = os.path.join(tempfile.gettempdir(), "sustaain_tests.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DATABASE_PATH}"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["WARMUP_ENABLED"] = "false"
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.shared_kernel import drop_db
+
+
+@pytest.fixture
+def client():
+    drop_db()
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def farm() -> dict:
+    return {"latitude": 5.35, "longitude": -4.01, "region": "Abidjan", "country": "CI"}
+
+
+@pytest.fixture
+def port() -> dict:
+    return {"latitude": 43.30, "longitude": 5.37, "region": "Marseille", "country": "FR"}
+
+
+@pytest.fixture
+def batch_payload(farm):
+    def build(**overrides) -> dict:
+        return {
+            "producer_id": str(uuid4()),
+            "quantity": 1000.0,
+            "harvest_date": "2024-10-01T00:00:00",
+            "location": farm,
+            **overrides,
+        }
+    return build
+
+
+@pytest.fixture
+def register_batch(client, batch_payload):
+    def register(**overrides) -> str:
+        response = client.post("/api/traceability/batches", json=batch_payload(**overrides))
+        assert response.status_code == 201
+        return response.json()["id"]
+    return register
+
+
+@pytest.fixture
+def ship_batch(client, port):
+    def ship(batch_id):
+        return client.post(f"/api/traceability/batches/{batch_id}/ship", json={"destination": port, "transport_mode": "SHIP"})
+    return ship
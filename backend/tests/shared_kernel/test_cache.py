@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from app.shared_kernel.cache import ExternalCache, InMemoryKeyValueStore, LRUCache
+
+
+def lru_cache():
+    return LRUCache()
+
+
+def external_cache():
+    return ExternalCache(InMemoryKeyValueStore())
+
+
+BACKENDS = [lru_cache, external_cache]
+
+
+@pytest.mark.parametrize("make_cache", BACKENDS)
+def test_fill_without_invalidation_is_stored(make_cache):
+    cache = make_cache()
+    
+    async def scenario():
+        generation = await cache.generation("batch:1")
+        assert await cache.fill("batch:1", b"fresh", generation)
+        return await cache.get("batch:1")
+    
+    assert asyncio.run(scenario()) == b"fresh"
+    assert cache.stats.stale_fills == 0
+
+
+@pytest.mark.parametrize("make_cache", BACKENDS)
+def test_invalidation_between_read_and_fill_drops_the_fill(make_cache):
+    cache = make_cache()
+    
+    async def scenario():
+        # Lecture BDD faite avec cette génération, puis une écriture invalide la clé
+        generation = await cache.generation("batch:1")
+        await cache.delete("batch:1")
+        filled = await cache.fill("batch:1", b"stale", generation)
+        return filled, await cache.get("batch:1")
+    
+    filled, cached = asyncio.run(scenario())
+    
+    assert filled is False
+    assert cached is None
+    assert cache.stats.stale_fills == 1
+
+
+@pytest.mark.parametrize("make_cache", BACKENDS)
+def test_invalidation_during_fill_removes_the_stale_value(make_cache):
+    cache = make_cache()
+    original_set = cache.set
+    
+    async def set_racing_invalidation(key, value):
+        # L'invalidation passe pendant l'écriture du remplissage
+        await cache.delete(key)
+        await original_set(key, value)
+    
+    cache.set = set_racing_invalidation
+    
+    async def scenario():
+        generation = await cache.generation("batch:1")
+        filled = await cache.fill("batch:1", b"stale", generation)
+        return filled, await cache.get("batch:1")
+    
+    filled, cached = asyncio.run(scenario())
+    
+    assert filled is False
+    assert cached is None
+    assert cache.stats.stale_fills == 1
@@ -0,0 +1,26 @@
+from uuid import uuid4
+
+
+def test_mutating_route_replays_response_for_same_key(client, batch_payload):
+    payload = batch_payload()
+    headers = {"Idempotency-Key": str(uuid4())}
+    
+    first = client.post("/api/traceability/batches", json=payload, headers=headers)
+    second = client.post("/api/traceability/batches", json=payload, headers=headers)
+    
+    assert first.status_code == second.status_code == 201
+    assert second.headers["idempotent-replayed"] == "true"
+    assert second.json()["id"] == first.json()["id"]
+
+
+def test_read_only_post_ignores_idempotency_key(client, register_batch, ship_batch):
+    batch_id = register_batch()
+    headers = {"Idempotency-Key": str(uuid4())}
+    
+    before = client.post("/api/traceability/batches:batchGet", json={"ids": [batch_id]}, headers=headers)
+    ship_batch(batch_id)
+    after = client.post("/api/traceability/batches:batchGet", json={"ids": [batch_id]}, headers=headers)
+    
+    assert "idempotent-replayed" not in after.headers
+    assert before.json()["batches"][0]["status"] == "HARVESTED"
+    assert after.json()["batches"][0]["status"] == "IN_TRANSIT"
@@ -0,0 +1,72 @@
+import asyncio
+
+from app.shared_kernel.write_behind import WriteBehindQueue
+
+
+def test_full_queue_rejects_after_enqueue_timeout():
+    async def scenario():
+        release = asyncio.Event()
+        
+        async def blocked_flush(batch):
+            await release.wait()
+        
+        queue = WriteBehindQueue(blocked_flush, max_size=2, batch_size=2, flush_interval_s=0.01, enqueue_timeout_s=0.05)
+        await queue.start()
+        
+        # Le worker prend ce lot puis reste bloqué sur le flush : la file se remplit derrière lui
+        assert await queue.put_many([1, 2])
+        while queue.depth:
+            await asyncio.sleep(0.001)
+        assert await queue.put_many([3, 4])
+        
+        accepted = await queue.put_many([5])
+        
+        release.set()
+        await queue.stop()
+        return queue, accepted
+    
+    queue, accepted = asyncio.run(scenario())
+    
+    assert accepted is False
+    assert queue.stats.rejected == 1
+    assert queue.stats.enqueued == 4
+    assert queue.stats.flushed == 4
+
+
+def test_stop_flushes_pending_items():
+    flushed = []
+    
+    async def scenario():
+        async def flush(batch):
+            flushed.extend(batch)
+        
+        queue = WriteBehindQueue(flush, batch_size=100, flush_interval_s=60)
+        await queue.start()
+        assert await queue.put_many(list(range(10)))
+        assert queue.depth == 10
+        
+        await queue.stop()
+        return queue
+    
+    queue = asyncio.run(scenario())
+    
+    assert flushed == list(range(10))
+    assert queue.depth == 0
+    assert queue.stats.flushed == 10
+    assert not queue.running
+
+
+def test_stopped_queue_rejects_items():
+    async def scenario():
+        async def flush(batch):
+            pass
+        
+        queue = WriteBehindQueue(flush)
+        await queue.start()
+        await queue.stop()
+        return queue, await queue.put_many([1, 2])
+    
+    queue, accepted = asyncio.run(scenario())
+    
+    assert accepted is False
+    assert queue.stats.rejected == 2
@@ -0,0 +1,47 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.shared_kernel import config, drop_db
+from app.traceability.infrastructure.api.TraceabilityRouter import tracking_events
+
+
+def test_startup_refuses_several_workers_with_per_worker_state(monkeypatch):
+    monkeypatch.setattr(config, "web_concurrency", 2)
+    monkeypatch.setattr(config, "cache_backend", "memory")
+    
+    with pytest.raises(RuntimeError, match="CACHE_BACKEND=memory"):
+        with TestClient(app):
+            pass
+
+
+def test_startup_accepts_several_workers_with_shared_state(monkeypatch):
+    monkeypatch.setattr(config, "web_concurrency", 2)
+    monkeypatch.setattr(config, "cache_backend", "none")
+    monkeypatch.setattr(config, "idempotency_backend", "database")
+    
+    with TestClient(app) as client:
+        assert client.get("/health").status_code == 200
+
+
+def test_shutdown_flushes_queued_tracking_events(monkeypatch, batch_payload, port):
+    # Intervalle très long : seul l'arrêt de l'application peut vider la file
+    monkeypatch.setattr(tracking_events, "_flush_interval_s", 60)
+    drop_db()
+    
+    with TestClient(app) as client:
+        batch_id = client.post("/api/traceability/batches", json=batch_payload()).json()["id"]
+        flushed = tracking_events.stats.flushed
+        response = client.post("/api/traceability/batches:ingestEvents", json={"events": [
+            {"type": "SHIP", "batch_id": batch_id, "destination": port, "transport_mode": "SHIP"},
+        ]})
+        assert response.status_code == 202
+        assert tracking_events.stats.flushed == flushed
+    
+    assert tracking_events.depth == 0
+    assert tracking_events.stats.flushed == flushed + 1
+    
+    with TestClient(app) as client:
+        batch = client.get(f"/api/traceability/batches/{batch_id}").json()
+    assert batch["status"] == "IN_TRANSIT"
+    assert batch["current_location"]["region"] == "Marseille"
@@ -0,0 +1,53 @@
+from uuid import uuid4
+
+import pytest
+
+
+@pytest.fixture
+def transition(client, ship_batch):
+    return {
+        "ship": ship_batch,
+        "process": lambda batch_id: client.post(
+            f"/api/traceability/batches/{batch_id}/process", json={"processing_type": "FERMENTATION"}
+        ),
+        "deliver": lambda batch_id: client.post(f"/api/traceability/batches/{batch_id}/deliver"),
+    }
+
+
+@pytest.mark.parametrize("name", ["ship", "process", "deliver"])
+def test_transition_returns_404_for_unknown_batch(transition, name):
+    assert transition[name](uuid4()).status_code == 404
+
+
+@pytest.mark.parametrize("name", ["process", "deliver"])
+def test_transition_returns_409_when_status_forbids_it(register_batch, transition, name):
+    batch_id = register_batch()
+    
+    response = transition[name](batch_id)
+    
+    assert response.status_code == 409
+
+
+def test_ship_returns_409_for_batch_already_shipped(register_batch, ship_batch):
+    batch_id = register_batch()
+    ship_batch(batch_id)
+    
+    response = ship_batch(batch_id)
+    
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Only harvested batches can be shipped"
+
+
+def test_process_and_deliver_return_the_applied_transition(register_batch, ship_batch, transition):
+    batch_id = register_batch()
+    ship_batch(batch_id)
+    
+    processed = transition["process"](batch_id)
+    delivered = transition["deliver"](batch_id)
+    
+    assert processed.status_code == 200
+    assert processed.json()["status"] == "PROCESSED"
+    assert processed.json()["action"] == "PROCESSED_FERMENTATION"
+    assert delivered.status_code == 200
+    assert delivered.json()["status"] == "DELIVERED"
+    assert delivered.json()["action"] == "DELIVERED"
@@ -0,0 +1,30 @@
+import ast
+from pathlib import Path
+
+import app.traceability
+
+LAYERS = ("domain", "application", "infrastructure")
+PACKAGE = Path(app.traceability.__file__).parent
+
+
+def imported_modules(path: Path) -> set:
+    modules = set()
+    for node in ast.walk(ast.parse(path.read_text())):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            modules.add(node.module)
+        elif isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+    return modules
+
+
+def test_traceability_does_not_import_other_contexts():
+    # Les projections des autres contextes s'abonnent via BatchWriteListener, câblé dans app.main
+    foreign = {
+        str(path.relative_to(PACKAGE)): module
+        for layer in LAYERS
+        for path in (PACKAGE / layer).rglob("*.py")
+        for module in imported_modules(path)
+        if module.startswith(("app.carbon_footprint", "app.analytics"))
+    }
+    
+    assert foreign == {}
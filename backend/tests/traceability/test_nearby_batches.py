@@ -0,0 +1,32 @@
+from app.shared_kernel import AsyncSessionLocal
+from app.shared_kernel.geo import BoundingBox
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import PostgresCocoaBatchRepository
+
+
+def test_find_within_keeps_nearest_batches_across_chunks(client, farm, register_batch):
+    # Écarts en latitude croissants depuis la ferme : ~1, 2, 3, 4, 5 km puis un lot hors rayon
+    offsets = [0.045, 0.009, 0.036, 0.018, 0.027, 0.5]
+    ids = {
+        register_batch(location={**farm, "latitude": farm["latitude"] + offset}): offset
+        for offset in offsets
+    }
+    
+    async def run():
+        async with AsyncSessionLocal() as db:
+            return await PostgresCocoaBatchRepository(db).find_within(
+                BoundingBox.around(farm["latitude"], farm["longitude"], 10),
+                near=(farm["latitude"], farm["longitude"]),
+                radius_km=10,
+                limit=3,
+                chunk_size=2
+            )
+    results = client.portal.call(run)
+    
+    assert [ids[str(batch.id)] for batch, _ in results] == [0.009, 0.018, 0.027]
+    distances = [distance for _, distance in results]
+    assert distances == sorted(distances)
+    
+    nearby = client.get("/api/traceability/batches:nearby", params={
+        "latitude": farm["latitude"], "longitude": farm["longitude"], "radius_km": 10, "limit": 10
+    }).json()
+    assert len(nearby) == 5
@@ -0,0 +1,61 @@
+from uuid import UUID
+
+import pytest
+
+from app.shared_kernel import AsyncSessionLocal, ConcurrencyConflictError
+from app.traceability.domain import BatchProjection, Location, TransportMode
+from app.traceability.infrastructure.database.PostgresCocoaBatchRespository import PostgresCocoaBatchRepository
+
+WAREHOUSE = Location(latitude=48.85, longitude=2.35, region="Paris", country="FR")
+
+
+def load(client, batch_id: str):
+    async def run():
+        async with AsyncSessionLocal() as db:
+            return await PostgresCocoaBatchRepository(db).find_by_id(UUID(batch_id), projection=BatchProjection.SUMMARY)
+    return client.portal.call(run)
+
+
+def save(client, batch) -> None:
+    async def run():
+        async with AsyncSessionLocal() as db:
+            await PostgresCocoaBatchRepository(db).save(batch)
+    client.portal.call(run)
+
+
+def test_second_save_of_a_stale_copy_conflicts_and_writes_nothing(client, register_batch):
+    batch_id = register_batch()
+    first, second = load(client, batch_id), load(client, batch_id)
+    first.ship(WAREHOUSE, TransportMode.TRUCK, 100.0)
+    second.ship(WAREHOUSE, TransportMode.SHIP, 900.0)
+    
+    save(client, first)
+    with pytest.raises(ConcurrencyConflictError) as conflict:
+        save(client, second)
+    
+    assert conflict.value.code == "BATCH_VERSION_CONFLICT"
+    assert load(client, batch_id).version == 2
+    history = client.get(f"/api/traceability/batches/{batch_id}").json()["tracking_history"]
+    assert [(entry["action"], entry["transport_mode"]) for entry in history] == [("HARVESTED", None), ("SHIPPED", "TRUCK")]
+
+
+def test_ship_returns_409_when_batch_changed_since_it_was_read(client, monkeypatch, register_batch, ship_batch, port):
+    batch_id = register_batch()
+    stale = load(client, batch_id)
+    ship_batch(batch_id)
+    
+    async def find_stale(self, batch_id, projection=BatchProjection.FULL):
+        return stale
+    monkeypatch.setattr(PostgresCocoaBatchRepository, "find_by_id", find_stale)
+    response = client.post(
+        f"/api/traceability/batches/{batch_id}/ship",
+        json={"destination": {**port, "region": "Le Havre"}, "transport_mode": "SHIP"}
+    )
+    monkeypatch.undo()
+    
+    assert response.status_code == 409
+    assert response.headers["retry-after"] == "0"
+    batch = client.get(f"/api/traceability/batches/{batch_id}").json()
+    assert batch["current_location"]["region"] == "Marseille"
+    assert [entry["action"] for entry in batch["tracking_history"]] == ["HARVESTED", "SHIPPED"]
+    assert client.get(f"/api/carbon-footprint/reports/batches/{batch_id}").json()["hops"] == 1
@@ -0,0 +1,25 @@
+from app.traceability.infrastructure.api.TraceabilityRouter import RegisterBatchRequest
+
+
+def test_register_accepts_utc_suffix(client, batch_payload):
+    response = client.post("/api/traceability/batches", json=batch_payload(harvest_date="2024-01-01T00:00:00Z"))
+    
+    assert response.status_code == 201
+    assert response.json()["harvest_date"] == "2024-01-01T00:00:00"
+
+
+def test_register_stores_offset_dates_as_naive_utc(client, batch_payload):
+    batch_id = client.post(
+        "/api/traceability/batches", json=batch_payload(harvest_date="2024-01-01T02:00:00+02:00")
+    ).json()["id"]
+    
+    response = client.get(f"/api/traceability/batches/{batch_id}")
+    
+    assert response.json()["harvest_date"] == "2024-01-01T00:00:00"
+
+
+def test_bulk_register_items_are_naive_utc(batch_payload):
+    # Les lignes du lot groupé passent par le même modèle : la date transmise au pilote n'a plus de fuseau
+    request = RegisterBatchRequest.model_validate(batch_payload(harvest_date="2024-01-01T00:00:00Z"))
+    
+    assert request.harvest_date.tzinfo is None